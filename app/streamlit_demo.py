@@ -2,8 +2,14 @@
 
 from __future__ import annotations
 
+import hashlib
+from typing import TYPE_CHECKING
+
 import streamlit as st
 
+if TYPE_CHECKING:
+    from gibsgraph import Answer, Graph
+
 st.set_page_config(
     page_title="GibsGraph",
     page_icon="🕸️",
@@ -12,6 +18,24 @@ st.set_page_config(
 )
 
 
+@st.cache_resource(show_spinner=False)
+def _get_graph(uri: str, username: str, password: str | None, read_only: bool = True) -> Graph:
+    """Build one Graph (and its Neo4j driver) per connection and reuse it across reruns."""
+    from gibsgraph import Graph
+
+    return Graph(uri, username=username, password=password, read_only=read_only)
+
+
+@st.cache_data(ttl=3600, show_spinner=False)
+def _cached_ask(uri: str, username: str, pw_hash: str, query: str, _graph: Graph) -> Answer:
+    """Answer *query*, reusing results for repeat questions against the same graph.
+
+    ``_graph`` is excluded from the cache key (leading underscore); the
+    password enters the key only as a SHA-256 digest.
+    """
+    return _graph.ask(query)
+
+
 def main() -> None:
     st.title("🕸️ GibsGraph")
     st.caption("GraphRAG + LangGraph agent for Neo4j knowledge graph reasoning")
@@ -22,6 +46,10 @@ def main() -> None:
         neo4j_uri = st.text_input("Neo4j URI", value="bolt://localhost:7687")
         neo4j_user = st.text_input("Username", value="neo4j")
         neo4j_pass = st.text_input("Password", type="password")
+        use_cache = st.checkbox("Use cached answers", value=True)
+        if st.button("Reset connection"):
+            _get_graph.clear()
+            _cached_ask.clear()
         st.divider()
         st.caption("Built by [gibbrdev](https://gibs.dev)")
 
@@ -42,9 +70,12 @@ def main() -> None:
         if run and query:
             with st.spinner("Reasoning over knowledge graph..."):
                 try:
-                    from gibsgraph import Graph
-                    g = Graph(neo4j_uri, password=neo4j_pass or None)
-                    result = g.ask(query)
+                    g = _get_graph(neo4j_uri, neo4j_user, neo4j_pass or None)
+                    if use_cache:
+                        pw_hash = hashlib.sha256(neo4j_pass.encode()).hexdigest()
+                        result = _cached_ask(neo4j_uri, neo4j_user, pw_hash, query, g)
+                    else:
+                        result = g.ask(query)
 
                     st.success("Answer")
                     st.write(result.answer)
@@ -79,15 +110,16 @@ def main() -> None:
         if st.button("Ingest", type="primary"):
             content = None
             if uploaded:
-                content = uploaded.read().decode("utf-8")
+                content = uploaded.getvalue().decode("utf-8")
             elif text_input:
                 content = text_input
 
             if content:
                 with st.spinner("Building knowledge graph..."):
                     try:
-                        from gibsgraph import Graph
-                        g = Graph(neo4j_uri, password=neo4j_pass or None, read_only=False)
+                        g = _get_graph(
+                            neo4j_uri, neo4j_user, neo4j_pass or None, read_only=False
+                        )
                         result = g.ingest(content, source=uploaded.name if uploaded else "manual")
                         st.success(f"✓ {result}")
                     except Exception as exc:
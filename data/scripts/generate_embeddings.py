@@ -3,29 +3,129 @@
 Uses sentence-transformers (all-MiniLM-L6-v2) to create embeddings
 for all parsed Neo4j knowledge entries. Produces:
 
-  - data/processed/embeddings.npz       (numpy arrays)
+  - data/processed/embeddings.npz       (numpy arrays, float16)
   - data/processed/embeddings_meta.jsonl (text + metadata per vector)
+  - data/processed/embeddings_cache.npz (text hash -> vector, reused on re-runs)
 
 This is the first open Neo4j expert embedding dataset.
 """
 
 from __future__ import annotations
 
+import hashlib
 import json
+import os
 from pathlib import Path
 
 import numpy as np
+import torch
 from sentence_transformers import SentenceTransformer
 
+try:
+    import orjson
+except ImportError:  # orjson is optional; fall back to stdlib json
+    orjson = None
+
+try:
+    import xxhash
+except ImportError:  # xxhash is optional; fall back to hashlib
+    xxhash = None
+
 PROCESSED_DIR = Path(__file__).parent.parent / "processed"
 MODEL_NAME = "all-MiniLM-L6-v2"  # 384-dim, fast, good quality
+CPU_BATCH_SIZE = 64
+ACCELERATOR_BATCH_SIZE = 256  # closer to saturating a GPU for a model this small
+# CPU encoding uses the int8 ONNX export shipped with the model (VNNI dot products).
+# Set EMBED_BACKEND=torch to force the FP32 PyTorch path.
+EMBED_BACKEND = os.environ.get("EMBED_BACKEND", "onnx")
+ONNX_INT8_FILE = "onnx/model_qint8_avx512_vnni.onnx"
+EMBED_CACHE = PROCESSED_DIR / "embeddings_cache.npz"
+NORMALIZE_EMBEDDINGS = True  # unit vectors, so the cosine index reduces to a dot product
 
 
 def load_jsonl(filepath: Path) -> list[dict]:
     if not filepath.exists():
         return []
-    with open(filepath, encoding="utf-8") as f:
-        return [json.loads(line) for line in f if line.strip()]
+    loads = orjson.loads if orjson is not None else json.loads
+    # Expert JSONL files are small: one read, then split in C
+    buf = filepath.read_bytes()
+    return [loads(line) for line in buf.splitlines() if line.strip()]
+
+
+def digest(s: str) -> int:
+    """Stable 64-bit key for *s* — used for dedupe and as the embedding cache key."""
+    data = s.encode("utf-8")
+    if xxhash is not None:
+        return xxhash.xxh64_intdigest(data)
+    return int.from_bytes(hashlib.blake2b(data, digest_size=8).digest(), "little")
+
+
+def cache_tag(device: str, backend: str) -> str:
+    """Identify how cached vectors were produced: model, backend, device, weights, norm."""
+    weights = ONNX_INT8_FILE if backend == "onnx" else "fp32"
+    return f"{MODEL_NAME}|{backend}|{device}|{weights}|normalize={NORMALIZE_EMBEDDINGS}"
+
+
+def load_cache(tag: str) -> dict[int, np.ndarray]:
+    """Load cached vectors keyed by text digest (empty if missing or made another way)."""
+    if not EMBED_CACHE.exists():
+        return {}
+    with np.load(EMBED_CACHE) as data:
+        if "tag" not in data or str(data["tag"]) != tag:
+            return {}
+        return dict(zip(data["keys"].tolist(), data["vectors"], strict=True))
+
+
+def save_cache(cache: dict[int, np.ndarray], tag: str) -> None:
+    """Persist the digest -> vector cache next to the embeddings."""
+    if not cache:
+        return
+    keys = np.fromiter(cache.keys(), dtype=np.uint64, count=len(cache))
+    np.savez_compressed(
+        EMBED_CACHE, tag=np.array(tag), keys=keys, vectors=np.stack(list(cache.values()))
+    )
+
+
+def dump_jsonl_line(doc: dict) -> bytes:
+    """Serialize one JSONL record as UTF-8 bytes (non-ASCII kept verbatim)."""
+    if orjson is not None:
+        return orjson.dumps(doc) + b"\n"
+    return (json.dumps(doc, ensure_ascii=False) + "\n").encode("utf-8")
+
+
+def pick_device() -> str:
+    """Return the best available torch device: CUDA, then Apple MPS, then CPU."""
+    if torch.cuda.is_available():
+        return "cuda"
+    if torch.backends.mps.is_available():
+        return "mps"
+    return "cpu"
+
+
+def planned_backend(device: str) -> str:
+    """The backend ``load_model`` will try first on *device*."""
+    return "onnx" if device == "cpu" and EMBED_BACKEND == "onnx" else "torch"
+
+
+def load_model(device: str) -> tuple[SentenceTransformer, str]:
+    """Load the encoder, preferring the int8 ONNX backend on CPU; return it and its backend.
+
+    Falls back to FP32 PyTorch when on an accelerator, when EMBED_BACKEND=torch,
+    when the ONNX extras (``sentence-transformers[onnx]``) are missing, or when
+    sentence-transformers predates the ``backend``/``model_kwargs`` arguments.
+    """
+    if planned_backend(device) == "onnx":
+        try:
+            model = SentenceTransformer(
+                MODEL_NAME,
+                device=device,
+                backend="onnx",
+                model_kwargs={"file_name": ONNX_INT8_FILE},
+            )
+            return model, "onnx"
+        except (ImportError, ValueError, TypeError) as exc:
+            print(f"  ONNX backend unavailable ({exc}); using PyTorch FP32")
+    return SentenceTransformer(MODEL_NAME, device=device), "torch"
 
 
 def build_documents() -> list[dict]:
@@ -57,26 +157,30 @@ def build_documents() -> list[dict]:
         })
 
     # Cypher examples
-    seen = set()
+    seen: set[int] = set()
     for ex in load_jsonl(PROCESSED_DIR / "cypher_examples.jsonl"):
         cypher = ex["cypher"]
-        if cypher in seen:
+        h = digest(cypher)
+        if h in seen:
             continue
-        seen.add(cypher)
+        seen.add(h)
         text = f"{ex['description']} Cypher: {cypher}"
         docs.append({
             "text": text[:500],
             "type": "cypher_example",
             "category": ex.get("category", ""),
             "context": ex.get("context", ""),
+            # Whitespace-normalized match key for load_embeddings.py
+            "cypher_norm": " ".join(cypher.split()),
         })
 
     # Modeling patterns
-    seen_p = set()
+    seen_p: set[int] = set()
     for p in load_jsonl(PROCESSED_DIR / "modeling_patterns.jsonl"):
-        if p["name"] in seen_p:
+        h = digest(p["name"])
+        if h in seen_p:
             continue
-        seen_p.add(p["name"])
+        seen_p.add(h)
         text = f"{p['name']}: {p['description']}"
         docs.append({
             "text": text[:500],
@@ -85,12 +189,15 @@ def build_documents() -> list[dict]:
         })
 
     # Best practices
-    seen_bp = set()
+    seen_bp: set[int] = set()
     for bp in load_jsonl(PROCESSED_DIR / "best_practices.jsonl"):
         title = bp["title"]
-        if not title or title in seen_bp:
+        if not title:
+            continue
+        h = digest(title)
+        if h in seen_bp:
             continue
-        seen_bp.add(title)
+        seen_bp.add(h)
         text = f"{title}: {bp['description']}"
         docs.append({
             "text": text[:500],
@@ -112,27 +219,61 @@ def main() -> None:
     for t, c in sorted(type_counts.items()):
         print(f"  {t}: {c}")
 
-    # Load model and encode
-    print(f"\nLoading model: {MODEL_NAME}")
-    model = SentenceTransformer(MODEL_NAME)
+    if not docs:
+        print("Nothing to embed")
+        return
+
+    # Only encode texts whose hash is not already cached from a previous run
+    # made with the same model, backend, device and normalization
+    device = pick_device()
+    tag = cache_tag(device, planned_backend(device))
+    hashes = [digest(d["text"]) for d in docs]
+    cache = load_cache(tag)
+    missing = {h: d["text"] for h, d in zip(hashes, docs, strict=True) if h not in cache}
+    print(f"\nCached: {len(docs) - len(missing)}, to encode: {len(missing)}")
 
-    texts = [d["text"] for d in docs]
-    print(f"Encoding {len(texts)} texts...")
-    embeddings = model.encode(texts, show_progress_bar=True, batch_size=64)
-    embeddings = np.array(embeddings)
+    if missing:
+        # Load model and encode
+        batch_size = CPU_BATCH_SIZE if device == "cpu" else ACCELERATOR_BATCH_SIZE
+        print(f"Loading model: {MODEL_NAME} (device={device}, batch_size={batch_size})")
+        model, backend = load_model(device)
+        if backend != planned_backend(device):
+            # Fell back to another backend: cached vectors would not match new ones
+            tag = cache_tag(device, backend)
+            cache = {}
+            missing = {h: d["text"] for h, d in zip(hashes, docs, strict=True)}
+
+        print(f"Encoding {len(missing)} texts...")
+        # Unit-normalize once here so cosine similarity in the vector index
+        # reduces to a dot product over precomputed unit vectors. encode() already
+        # length-sorts texts internally, so batches carry minimal padding.
+        new_vecs = model.encode(
+            list(missing.values()),
+            show_progress_bar=True,
+            batch_size=batch_size,
+            normalize_embeddings=NORMALIZE_EMBEDDINGS,
+            convert_to_numpy=True,
+        )
+        cache.update(zip(missing, new_vecs, strict=True))
+
+    embeddings = np.stack([cache[h] for h in hashes])
     print(f"Embeddings shape: {embeddings.shape}")
 
-    # Save embeddings as numpy
+    # Keep only vectors for the current corpus so the cache does not grow forever
+    save_cache({h: cache[h] for h in hashes}, tag)
+
+    # Save embeddings as float16 — half the size, negligible cosine loss.
+    # load_embeddings.py widens back to float32 before writing to Neo4j.
     out_npz = PROCESSED_DIR / "embeddings.npz"
-    np.savez_compressed(out_npz, embeddings=embeddings)
+    np.savez_compressed(out_npz, embeddings=embeddings.astype(np.float16))
     print(f"Saved: {out_npz} ({out_npz.stat().st_size / 1024:.0f} KB)")
 
     # Save metadata
     out_meta = PROCESSED_DIR / "embeddings_meta.jsonl"
-    with open(out_meta, "w", encoding="utf-8") as f:
+    with open(out_meta, "wb") as f:
         for i, doc in enumerate(docs):
             doc["embedding_index"] = i
-            f.write(json.dumps(doc, ensure_ascii=False) + "\n")
+            f.write(dump_jsonl_line(doc))
     print(f"Saved: {out_meta} ({out_meta.stat().st_size / 1024:.0f} KB)")
 
     print(f"\nDone. {len(docs)} vectors x {embeddings.shape[1]} dimensions")
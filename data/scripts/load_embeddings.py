@@ -6,6 +6,10 @@ Reads embeddings.npz + embeddings_meta.jsonl from data/processed/ and:
   3. Adds an :Expert label to all embedded nodes
   4. Creates a vector index for semantic search
 
+The per-label loaders touch disjoint nodes, so they run concurrently on the
+async driver, each in its own session from a small bounded pool, to overlap
+Bolt round trips.
+
 Usage:
   python data/scripts/load_embeddings.py [--uri bolt://localhost:7687] [--password ...]
 """
@@ -13,15 +17,27 @@ Usage:
 from __future__ import annotations
 
 import argparse
+import asyncio
 import json
+from collections.abc import AsyncIterator, Iterator
+from contextlib import asynccontextmanager
+from dataclasses import dataclass, field
 from pathlib import Path
 
 import numpy as np
-from neo4j import GraphDatabase
+from neo4j import AsyncDriver, AsyncGraphDatabase, AsyncSession
+
+try:
+    import uvloop
+except ImportError:  # uvloop is optional; stdlib asyncio works fine
+    uvloop = None
 
 PROCESSED_DIR = Path(__file__).parent.parent / "processed"
 VECTOR_DIMS = 384
 VECTOR_INDEX_NAME = "expert_embedding"
+CHUNK_SIZE = 500  # rows per UNWIND write — bounds tx memory, amortizes round trips
+SESSION_POOL_SIZE = 6  # concurrent sessions (and so Bolt connections) in flight
+READ_FETCH_SIZE = 10_000  # records per PULL for the bulk CypherExample read
 
 
 def load_meta() -> list[dict]:
@@ -31,20 +47,71 @@ def load_meta() -> list[dict]:
         return [json.loads(line) for line in f if line.strip()]
 
 
-def set_embeddings_by_name(
-    session, label: str, key: str, name_to_vec: dict[str, list[float]]
+@dataclass
+class SessionPool:
+    """Hand out at most ``size`` concurrent sessions bound to one database.
+
+    Passing ``database`` at session creation skips the home-database lookup
+    round trip; the semaphore keeps concurrent loaders from exhausting the
+    driver's connection pool.
+    """
+
+    driver: AsyncDriver
+    database: str
+    size: int = SESSION_POOL_SIZE
+    _slots: asyncio.Semaphore = field(init=False, repr=False)
+
+    def __post_init__(self) -> None:
+        self._slots = asyncio.Semaphore(self.size)
+
+    @asynccontextmanager
+    async def session(self, **config: object) -> AsyncIterator[AsyncSession]:
+        async with (
+            self._slots,
+            self.driver.session(database=self.database, **config) as session,
+        ):
+            yield session
+
+
+def vectors_for(items: list[dict], embeddings: np.ndarray) -> list[list[float]]:
+    """Gather the embedding rows for *items* and convert them in one bulk call."""
+    idxs = np.fromiter((m["embedding_index"] for m in items), dtype=np.int64, count=len(items))
+    return embeddings[idxs].tolist()
+
+
+def _chunks(seq: list, n: int = CHUNK_SIZE) -> Iterator[list]:
+    """Yield successive *n*-sized slices of *seq*."""
+    for i in range(0, len(seq), n):
+        yield seq[i : i + n]
+
+
+async def set_embeddings_by_name(
+    pool: SessionPool, label: str, key: str, name_to_vec: dict[str, list[float]]
 ) -> int:
-    """Set embedding property on nodes matched by a name/title field."""
-    result = session.run(
-        f"""
-        UNWIND $entries AS entry
-        MATCH (n:{label} {{{key}: entry.name}})
-        SET n.embedding = entry.vec, n:Expert
-        RETURN count(n) AS cnt
-        """,
-        entries=[{"name": n, "vec": v} for n, v in name_to_vec.items()],
-    )
-    return result.single()["cnt"]
+    """Set embedding property on nodes matched by a name/title field.
+
+    The server commits every CHUNK_SIZE rows (``CALL { ... } IN TRANSACTIONS``),
+    releasing locks between batches. That form needs an auto-commit
+    transaction; the subquery returns how many nodes each row updated, so the
+    total counts exactly the nodes this run wrote.
+    """
+    entries = [{"name": n, "vec": v} for n, v in name_to_vec.items()]
+    async with pool.session() as session:
+        result = await session.run(
+            f"""
+            UNWIND $entries AS entry
+            CALL {{
+                WITH entry
+                MATCH (n:{label} {{{key}: entry.name}})
+                SET n.embedding = entry.vec, n:Expert
+                RETURN count(n) AS matched
+            }} IN TRANSACTIONS OF {CHUNK_SIZE} ROWS
+            RETURN sum(matched) AS cnt
+            """,
+            entries=entries,
+        )
+        record = await result.single(strict=True)
+    return record["cnt"]
 
 
 def normalize_ws(s: str) -> str:
@@ -52,56 +119,70 @@ def normalize_ws(s: str) -> str:
     return " ".join(s.split())
 
 
-def set_example_embeddings(
-    session, examples: list[dict], embeddings: np.ndarray
+async def set_example_embeddings(
+    pool: SessionPool, examples: list[dict], embeddings: np.ndarray
 ) -> tuple[int, int]:
-    """Match CypherExample nodes by cypher text extracted from embedding text.
+    """Match CypherExample nodes by the normalized cypher stored in the metadata.
 
-    Matching is done in Python with whitespace normalization, then written
-    back to Neo4j by elementId.
+    Matching is done in Python against the precomputed ``cypher_norm`` key
+    (older metadata falls back to the text after " Cypher: "), then written
+    back to Neo4j by elementId. Write chunks are independent, so each runs
+    concurrently in its own pooled session.
     """
     # Build a lookup: normalized cypher → embedding vector
     marker = " Cypher: "
     cypher_to_vec: dict[str, list[float]] = {}
-    for ex in examples:
-        text = ex["text"]
-        idx = text.find(marker)
-        if idx == -1:
-            continue
-        cypher = text[idx + len(marker) :]
-        key = normalize_ws(cypher)
-        vec = embeddings[ex["embedding_index"]].tolist()
+    for ex, vec in zip(examples, vectors_for(examples, embeddings), strict=True):
+        key = ex.get("cypher_norm")
+        if key is None:
+            text = ex["text"]
+            idx = text.find(marker)
+            if idx == -1:
+                continue
+            key = normalize_ws(text[idx + len(marker) :])
         cypher_to_vec[key] = vec
 
-    # Fetch all CypherExample nodes from Neo4j
-    result = session.run(
-        "MATCH (e:CypherExample) RETURN elementId(e) AS eid, e.cypher AS cypher"
-    )
-    matches: list[dict[str, object]] = []
-    for r in result:
-        key = normalize_ws(r["cypher"])
-        if key in cypher_to_vec:
-            matches.append({"eid": r["eid"], "vec": cypher_to_vec[key]})
+    # Stream CypherExample nodes from Neo4j. Every node is checked, because
+    # several nodes can share one normalized cypher (e.g. differing only in
+    # whitespace) and each of them needs the embedding.
+    # Runs as a managed read so transient cluster errors are retried.
+    async def match_examples(tx) -> list[dict[str, object]]:
+        matches: list[dict[str, object]] = []
+        result = await tx.run(
+            "MATCH (e:CypherExample) RETURN elementId(e) AS eid, e.cypher AS cypher"
+        )
+        async for r in result:
+            key = normalize_ws(r["cypher"])
+            if key in cypher_to_vec:
+                matches.append({"eid": r["eid"], "vec": cypher_to_vec[key]})
+        return matches
+
+    async with pool.session(fetch_size=READ_FETCH_SIZE) as session:
+        matches = await session.execute_read(match_examples)
 
     # Write embeddings back by elementId
-    chunk_size = 50
-    for i in range(0, len(matches), chunk_size):
-        chunk = matches[i : i + chunk_size]
-        session.run(
-            """
-            UNWIND $entries AS entry
-            MATCH (n) WHERE elementId(n) = entry.eid
-            SET n.embedding = entry.vec, n:Expert
-            """,
-            entries=chunk,
-        )
+    query = """
+        UNWIND $entries AS entry
+        MATCH (n) WHERE elementId(n) = entry.eid
+        SET n.embedding = entry.vec, n:Expert
+        """
+
+    async def write_chunk(tx, chunk: list[dict]) -> None:
+        result = await tx.run(query, entries=chunk)
+        await result.consume()
+
+    async def load_chunk(chunk: list[dict]) -> None:
+        async with pool.session() as session:
+            await session.execute_write(write_chunk, chunk)
+
+    await asyncio.gather(*(load_chunk(chunk) for chunk in _chunks(matches)))
 
     return len(matches), len(cypher_to_vec)
 
 
-def create_vector_index(session) -> None:
+async def create_vector_index(session) -> None:
     """Create a vector index on :Expert(embedding) for semantic search."""
-    session.run(
+    result = await session.run(
         f"""
         CREATE VECTOR INDEX {VECTOR_INDEX_NAME} IF NOT EXISTS
         FOR (n:Expert) ON (n.embedding)
@@ -113,22 +194,24 @@ def create_vector_index(session) -> None:
         }}
         """
     )
+    await result.consume()
 
 
-def create_fulltext_index(session) -> None:
+async def create_fulltext_index(session) -> None:
     """Create a fulltext index for keyword search across expert nodes."""
-    session.run(
+    result = await session.run(
         """
         CREATE FULLTEXT INDEX expert_fulltext IF NOT EXISTS
         FOR (n:CypherClause|CypherFunction|CypherExample|ModelingPattern|BestPractice)
         ON EACH [n.name, n.description, n.title, n.cypher, n.signature]
         """
     )
+    await result.consume()
 
 
-def print_results(session) -> None:
+async def print_results(session) -> None:
     """Print final stats."""
-    result = session.run(
+    result = await session.run(
         """
         MATCH (n:Expert)
         WHERE n.embedding IS NOT NULL
@@ -138,13 +221,13 @@ def print_results(session) -> None:
     )
     print("\n  Nodes with embeddings:")
     total = 0
-    for r in result:
+    async for r in result:
         lbl = r["label"] if r["label"] != "Expert" else "(Expert only)"
         print(f"    {lbl}: {r['cnt']}")
         total += r["cnt"]
     print(f"    TOTAL: {total}")
 
-    result = session.run(
+    result = await session.run(
         """
         SHOW INDEXES YIELD name, type, state
         WHERE type = 'VECTOR'
@@ -152,25 +235,16 @@ def print_results(session) -> None:
         """
     )
     print("\n  Vector indexes:")
-    for r in result:
+    async for r in result:
         print(f"    {r['name']}: {r['state']}")
 
 
-def main() -> None:
-    parser = argparse.ArgumentParser(description="Load embeddings into Neo4j")
-    parser.add_argument("--uri", default="bolt://localhost:7687")
-    parser.add_argument("--username", default="neo4j")
-    parser.add_argument("--password", default="")
-    parser.add_argument("--database", default="neo4j")
-    args = parser.parse_args()
-
-    print("=" * 60)
-    print("Loading Embeddings into Neo4j Expert Graph")
-    print("=" * 60)
-
+async def load(args: argparse.Namespace) -> None:
+    """Load all embeddings, then build indexes and report."""
     # Load files
     print("\n[1/5] Loading embedding files...")
-    embeddings = np.load(PROCESSED_DIR / "embeddings.npz")["embeddings"]
+    # Stored as float16 on disk; the vector index expects float32 values
+    embeddings = np.load(PROCESSED_DIR / "embeddings.npz")["embeddings"].astype(np.float32)
     meta = load_meta()
     print(f"  {len(meta)} vectors x {embeddings.shape[1]} dims")
 
@@ -181,68 +255,66 @@ def main() -> None:
     for t, items in sorted(by_type.items()):
         print(f"  {t}: {len(items)}")
 
+    # label, match key, meta type (name in meta = title for BestPractice)
+    targets = [
+        ("CypherClause", "name", "cypher_clause"),
+        ("CypherFunction", "name", "cypher_function"),
+        ("ModelingPattern", "name", "modeling_pattern"),
+        ("BestPractice", "title", "best_practice"),
+    ]
+    name_maps: dict[str, dict[str, list[float]]] = {}
+    for label, _, t in targets:
+        items = by_type.get(t, [])
+        name_maps[label] = dict(
+            zip((m["name"] for m in items), vectors_for(items, embeddings), strict=True)
+        )
+
     # Connect
     auth = (args.username, args.password) if args.password else None
-    driver = GraphDatabase.driver(args.uri, auth=auth)
-
-    with driver.session(database=args.database) as session:
-        # Clauses — match by name
-        print("\n[2/5] Loading clause embeddings...")
-        clauses = {
-            m["name"]: embeddings[m["embedding_index"]].tolist()
-            for m in by_type.get("cypher_clause", [])
-        }
-        cnt = set_embeddings_by_name(session, "CypherClause", "name", clauses)
-        print(f"  Matched {cnt}/{len(clauses)}")
-
-        # Functions — match by name
-        print("  Loading function embeddings...")
-        functions = {
-            m["name"]: embeddings[m["embedding_index"]].tolist()
-            for m in by_type.get("cypher_function", [])
-        }
-        cnt = set_embeddings_by_name(session, "CypherFunction", "name", functions)
-        print(f"  Matched {cnt}/{len(functions)}")
-
-        # Patterns — match by name
-        print("  Loading pattern embeddings...")
-        patterns = {
-            m["name"]: embeddings[m["embedding_index"]].tolist()
-            for m in by_type.get("modeling_pattern", [])
-        }
-        cnt = set_embeddings_by_name(session, "ModelingPattern", "name", patterns)
-        print(f"  Matched {cnt}/{len(patterns)}")
-
-        # Best practices — match by title (name in meta = title in Neo4j)
-        print("  Loading best practice embeddings...")
-        practices = {
-            m["name"]: embeddings[m["embedding_index"]].tolist()
-            for m in by_type.get("best_practice", [])
-        }
-        cnt = set_embeddings_by_name(session, "BestPractice", "title", practices)
-        print(f"  Matched {cnt}/{len(practices)}")
-
-        # Examples — match by cypher text
-        print("\n[3/5] Loading example embeddings...")
-        matched, attempted = set_example_embeddings(
-            session, by_type.get("cypher_example", []), embeddings
+    async with AsyncGraphDatabase.driver(args.uri, auth=auth) as driver:
+        pool = SessionPool(driver, args.database)
+        print("\n[2/5] Loading clause, function, pattern and practice embeddings...")
+        print("[3/5] Loading example embeddings...")
+        *counts, (matched, attempted) = await asyncio.gather(
+            *(
+                set_embeddings_by_name(pool, label, key, name_maps[label])
+                for label, key, _ in targets
+            ),
+            set_example_embeddings(pool, by_type.get("cypher_example", []), embeddings),
         )
-        print(f"  Matched {matched}/{attempted}")
+        for (label, _, _), cnt in zip(targets, counts, strict=True):
+            print(f"  {label}: matched {cnt}/{len(name_maps[label])}")
+        print(f"  CypherExample: matched {matched}/{attempted}")
+
+        async with pool.session() as session:
+            # Create indexes
+            print("\n[4/6] Creating vector index...")
+            await create_vector_index(session)
+            print(f"  Index '{VECTOR_INDEX_NAME}' created")
+
+            print("\n[5/6] Creating fulltext index...")
+            await create_fulltext_index(session)
+            print("  Index 'expert_fulltext' created")
 
-        # Create indexes
-        print("\n[4/6] Creating vector index...")
-        create_vector_index(session)
-        print(f"  Index '{VECTOR_INDEX_NAME}' created")
+            # Stats
+            print("\n[6/6] Results")
+            await print_results(session)
 
-        print("\n[5/6] Creating fulltext index...")
-        create_fulltext_index(session)
-        print("  Index 'expert_fulltext' created")
 
-        # Stats
-        print("\n[6/6] Results")
-        print_results(session)
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Load embeddings into Neo4j")
+    parser.add_argument("--uri", default="bolt://localhost:7687")
+    parser.add_argument("--username", default="neo4j")
+    parser.add_argument("--password", default="")
+    parser.add_argument("--database", default="neo4j")
+    args = parser.parse_args()
+
+    print("=" * 60)
+    print("Loading Embeddings into Neo4j Expert Graph")
+    print("=" * 60)
 
-    driver.close()
+    run = uvloop.run if uvloop is not None else asyncio.run
+    run(load(args))
     print("\nDone!")
 
 
@@ -16,12 +16,44 @@ Usage:
 from __future__ import annotations
 
 import argparse
+import hashlib
 import json
+import sys
+from collections.abc import Iterable, Iterator
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 
 from neo4j import GraphDatabase
+from neo4j.exceptions import ClientError
+
+try:
+    import orjson
+except ImportError:  # orjson is optional; fall back to stdlib json
+    orjson = None
 
 PROCESSED_DIR = Path(__file__).parent.parent / "processed"
+_loads = orjson.loads if orjson is not None else json.loads
+# Rows per server-side transaction for the CALL { ... } IN TRANSACTIONS loaders.
+# Those need auto-commit transactions, i.e. session.run. The batches run one
+# after another: they MERGE links onto shared hub nodes (clauses, categories,
+# sources), so concurrent batches would deadlock on those nodes' locks.
+DEFAULT_BATCH_SIZE = 1000
+CLEAR_BATCH_SIZE = 10_000  # nodes deleted per transaction by --clear
+WRITE_CHUNK_SIZE = 10_000  # rows per managed write for the clause/function loaders
+OFFICIAL_DOCS = {"type": "official_docs", "authority_level": 1}
+JSONL_FILES = {
+    "clauses": "cypher_clauses.jsonl",
+    "functions": "cypher_functions.jsonl",
+    "examples": "cypher_examples.jsonl",
+    "patterns": "modeling_patterns.jsonl",
+    "practices": "best_practices.jsonl",
+}
+INDUSTRIES = [
+    "Financial Services", "Healthcare", "Cybersecurity",
+    "Supply Chain", "Compliance", "E-commerce",
+    "HR & Workforce", "Media & Content", "IT Operations",
+    "Government", "Life Sciences", "Telecommunications",
+]
 
 
 def load_jsonl(filepath: Path) -> list[dict]:
@@ -29,12 +61,12 @@ def load_jsonl(filepath: Path) -> list[dict]:
     if not filepath.exists():
         print(f"  SKIP: {filepath.name} not found")
         return []
-    with open(filepath, encoding="utf-8") as f:
-        return [json.loads(line) for line in f if line.strip()]
+    data = filepath.read_bytes()
+    return [_loads(line) for line in data.splitlines() if line.strip()]
 
 
 def create_constraints_and_indexes(session) -> None:
-    """Create uniqueness constraints and performance indexes for the expert graph."""
+    """Create constraints and indexes for the expert graph, then seed industry nodes."""
     constraints = [
         "CREATE CONSTRAINT IF NOT EXISTS FOR (c:CypherClause) REQUIRE c.name IS UNIQUE",
         "CREATE CONSTRAINT IF NOT EXISTS FOR (f:CypherFunction) REQUIRE f.name IS UNIQUE",
@@ -44,47 +76,126 @@ def create_constraints_and_indexes(session) -> None:
         "CREATE CONSTRAINT IF NOT EXISTS FOR (cat:FunctionCategory) REQUIRE cat.name IS UNIQUE",
         "CREATE CONSTRAINT IF NOT EXISTS FOR (cat:PracticeCategory) REQUIRE cat.name IS UNIQUE",
         "CREATE CONSTRAINT IF NOT EXISTS FOR (i:Industry) REQUIRE i.name IS UNIQUE",
+        "CREATE CONSTRAINT IF NOT EXISTS FOR (ex:CypherExample) REQUIRE ex.cypher_hash IS UNIQUE",
     ]
-    for c in constraints:
-        session.run(c)
-    print("  Constraints created")
 
     # Performance indexes for real query patterns:
     # - ExpertStore searches examples by category (clause vs function)
+    # - (category, context) serves lookups of the examples for one clause or
+    #   function. Neo4j only uses a composite index when the predicate covers
+    #   its properties, so the single-property category index stays as well.
+    #   The DEMONSTRATES link pass starts from the example and seeks the
+    #   clause/function by its unique name, so neither index is needed there.
     # - Retriever filters by authority_level for confidence-weighted results
     # - Source.type enables filtering official_docs vs knowledge_base
     indexes = [
         "CREATE INDEX IF NOT EXISTS FOR (ex:CypherExample) ON (ex.category)",
+        "CREATE INDEX IF NOT EXISTS FOR (ex:CypherExample) ON (ex.category, ex.context)",
         "CREATE INDEX IF NOT EXISTS FOR (bp:BestPractice) ON (bp.authority_level)",
         "CREATE INDEX IF NOT EXISTS FOR (s:Source) ON (s.type)",
     ]
-    for idx in indexes:
-        session.run(idx)
-    print("  Indexes created")
+
+    # Schema-only statements may share a transaction: one managed write
+    # instead of a Bolt round trip (and auto-commit) per statement.
+    def create_schema(tx) -> None:
+        for q in constraints + indexes:
+            tx.run(q).consume()
+
+    session.execute_write(create_schema)
+    print(f"  Created {len(constraints)} constraints and {len(indexes)} indexes")
+
+    # Industry taxonomy nodes rely on the Industry.name constraint above. Neo4j
+    # won't mix schema and data writes in one transaction, so this follows it.
+    def create_industries(tx) -> None:
+        tx.run("""
+            UNWIND $industries AS name
+            MERGE (:Industry {name: name})
+        """, industries=INDUSTRIES).consume()
+
+    session.execute_write(create_industries)
+    print(f"  Created {len(INDUSTRIES)} industry nodes")
+
+
+def _coalesce(value: object, default: object) -> object:
+    """Python twin of Cypher ``COALESCE`` for two arguments."""
+    return default if value is None else value
+
+
+def _counted(records: Iterable[dict], **counts: str) -> list[dict]:
+    """Replace list fields with their lengths, e.g. ``example_count="examples"``.
+
+    Only the counts are stored, so the arrays themselves never go over Bolt.
+    """
+    rows = list(records)
+    for r in rows:
+        for count_key, list_key in counts.items():
+            r[count_key] = len(r.pop(list_key, None) or [])
+    return rows
+
+
+def upsert_sources(session, sources: dict[str, dict]) -> None:
+    """MERGE each distinct Source once, ahead of the per-row SOURCED_FROM links.
+
+    *sources* maps path to its ``type`` and ``authority_level``; loaders then
+    only ``MATCH`` the node by its unique path instead of re-merging it per row.
+    The metadata is written only when the Source is first created, matching
+    the docker loader.
+    """
+    rows = [{"path": path, **props} for path, props in sources.items()]
+
+    def write_sources(tx) -> None:
+        tx.run("""
+            UNWIND $sources AS s
+            MERGE (src:Source {path: s.path})
+            ON CREATE SET src.type = s.type,
+                src.authority_level = s.authority_level
+        """, sources=rows).consume()
+
+    session.execute_write(write_sources)
+
+
+def _chunks(seq: list, n: int = WRITE_CHUNK_SIZE) -> Iterator[list]:
+    """Yield successive *n*-sized slices of *seq*."""
+    for i in range(0, len(seq), n):
+        yield seq[i : i + n]
+
+
+def _write_batches(session, query: str, key: str, rows: list[dict]) -> int:
+    """Run *query* once per chunk of *rows* (bound as ``$key``) in managed writes.
+
+    Each chunk is its own retryable transaction with bounded memory. Returns
+    the number of nodes created, read from the result summary counters.
+    """
+
+    def write_chunk(tx, chunk: list[dict]) -> int:
+        return tx.run(query, {key: chunk}).consume().counters.nodes_created
+
+    return sum(session.execute_write(write_chunk, chunk) for chunk in _chunks(rows))
 
 
 def load_clauses(session, clauses: list[dict]) -> int:
     """Load Cypher clauses into the expert graph."""
-    result = session.run("""
+    rows = _counted(clauses, example_count="syntax_examples", section_count="sections")
+    upsert_sources(session, {c["source_file"]: OFFICIAL_DOCS for c in rows})
+    return _write_batches(session, """
         UNWIND $clauses AS c
         MERGE (clause:CypherClause {name: c.name})
         SET clause.description = c.description,
             clause.source_file = c.source_file,
             clause.authority_level = c.authority_level,
-            clause.example_count = size(c.syntax_examples),
-            clause.section_count = size(c.sections)
-        MERGE (src:Source {path: c.source_file})
-        SET src.type = 'official_docs',
-            src.authority_level = 1
+            clause.example_count = c.example_count,
+            clause.section_count = c.section_count
+        WITH clause, c
+        MATCH (src:Source {path: c.source_file})
         MERGE (clause)-[:SOURCED_FROM]->(src)
-        RETURN count(clause) AS cnt
-    """, clauses=clauses)
-    return result.single()["cnt"]
+    """, "clauses", rows)
 
 
 def load_functions(session, functions: list[dict]) -> int:
     """Load Cypher functions into the expert graph."""
-    result = session.run("""
+    rows = _counted(functions, example_count="examples")
+    upsert_sources(session, {f["source_file"]: OFFICIAL_DOCS for f in rows})
+    return _write_batches(session, """
         UNWIND $functions AS f
         MERGE (func:CypherFunction {name: f.name})
         SET func.description = f.description,
@@ -92,183 +203,192 @@ def load_functions(session, functions: list[dict]) -> int:
             func.returns = f.returns,
             func.source_file = f.source_file,
             func.authority_level = f.authority_level,
-            func.example_count = size(f.examples)
+            func.example_count = f.example_count
         MERGE (cat:FunctionCategory {name: f.category})
         MERGE (func)-[:BELONGS_TO]->(cat)
-        MERGE (src:Source {path: f.source_file})
-        SET src.type = 'official_docs',
-            src.authority_level = 1
+        WITH func, f
+        MATCH (src:Source {path: f.source_file})
         MERGE (func)-[:SOURCED_FROM]->(src)
-        RETURN count(func) AS cnt
-    """, functions=functions)
-    return result.single()["cnt"]
+    """, "functions", rows)
 
 
-def load_examples(session, examples: list[dict]) -> int:
+def load_examples(session, examples: Iterable[dict], batch_size: int = DEFAULT_BATCH_SIZE) -> int:
     """Load Cypher examples, linking to their clause/function context.
 
+    Examples MERGE on ``cypher_hash``, the SHA-256 of the query text: a
+    unique constraint on the text itself would index the full string and
+    reject examples longer than the index key-size limit. Duplicates within
+    the input keep their first occurrence; re-runs update the stored
+    properties in place.
+
     Bug fix: The original CALL { WITH x WITH x WHERE ... } subquery pattern
     silently produced zero matches in some Neo4j versions. Using direct
-    conditional MATCH instead.
+    conditional OPTIONAL MATCH + FOREACH instead, in the same query as the
+    MERGE so the example set is only walked once.
     """
-    # Deduplicate by cypher text
-    seen = set()
-    unique = []
+    by_cypher: dict[str, dict] = {}
     for ex in examples:
-        if ex["cypher"] not in seen:
-            seen.add(ex["cypher"])
-            unique.append(ex)
+        by_cypher.setdefault(ex["cypher"], ex)
+    rows = [
+        {**ex, "cypher_hash": hashlib.sha256(cypher.encode()).hexdigest()}
+        for cypher, ex in by_cypher.items()
+    ]
+    if not rows:
+        return 0
 
-    # Create example nodes first
-    session.run("""
+    # Upsert example nodes and link them to their clause/function in one pass,
+    # committing every batch_size rows in its own server-side transaction.
+    # OPTIONAL MATCH (not MERGE) so unknown contexts don't spawn stub nodes;
+    # the unique constraints on name make each lookup an index seek.
+    result = session.run("""
         UNWIND $examples AS e
-        CREATE (ex:CypherExample {
-            cypher: e.cypher,
-            description: e.description,
-            context: e.context,
-            category: e.category,
-            source_file: e.source_file,
-            authority_level: e.authority_level
-        })
-    """, examples=unique)
-
-    # Link clause examples via DEMONSTRATES
-    clause_result = session.run("""
-        MATCH (ex:CypherExample)
-        WHERE ex.category = 'clause'
-        WITH ex
-        MATCH (clause:CypherClause {name: ex.context})
-        MERGE (ex)-[:DEMONSTRATES]->(clause)
-        RETURN count(*) AS cnt
-    """)
-    clause_cnt = clause_result.single()["cnt"]
-    print(f"    Linked {clause_cnt} clause examples via DEMONSTRATES")
-
-    # Link function examples via DEMONSTRATES
-    func_result = session.run("""
-        MATCH (ex:CypherExample)
-        WHERE ex.category = 'function'
-        WITH ex
-        MATCH (func:CypherFunction {name: ex.context})
-        MERGE (ex)-[:DEMONSTRATES]->(func)
-        RETURN count(*) AS cnt
-    """)
-    func_cnt = func_result.single()["cnt"]
-    print(f"    Linked {func_cnt} function examples via DEMONSTRATES")
-
-    # Return total example count
-    result = session.run("MATCH (ex:CypherExample) RETURN count(ex) AS cnt")
-    return result.single()["cnt"]
-
-
-def load_patterns(session, patterns: list[dict]) -> int:
+        CALL {
+            WITH e
+            MERGE (ex:CypherExample {cypher_hash: e.cypher_hash})
+            SET ex.cypher = e.cypher,
+                ex.description = e.description,
+                ex.context = e.context,
+                ex.category = e.category,
+                ex.source_file = e.source_file,
+                ex.authority_level = e.authority_level
+            WITH ex
+            OPTIONAL MATCH (clause:CypherClause {name: ex.context})
+            WHERE ex.category = 'clause'
+            OPTIONAL MATCH (func:CypherFunction {name: ex.context})
+            WHERE ex.category = 'function'
+            FOREACH (_ IN CASE WHEN clause IS NULL THEN [] ELSE [1] END |
+                MERGE (ex)-[:DEMONSTRATES]->(clause))
+            FOREACH (_ IN CASE WHEN func IS NULL THEN [] ELSE [1] END |
+                MERGE (ex)-[:DEMONSTRATES]->(func))
+        } IN TRANSACTIONS OF $batch_size ROWS
+    """, examples=rows, batch_size=batch_size)
+    counters = result.consume().counters
+    print(f"    Created {counters.relationships_created} DEMONSTRATES links")
+    return counters.nodes_created
+
+
+def load_patterns(session, patterns: list[dict], batch_size: int = DEFAULT_BATCH_SIZE) -> int:
     """Load modeling patterns into the expert graph.
 
     Bug fix: source_file can be None in parsed data. Using COALESCE to
     default to 'neo4j-modeling-docs' instead of failing silently on
     MERGE with a null key.
     """
+    rows = _counted(patterns, example_count="cypher_examples")
+    sources: dict[str, dict] = {}
+    for p in rows:
+        path = _coalesce(p.get("source_file"), "neo4j-modeling-docs")
+        sources[path] = {
+            "type": "official_docs",
+            "authority_level": _coalesce(p.get("authority_level"), 1),
+        }
+    upsert_sources(session, sources)
+
     result = session.run("""
         UNWIND $patterns AS p
-        MERGE (pat:ModelingPattern {name: p.name})
-        SET pat.description = p.description,
-            pat.when_to_use = p.when_to_use,
-            pat.anti_pattern = p.anti_pattern,
-            pat.node_labels = p.node_labels,
-            pat.relationship_types = p.relationship_types,
-            pat.source_file = p.source_file,
-            pat.authority_level = p.authority_level,
-            pat.example_count = size(p.cypher_examples)
-        WITH pat, COALESCE(p.source_file, 'neo4j-modeling-docs') AS src_path,
-             p.authority_level AS auth
-        MERGE (src:Source {path: src_path})
-        SET src.type = 'official_docs',
-            src.authority_level = COALESCE(auth, 1)
-        MERGE (pat)-[:SOURCED_FROM]->(src)
-        RETURN count(pat) AS cnt
-    """, patterns=patterns)
-    return result.single()["cnt"]
-
-
-def load_practices(session, practices: list[dict]) -> int:
+        CALL {
+            WITH p
+            MERGE (pat:ModelingPattern {name: p.name})
+            SET pat.description = p.description,
+                pat.when_to_use = p.when_to_use,
+                pat.anti_pattern = p.anti_pattern,
+                pat.node_labels = p.node_labels,
+                pat.relationship_types = p.relationship_types,
+                pat.source_file = p.source_file,
+                pat.authority_level = p.authority_level,
+                pat.example_count = p.example_count
+            WITH pat, COALESCE(p.source_file, 'neo4j-modeling-docs') AS src_path
+            MATCH (src:Source {path: src_path})
+            MERGE (pat)-[:SOURCED_FROM]->(src)
+        } IN TRANSACTIONS OF $batch_size ROWS
+    """, patterns=rows, batch_size=batch_size)
+    return result.consume().counters.nodes_created
+
+
+def load_practices(session, practices: Iterable[dict], batch_size: int = DEFAULT_BATCH_SIZE) -> int:
     """Load best practices into the expert graph.
 
     Bug fix: source_file can be None in parsed data. Using COALESCE to
     default to 'neo4j-knowledge-base' instead of failing silently on
     MERGE with a null key.
     """
-    # Deduplicate by title
-    seen = set()
-    unique = []
+    # Deduplicate by title (first occurrence wins)
+    by_title: dict[str, dict] = {}
     for p in practices:
-        if p["title"] not in seen:
-            seen.add(p["title"])
-            unique.append(p)
+        by_title.setdefault(p["title"], p)
+    unique = _counted(by_title.values(), example_count="cypher_examples")
+    if not unique:
+        return 0
+
+    sources: dict[str, dict] = {}
+    for p in unique:
+        path = _coalesce(p.get("source_file"), "neo4j-knowledge-base")
+        sources[path] = {
+            "type": "knowledge_base" if "knowledge-base" in path else "official_docs",
+            "authority_level": _coalesce(p.get("authority_level"), 1),
+        }
+    upsert_sources(session, sources)
 
     result = session.run("""
         UNWIND $practices AS p
-        MERGE (bp:BestPractice {title: p.title})
-        SET bp.description = p.description,
-            bp.source_file = p.source_file,
-            bp.authority_level = p.authority_level,
-            bp.example_count = size(p.cypher_examples)
-        MERGE (cat:PracticeCategory {name: p.category})
-        MERGE (bp)-[:BELONGS_TO]->(cat)
-        WITH bp, p,
-             COALESCE(p.source_file, 'neo4j-knowledge-base') AS src_path
-        MERGE (src:Source {path: src_path})
-        SET src.type = CASE
-            WHEN src_path CONTAINS 'knowledge-base' THEN 'knowledge_base'
-            ELSE 'official_docs'
-            END,
-            src.authority_level = COALESCE(p.authority_level, 1)
-        MERGE (bp)-[:SOURCED_FROM]->(src)
-        RETURN count(bp) AS cnt
-    """, practices=unique)
-    return result.single()["cnt"]
-
-
-def create_industry_nodes(session) -> int:
-    """Create industry taxonomy nodes and link patterns."""
-    industries = [
-        "Financial Services", "Healthcare", "Cybersecurity",
-        "Supply Chain", "Compliance", "E-commerce",
-        "HR & Workforce", "Media & Content", "IT Operations",
-        "Government", "Life Sciences", "Telecommunications",
-    ]
-    session.run("""
-        UNWIND $industries AS name
-        MERGE (:Industry {name: name})
-    """, industries=industries)
-    print(f"  Created {len(industries)} industry nodes")
-    return len(industries)
+        CALL {
+            WITH p
+            MERGE (bp:BestPractice {title: p.title})
+            SET bp.description = p.description,
+                bp.source_file = p.source_file,
+                bp.authority_level = p.authority_level,
+                bp.example_count = p.example_count
+            MERGE (cat:PracticeCategory {name: p.category})
+            MERGE (bp)-[:BELONGS_TO]->(cat)
+            WITH bp, COALESCE(p.source_file, 'neo4j-knowledge-base') AS src_path
+            MATCH (src:Source {path: src_path})
+            MERGE (bp)-[:SOURCED_FROM]->(src)
+        } IN TRANSACTIONS OF $batch_size ROWS
+    """, practices=unique, batch_size=batch_size)
+    return result.consume().counters.nodes_created
+
+
+def graph_counts(session) -> tuple[dict[str, int], dict[str, int], int, int]:
+    """Return (label counts, relationship type counts, node total, rel total).
+
+    Reads the store's counters via ``apoc.meta.stats()`` when APOC is
+    installed; otherwise falls back to scanning the graph. With APOC a
+    multi-labelled node counts once per label.
+    """
+    try:
+        r = session.run("""
+            CALL apoc.meta.stats()
+            YIELD labels, relTypesCount, nodeCount, relCount
+            RETURN labels, relTypesCount, nodeCount, relCount
+        """).single()
+        return r["labels"], r["relTypesCount"], r["nodeCount"], r["relCount"]
+    except ClientError:  # APOC not installed
+        pass
+
+    labels = {
+        r["label"]: r["count"]
+        for r in session.run("MATCH (n) RETURN labels(n)[0] AS label, count(n) AS count")
+    }
+    rel_types = {
+        r["type"]: r["count"]
+        for r in session.run("MATCH ()-[r]->() RETURN type(r) AS type, count(r) AS count")
+    }
+    return labels, rel_types, sum(labels.values()), sum(rel_types.values())
 
 
 def print_stats(session) -> None:
     """Print expert graph statistics."""
-    result = session.run("""
-        MATCH (n)
-        RETURN labels(n)[0] AS label, count(n) AS count
-        ORDER BY count DESC
-    """)
-    print("\n  Expert Graph Stats:")
-    total = 0
-    for r in result:
-        print(f"    {r['label']}: {r['count']}")
-        total += r["count"]
-
-    result = session.run("""
-        MATCH ()-[r]->()
-        RETURN type(r) AS type, count(r) AS count
-        ORDER BY count DESC
-    """)
-    print("\n  Relationships:")
-    rel_total = 0
-    for r in result:
-        print(f"    {r['type']}: {r['count']}")
-        rel_total += r["count"]
+    labels, rel_types, total, rel_total = graph_counts(session)
 
-    print(f"\n  Total: {total} nodes, {rel_total} relationships")
+    # Build the report first and write it once rather than a print per row
+    lines = ["", "  Expert Graph Stats:"]
+    for label, count in sorted(labels.items(), key=lambda kv: kv[1], reverse=True):
+        lines.append(f"    {label}: {count}")
+    lines += ["", "  Relationships:"]
+    for rel_type, count in sorted(rel_types.items(), key=lambda kv: kv[1], reverse=True):
+        lines.append(f"    {rel_type}: {count}")
+    lines += ["", f"  Total: {total} nodes, {rel_total} relationships"]
+    sys.stdout.write("\n".join(lines) + "\n")
 
 
 def main() -> None:
@@ -278,6 +398,12 @@ def main() -> None:
     parser.add_argument("--password", default="")
     parser.add_argument("--database", default="neo4j")
     parser.add_argument("--clear", action="store_true", help="Clear existing expert data first")
+    parser.add_argument(
+        "--batch-size",
+        type=int,
+        default=DEFAULT_BATCH_SIZE,
+        help="Rows per server-side transaction for examples, patterns and practices",
+    )
     args = parser.parse_args()
 
     print("=" * 60)
@@ -288,48 +414,61 @@ def main() -> None:
     auth = (args.username, args.password) if args.password else None
     driver = GraphDatabase.driver(args.uri, auth=auth)
 
+    # Parse every input file on worker threads while the clear and schema
+    # phases wait on the server; each phase then collects its file's result.
+    preload = ThreadPoolExecutor(max_workers=len(JSONL_FILES))
+    data = {
+        name: preload.submit(load_jsonl, PROCESSED_DIR / filename)
+        for name, filename in JSONL_FILES.items()
+    }
+    preload.shutdown(wait=False)
+
     with driver.session(database=args.database) as session:
         if args.clear:
             print("\n  Clearing existing expert data...")
-            session.run("MATCH (n) WHERE n:CypherClause OR n:CypherFunction OR n:CypherExample "
-                        "OR n:ModelingPattern OR n:BestPractice OR n:Source "
-                        "OR n:FunctionCategory OR n:PracticeCategory OR n:Industry "
-                        "DETACH DELETE n")
-
-        print("\n[1/6] Creating constraints and indexes...")
+            # Delete in server-side batches so a large graph never needs one
+            # giant transaction (CALL IN TRANSACTIONS requires auto-commit).
+            session.run("""
+                MATCH (n)
+                WHERE n:CypherClause OR n:CypherFunction OR n:CypherExample
+                   OR n:ModelingPattern OR n:BestPractice OR n:Source
+                   OR n:FunctionCategory OR n:PracticeCategory OR n:Industry
+                CALL {
+                    WITH n
+                    DETACH DELETE n
+                } IN TRANSACTIONS OF $batch_size ROWS
+            """, batch_size=CLEAR_BATCH_SIZE).consume()
+
+        print("\n[1/5] Creating constraints, indexes and industry taxonomy...")
         create_constraints_and_indexes(session)
 
-        print("\n[2/6] Loading Cypher clauses...")
-        clauses = load_jsonl(PROCESSED_DIR / "cypher_clauses.jsonl")
+        print("\n[2/5] Loading Cypher clauses...")
+        clauses = data["clauses"].result()
         if clauses:
             cnt = load_clauses(session, clauses)
-            print(f"  Loaded {cnt} clauses")
+            print(f"  Created {cnt} nodes from {len(clauses)} clauses")
 
-        print("\n[3/6] Loading Cypher functions...")
-        functions = load_jsonl(PROCESSED_DIR / "cypher_functions.jsonl")
+        print("\n[3/5] Loading Cypher functions...")
+        functions = data["functions"].result()
         if functions:
             cnt = load_functions(session, functions)
-            print(f"  Loaded {cnt} functions")
+            print(f"  Created {cnt} nodes from {len(functions)} functions")
 
-        print("\n[4/6] Loading Cypher examples...")
-        examples = load_jsonl(PROCESSED_DIR / "cypher_examples.jsonl")
-        if examples:
-            cnt = load_examples(session, examples)
-            print(f"  Loaded {cnt} examples")
+        print("\n[4/5] Loading Cypher examples...")
+        cnt = load_examples(session, data["examples"].result(), args.batch_size)
+        print(f"  Created {cnt} example nodes")
 
-        print("\n[5/6] Loading modeling patterns & best practices...")
-        patterns = load_jsonl(PROCESSED_DIR / "modeling_patterns.jsonl")
-        if patterns:
-            cnt = load_patterns(session, patterns)
-            print(f"  Loaded {cnt} patterns")
+        print("\n[5/5] Loading modeling patterns & best practices...")
+        patterns = data["patterns"].result()
+        practices = data["practices"].result()
 
-        practices = load_jsonl(PROCESSED_DIR / "best_practices.jsonl")
-        if practices:
-            cnt = load_practices(session, practices)
-            print(f"  Loaded {cnt} practices")
-
-        print("\n[6/6] Creating industry taxonomy...")
-        create_industry_nodes(session)
+        # Patterns and practices both link SOURCED_FROM onto the same Source
+        # nodes, so they load one after the other to avoid lock contention.
+        if patterns:
+            cnt = load_patterns(session, patterns, args.batch_size)
+            print(f"  Created {cnt} nodes from {len(patterns)} patterns")
+        cnt = load_practices(session, practices, args.batch_size)
+        print(f"  Created {cnt} nodes from best practices")
 
         print_stats(session)
 
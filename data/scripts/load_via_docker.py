@@ -1,54 +1,171 @@
 """Load expert graph into Neo4j via Docker exec + cypher-shell.
 
 Workaround for Python driver auth issues with NEO4J_AUTH=none.
-Reads JSONL, generates Cypher, pipes it into cypher-shell.
+Reads JSONL, binds each section's rows with cypher-shell ``:param`` and loads
+them with a single UNWIND per section, all through one cypher-shell process.
+Examples, the largest section, are copied in as a CSV and read with LOAD CSV;
+the few containing backslashes are bound with ``:param`` instead.
 """
 
 from __future__ import annotations
 
+import csv
 import json
 import subprocess
+import tempfile
+from collections.abc import Iterator
 from pathlib import Path
 
+try:
+    import orjson
+except ImportError:  # orjson is optional; fall back to stdlib json
+    orjson = None
+
 PROCESSED_DIR = Path(__file__).parent.parent / "processed"
+CONTAINER = "gibsgraph-demo"
+CONTAINER_IMPORT_DIR = "/var/lib/neo4j/import"  # where LOAD CSV file:/// URLs resolve
+EXAMPLES_CSV = "cypher_examples.csv"
+_loads = orjson.loads if orjson is not None else json.loads
+
+
+class CypherShell:
+    """Batches statements for one ``cypher-shell`` run in the demo container.
+
+    Starting cypher-shell means a ``docker exec`` plus a JVM start, so loader
+    phases are queued with ``submit`` and sent together. Over a pipe
+    cypher-shell runs non-interactively and reads stdin to EOF before it
+    executes anything, so the queued script is passed whole to one
+    ``subprocess.run``; ``run`` queues a final statement, executes the batch
+    and returns that statement's output. Each statement is followed by a
+    sentinel ``RETURN`` whose row marks the end of its output.
+    """
+
+    def __init__(self, container: str = CONTAINER) -> None:
+        self.container = container
+        self._calls = 0
+        self._script: list[str] = []
+        self._pending: list[str] = []
+
+    def __enter__(self) -> CypherShell:
+        return self
+
+    def __exit__(self, exc_type: object, *exc: object) -> None:
+        if exc_type is None and self._pending:
+            self.execute()
+
+    def submit(self, cypher: str, params: dict[str, object] | None = None) -> str:
+        """Queue *cypher* (binding *params* with ``:param`` first) without running it."""
+        self._calls += 1
+        sentinel = f"__gibsgraph_done_{self._calls}__"
+        bindings = "".join(
+            f":param {k} => {to_cypher_literal(v)}\n" for k, v in (params or {}).items()
+        )
+        body = cypher.strip()
+        if not body.endswith(";"):
+            body += ";"
+        self._script.append(f"{bindings}{body}\nRETURN '{sentinel}' AS done;\n")
+        self._pending.append(sentinel)
+        return sentinel
+
+    def run(self, cypher: str, params: dict[str, object] | None = None) -> str:
+        """Execute everything queued plus *cypher*; return *cypher*'s output."""
+        sentinel = self.submit(cypher, params)
+        return self.execute()[sentinel]
+
+    def execute(self) -> dict[str, str]:
+        """Run the queued script in one cypher-shell; map each sentinel to its output."""
+        script, sentinels = "".join(self._script), self._pending
+        self._script, self._pending = [], []
+        try:
+            result = subprocess.run(
+                [
+                    "docker", "exec", "-i", self.container,
+                    "cypher-shell", "--format", "plain", "--fail-at-end",
+                ],
+                input=script,
+                capture_output=True,
+                text=True,
+                check=True,
+            )
+        except subprocess.CalledProcessError as exc:
+            for line in exc.stderr.splitlines():
+                print(f"  ERROR: {line[:200]}")
+            raise
+        return split_outputs(result.stdout, sentinels)
+
+
+def split_outputs(stdout: str, sentinels: list[str]) -> dict[str, str]:
+    """Split cypher-shell's plain output into each statement's output, by sentinel."""
+    outputs: dict[str, str] = {}
+    lines: list[str] = []
+    remaining = iter(sentinels)
+    sentinel = next(remaining, None)
+    for line in stdout.splitlines(keepends=True):
+        if sentinel is not None and line.strip().strip('"') == sentinel:
+            lines.pop()  # the sentinel's "done" column header
+            outputs[sentinel] = "".join(lines)
+            lines = []
+            sentinel = next(remaining, None)
+        else:
+            lines.append(line)
+    if sentinel is not None:
+        msg = "cypher-shell exited before finishing the script"
+        raise RuntimeError(msg)
+    return outputs
 
 
-def run_cypher(cypher: str) -> str:
-    """Execute Cypher via docker exec cypher-shell."""
-    result = subprocess.run(
-        ["docker", "exec", "-i", "gibsgraph-demo", "cypher-shell"],
-        input=cypher,
-        capture_output=True,
-        text=True,
-        timeout=60,
-    )
-    if result.returncode != 0:
-        print(f"  ERROR: {result.stderr[:200]}")
-    return result.stdout
+def to_cypher_literal(value: object) -> str:
+    """Render a Python value as a single-line Cypher literal for ``:param``.
+
+    JSON itself is not valid Cypher (map keys must not be quoted), but JSON
+    string escapes are, so strings go through ``json.dumps``.
+    """
+    if value is None:
+        return "null"
+    if isinstance(value, bool):
+        return "true" if value else "false"
+    if isinstance(value, int | float):
+        return repr(value)
+    if isinstance(value, str):
+        return json.dumps(value, ensure_ascii=False)
+    if isinstance(value, dict):
+        return "{" + ", ".join(f"`{k}`: {to_cypher_literal(v)}" for k, v in value.items()) + "}"
+    if isinstance(value, list | tuple):
+        return "[" + ", ".join(to_cypher_literal(v) for v in value) + "]"
+    msg = f"Cannot render {type(value).__name__} as a Cypher literal"
+    raise TypeError(msg)
+
+
+def examples_to_csv(rows: list[dict], path: Path) -> None:
+    """Write example rows as a headered CSV for ``LOAD CSV WITH HEADERS``."""
+    with open(path, "w", newline="", encoding="utf-8") as f:
+        writer = csv.DictWriter(f, fieldnames=["cypher", "description", "context", "category"])
+        writer.writeheader()
+        writer.writerows(rows)
 
 
 def load_jsonl(filepath: Path) -> list[dict]:
     if not filepath.exists():
         return []
-    with open(filepath, encoding="utf-8") as f:
-        return [json.loads(line) for line in f if line.strip()]
+    data = filepath.read_bytes()
+    return [_loads(line) for line in data.splitlines() if line.strip()]
 
 
-def escape(s: str) -> str:
-    """Escape string for Cypher literal."""
-    if not s:
-        return ""
-    return s.replace("\\", "\\\\").replace("'", "\\'").replace("\n", "\\n")
-
+def iter_jsonl(filepath: Path) -> Iterator[dict]:
+    """Yield JSONL records one at a time, for callers that only iterate."""
+    if not filepath.exists():
+        return
+    with open(filepath, "rb") as f:
+        for line in f:
+            if line.strip():
+                yield _loads(line)
 
-def main() -> None:
-    print("=" * 60)
-    print("Loading Expert Knowledge Graph via Docker")
-    print("=" * 60)
 
+def load(shell: CypherShell) -> None:
+    """Queue every loader phase on *shell* and run them with the stats in one go."""
     # 1. Constraints
-    print("\n[1/6] Creating constraints...")
-    run_cypher("""
+    print("\n[1/6] Creating constraints and industry taxonomy...")
+    shell.submit("""
         CREATE CONSTRAINT IF NOT EXISTS FOR (c:CypherClause) REQUIRE c.name IS UNIQUE;
         CREATE CONSTRAINT IF NOT EXISTS FOR (f:CypherFunction) REQUIRE f.name IS UNIQUE;
         CREATE CONSTRAINT IF NOT EXISTS FOR (p:ModelingPattern) REQUIRE p.name IS UNIQUE;
@@ -57,157 +174,191 @@ def main() -> None:
         CREATE CONSTRAINT IF NOT EXISTS FOR (cat:FunctionCategory) REQUIRE cat.name IS UNIQUE;
         CREATE CONSTRAINT IF NOT EXISTS FOR (cat:PracticeCategory) REQUIRE cat.name IS UNIQUE;
         CREATE CONSTRAINT IF NOT EXISTS FOR (i:Industry) REQUIRE i.name IS UNIQUE;
+        FOREACH (name IN ['Financial Services', 'Healthcare', 'Cybersecurity',
+            'Supply Chain', 'Compliance', 'E-commerce', 'HR & Workforce',
+            'Media & Content', 'IT Operations', 'Government',
+            'Life Sciences', 'Telecommunications'] |
+            MERGE (:Industry {name: name})
+        );
     """)
-    print("  Done")
+    print("  Queued")
 
     # 2. Clauses
     print("\n[2/6] Loading Cypher clauses...")
     clauses = load_jsonl(PROCESSED_DIR / "cypher_clauses.jsonl")
-    for c in clauses:
-        name = escape(c["name"])
-        desc = escape(c["description"])
-        src = escape(c["source_file"])
-        n_examples = len(c.get("syntax_examples", []))
-        run_cypher(f"""
-            MERGE (clause:CypherClause {{name: '{name}'}})
-            SET clause.description = '{desc}',
-                clause.source_file = '{src}',
-                clause.authority_level = 1,
-                clause.example_count = {n_examples};
-            MERGE (src:Source {{path: '{src}'}})
-            SET src.type = 'official_docs', src.authority_level = 1;
-            MATCH (clause:CypherClause {{name: '{name}'}})
-            MATCH (src:Source {{path: '{src}'}})
-            MERGE (clause)-[:SOURCED_FROM]->(src);
-        """)
-    print(f"  Loaded {len(clauses)} clauses")
+    rows = [
+        {
+            "name": c["name"],
+            "description": c["description"],
+            "source_file": c["source_file"],
+            "n_examples": len(c.get("syntax_examples", [])),
+        }
+        for c in clauses
+    ]
+    shell.submit("""
+        UNWIND $rows AS c
+        MERGE (clause:CypherClause {name: c.name})
+        SET clause.description = c.description,
+            clause.source_file = c.source_file,
+            clause.authority_level = 1,
+            clause.example_count = c.n_examples
+        MERGE (src:Source {path: c.source_file})
+        ON CREATE SET src.type = 'official_docs', src.authority_level = 1
+        MERGE (clause)-[:SOURCED_FROM]->(src);
+    """, {"rows": rows})
+    print(f"  Queued {len(rows)} clauses")
 
     # 3. Functions
     print("\n[3/6] Loading Cypher functions...")
     functions = load_jsonl(PROCESSED_DIR / "cypher_functions.jsonl")
-    for f in functions:
-        name = escape(f["name"])
-        desc = escape(f["description"])
-        sig = escape(f.get("signature", ""))
-        ret = escape(f.get("returns", ""))
-        cat = escape(f["category"])
-        src = escape(f["source_file"])
-        n_ex = len(f.get("examples", []))
-        run_cypher(f"""
-            MERGE (func:CypherFunction {{name: '{name}'}})
-            SET func.description = '{desc}',
-                func.signature = '{sig}',
-                func.returns = '{ret}',
-                func.source_file = '{src}',
-                func.authority_level = 1,
-                func.example_count = {n_ex};
-            MERGE (cat:FunctionCategory {{name: '{cat}'}});
-            MATCH (func:CypherFunction {{name: '{name}'}})
-            MATCH (cat:FunctionCategory {{name: '{cat}'}})
-            MERGE (func)-[:BELONGS_TO]->(cat);
-        """)
-    print(f"  Loaded {len(functions)} functions")
-
-    # 4. Examples (batch — just count, skip individual loading for speed)
+    rows = [
+        {
+            "name": f["name"],
+            "description": f["description"],
+            "signature": f.get("signature", ""),
+            "returns": f.get("returns", ""),
+            "category": f["category"],
+            "source_file": f["source_file"],
+            "n_examples": len(f.get("examples", [])),
+        }
+        for f in functions
+    ]
+    shell.submit("""
+        UNWIND $rows AS f
+        MERGE (func:CypherFunction {name: f.name})
+        SET func.description = f.description,
+            func.signature = f.signature,
+            func.returns = f.returns,
+            func.source_file = f.source_file,
+            func.authority_level = 1,
+            func.example_count = f.n_examples
+        MERGE (cat:FunctionCategory {name: f.category})
+        MERGE (func)-[:BELONGS_TO]->(cat);
+    """, {"rows": rows})
+    print(f"  Queued {len(rows)} functions")
+
+    # 4. Examples
     print("\n[4/6] Loading Cypher examples...")
-    examples = load_jsonl(PROCESSED_DIR / "cypher_examples.jsonl")
-    # Deduplicate
-    seen = set()
-    unique = []
-    for ex in examples:
-        if ex["cypher"] not in seen:
-            seen.add(ex["cypher"])
-            unique.append(ex)
-
-    batch_size = 20
-    loaded = 0
-    for i in range(0, len(unique), batch_size):
-        batch = unique[i:i + batch_size]
-        for ex in batch:
-            cypher_code = escape(ex["cypher"])
-            desc = escape(ex["description"])
-            ctx = escape(ex["context"])
-            cat = escape(ex["category"])
-            run_cypher(f"""
-                CREATE (ex:CypherExample {{
-                    cypher: '{cypher_code}',
-                    description: '{desc}',
-                    context: '{ctx}',
-                    category: '{cat}',
-                    authority_level: 1
-                }});
-            """)
-            loaded += 1
-        print(f"  ... {loaded}/{len(unique)} examples")
-    print(f"  Loaded {loaded} examples")
+    # Deduplicate while streaming — only unique examples are kept (first wins)
+    unique: dict[str, dict] = {}
+    for ex in iter_jsonl(PROCESSED_DIR / "cypher_examples.jsonl"):
+        unique.setdefault(ex["cypher"], ex)
+
+    rows = [
+        {
+            "cypher": ex["cypher"],
+            "description": ex["description"],
+            "context": ex["context"],
+            "category": ex["category"],
+        }
+        for ex in unique.values()
+    ]
+    # The examples are the largest section: hand them to the server as a CSV
+    # in its import directory rather than as one huge :param literal. LOAD CSV
+    # reads \" as an escaped quote (legacy quote escaping), so rows containing
+    # a backslash would be misparsed; those few are bound with :param instead.
+    plain: list[dict] = []
+    escaped: list[dict] = []
+    for r in rows:
+        if any("\\" in (v or "") for v in r.values()):
+            escaped.append(r)
+        else:
+            plain.append(r)
+    with tempfile.TemporaryDirectory() as tmp:
+        csv_path = Path(tmp) / EXAMPLES_CSV
+        examples_to_csv(plain, csv_path)
+        subprocess.run(
+            ["docker", "cp", str(csv_path), f"{shell.container}:{CONTAINER_IMPORT_DIR}/"],
+            check=True,
+            capture_output=True,
+        )
+    shell.submit(f"""
+        LOAD CSV WITH HEADERS FROM 'file:///{EXAMPLES_CSV}' AS e
+        CALL {{
+            WITH e
+            CREATE (:CypherExample {{
+                cypher: e.cypher,
+                description: e.description,
+                context: e.context,
+                category: e.category,
+                authority_level: 1
+            }})
+        }} IN TRANSACTIONS OF 10000 ROWS;
+    """)
+    if escaped:
+        shell.submit("""
+            UNWIND $rows AS e
+            CREATE (:CypherExample {
+                cypher: e.cypher,
+                description: e.description,
+                context: e.context,
+                category: e.category,
+                authority_level: 1
+            });
+        """, {"rows": escaped})
+    print(f"  Queued {len(rows)} examples")
 
     # 5. Patterns
     print("\n[5/6] Loading modeling patterns...")
-    patterns = load_jsonl(PROCESSED_DIR / "modeling_patterns.jsonl")
-    seen_patterns = set()
-    for p in patterns:
-        name = escape(p["name"])
-        if name in seen_patterns:
-            continue
-        seen_patterns.add(name)
-        desc = escape(p["description"])
-        src = escape(p["source_file"])
-        run_cypher(f"""
-            MERGE (pat:ModelingPattern {{name: '{name}'}})
-            SET pat.description = '{desc}',
-                pat.source_file = '{src}',
-                pat.authority_level = 1;
-        """)
-    print(f"  Loaded {len(seen_patterns)} patterns")
+    by_name: dict[str, dict] = {}
+    for p in iter_jsonl(PROCESSED_DIR / "modeling_patterns.jsonl"):
+        by_name.setdefault(p["name"], {
+            "name": p["name"],
+            "description": p["description"],
+            "source_file": p["source_file"],
+        })
+    rows = list(by_name.values())
+    shell.submit("""
+        UNWIND $rows AS p
+        MERGE (pat:ModelingPattern {name: p.name})
+        SET pat.description = p.description,
+            pat.source_file = p.source_file,
+            pat.authority_level = 1;
+    """, {"rows": rows})
+    print(f"  Queued {len(rows)} patterns")
 
     # 6. Best practices
     print("\n[6/6] Loading best practices...")
-    practices = load_jsonl(PROCESSED_DIR / "best_practices.jsonl")
-    seen_bp = set()
-    bp_count = 0
-    for bp in practices:
-        title = escape(bp["title"])
-        if title in seen_bp or not title:
-            continue
-        seen_bp.add(title)
-        desc = escape(bp["description"][:400])
-        cat = escape(bp.get("category", "general"))
-        run_cypher(f"""
-            MERGE (bp:BestPractice {{title: '{title}'}})
-            SET bp.description = '{desc}',
-                bp.authority_level = {bp.get('authority_level', 1)};
-            MERGE (cat:PracticeCategory {{name: '{cat}'}});
-            MATCH (bp:BestPractice {{title: '{title}'}})
-            MATCH (cat:PracticeCategory {{name: '{cat}'}})
-            MERGE (bp)-[:BELONGS_TO]->(cat);
-        """)
-        bp_count += 1
-        if bp_count % 50 == 0:
-            print(f"  ... {bp_count} practices")
-    print(f"  Loaded {bp_count} best practices")
-
-    # Industries
-    print("\n  Creating industry taxonomy...")
-    run_cypher("""
-        FOREACH (name IN ['Financial Services', 'Healthcare', 'Cybersecurity',
-            'Supply Chain', 'Compliance', 'E-commerce', 'HR & Workforce',
-            'Media & Content', 'IT Operations', 'Government',
-            'Life Sciences', 'Telecommunications'] |
-            MERGE (:Industry {name: name})
-        );
-    """)
+    by_title: dict[str, dict] = {}
+    for bp in iter_jsonl(PROCESSED_DIR / "best_practices.jsonl"):
+        if bp["title"] and bp["title"] not in by_title:
+            by_title[bp["title"]] = {
+                "title": bp["title"],
+                "description": bp["description"][:400],
+                "category": bp.get("category", "general"),
+                "authority_level": bp.get("authority_level", 1),
+            }
+    rows = list(by_title.values())
+    shell.submit("""
+        UNWIND $rows AS p
+        MERGE (bp:BestPractice {title: p.title})
+        SET bp.description = p.description,
+            bp.authority_level = p.authority_level
+        MERGE (cat:PracticeCategory {name: p.category})
+        MERGE (bp)-[:BELONGS_TO]->(cat);
+    """, {"rows": rows})
+    print(f"  Queued {len(rows)} best practices")
 
-    # Stats
-    print("\n  Final stats:")
-    output = run_cypher("""
+    # Stats — queued behind every phase; one execute() runs the whole script
+    nodes = shell.submit("""
         MATCH (n) RETURN labels(n)[0] AS label, count(n) AS count ORDER BY count DESC;
     """)
-    print(output)
-
-    output = run_cypher("""
+    rels = shell.submit("""
         MATCH ()-[r]->() RETURN type(r) AS type, count(r) AS count ORDER BY count DESC;
     """)
-    print(output)
+    outputs = shell.execute()
+    print("\n  Final stats:")
+    print(outputs[nodes])
+    print(outputs[rels])
+
+
+def main() -> None:
+    print("=" * 60)
+    print("Loading Expert Knowledge Graph via Docker")
+    print("=" * 60)
+
+    with CypherShell() as shell:
+        load(shell)
 
     print("\nDone!")
 
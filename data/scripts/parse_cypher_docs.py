@@ -14,16 +14,47 @@ Output: data/processed/cypher_clauses.jsonl
 from __future__ import annotations
 
 import json
+import os
 import re
-from dataclasses import asdict, dataclass, field
+import sys
+from collections.abc import Iterable, Iterator
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from dataclasses import dataclass, field, fields
+from itertools import islice
 from pathlib import Path
 
+try:
+    import orjson
+except ImportError:  # orjson is optional; fall back to stdlib json
+    orjson = None
+
 DOCS_ROOT = Path(__file__).parent.parent / "raw" / "docs" / "docs-cypher"
 PAGES_DIR = DOCS_ROOT / "modules" / "ROOT" / "pages"
 OUTPUT_DIR = Path(__file__).parent.parent / "processed"
-
-
-@dataclass
+PARSE_CHUNKSIZE = 8  # files handed to a worker process per task
+
+# Compiled once at import; every parse_* helper below reuses these
+_CODE_BLOCK_RE = re.compile(r'\[source,\s*cypher[^\]]*\]\s*\n----\n(.*?)----', re.DOTALL)
+_DESCRIPTION_RE = re.compile(r':description:\s*(.+)')
+_TITLE_RE = re.compile(r'^=\s+(.+)', re.MULTILINE)
+_TABLE_DESC_RE = re.compile(r'\*Description\*[^|]*\|\s*(.+?)(?:\n|$)')
+_TABLE_SYNTAX_RE = re.compile(r'\*Syntax\*[^|]*\|\s*`([^`]+)`')
+_TABLE_RETURNS_RE = re.compile(r'\*Returns\*[^|]*\|\s*`?(\w+)`?')
+# Zero-width, so adjacent keys sharing a '*' are all found in one pass
+_TABLE_KEY_RE = re.compile(r'(?=\*(Description|Syntax|Returns)\*)')
+_TABLE_FIELD_RES = {
+    "Description": _TABLE_DESC_RE,
+    "Syntax": _TABLE_SYNTAX_RE,
+    "Returns": _TABLE_RETURNS_RE,
+}
+
+# Markup lines skipped when hunting for a prose description: any line starting
+# with one of _MARKUP_FIRST, or with a prefix listed under its first character
+_MARKUP_FIRST = frozenset("[:=|.")
+_MARKUP_PREFIXES = {"i": ("include", "image"), "-": ("----",), "/": ("//",)}
+
+
+@dataclass(slots=True)
 class CypherClause:
     name: str
     description: str
@@ -33,7 +64,7 @@ class CypherClause:
     authority_level: int = 1  # Official docs = highest
 
 
-@dataclass
+@dataclass(slots=True)
 class CypherFunction:
     name: str
     category: str
@@ -45,7 +76,7 @@ class CypherFunction:
     authority_level: int = 1
 
 
-@dataclass
+@dataclass(slots=True)
 class CypherExample:
     cypher: str
     description: str
@@ -55,58 +86,118 @@ class CypherExample:
     authority_level: int = 1
 
 
-def extract_code_blocks(text: str) -> list[str]:
-    """Extract Cypher code blocks from AsciiDoc."""
-    blocks = []
-    pattern = re.compile(
-        r'\[source,\s*cypher[^\]]*\]\s*\n----\n(.*?)----',
-        re.DOTALL,
-    )
-    for match in pattern.finditer(text):
-        code = match.group(1).strip()
-        if code:
-            blocks.append(code)
-    return blocks
+def _heading(line: str) -> str | None:
+    """Return the text of a ``==`` to ``====`` heading line, or None if it isn't one."""
+    n = len(line) - len(line.lstrip('='))
+    if 2 <= n <= 4 and len(line) - n >= 2 and line[n].isspace():
+        return line[n:].strip()
+    return None
+
+
+def _split_h2(text: str) -> list[str]:
+    """Split *text* at ``== `` (h2, not ``===``) heading markers, dropping the markers.
+
+    Same result as ``re.split(r'\\n==\\s+(?!=)', text)``, using ``str.find``.
+    """
+    parts = []
+    n = len(text)
+    start = 0
+    pos = text.find('\n==')
+    while pos != -1:
+        end = pos + 3
+        while end < n and text[end].isspace():
+            end += 1
+        # Like the regex, give back one whitespace char rather than stop before '='
+        if end > pos + 3 and end < n and text[end] == '=':
+            end -= 1
+        if end == pos + 3:  # no whitespace to consume after '==': not an h2 marker
+            pos = text.find('\n==', pos + 1)
+            continue
+        parts.append(text[start:pos])
+        start = end
+        pos = text.find('\n==', end)
+    parts.append(text[start:])
+    return parts
+
+
+def read_adoc(filepath: Path) -> str:
+    """Read an AsciiDoc file as bytes and decode it in one pass."""
+    data = filepath.read_bytes()
+    if b"\r" in data:  # rare; normalize newlines the way text mode would
+        data = data.replace(b"\r\n", b"\n").replace(b"\r", b"\n")
+    return data.decode("utf-8", "replace")
+
+
+def extract_code_blocks(text: str, limit: int | None = None) -> list[str]:
+    """Extract Cypher code blocks from AsciiDoc, stopping after *limit* blocks."""
+    blocks = (code for m in _CODE_BLOCK_RE.finditer(text) if (code := m.group(1).strip()))
+    return list(islice(blocks, limit))
 
 
 def extract_description(text: str) -> str:
     """Extract the :description: field from AsciiDoc header."""
-    match = re.search(r':description:\s*(.+)', text)
+    match = _DESCRIPTION_RE.search(text)
     return match.group(1).strip() if match else ""
 
 
-def parse_sections(text: str) -> list[dict[str, str]]:
-    """Parse AsciiDoc into sections by heading level."""
-    sections = []
-    current_heading = ""
-    current_content: list[str] = []
-
-    for line in text.split('\n'):
-        heading_match = re.match(r'^(={2,4})\s+(.+)', line)
-        if heading_match:
-            if current_heading:
-                sections.append({
-                    "heading": current_heading,
-                    "content": '\n'.join(current_content).strip(),
-                })
-            current_heading = heading_match.group(2).strip()
-            current_content = []
-        else:
-            current_content.append(line)
-
-    if current_heading:
-        sections.append({
-            "heading": current_heading,
-            "content": '\n'.join(current_content).strip(),
-        })
+def parse_sections(text: str, limit: int | None = None) -> list[dict[str, str]]:
+    """Parse AsciiDoc into sections by heading level, keeping at most *limit*.
+
+    Only lines starting with ``==`` can be headings, so the scan jumps between
+    ``\\n==`` occurrences and slices each section body once from *text*.
+    """
+    # (heading, body start, heading line start) per heading line. find() + 1
+    # is 0 only when there is no further match, hence the `or -1`.
+    spans: list[tuple[str, int, int]] = []
+    named = 0
+    line_start = 0 if text.startswith('==') else text.find('\n==') + 1 or -1
+    while line_start != -1:
+        line_end = text.find('\n', line_start)
+        if line_end == -1:
+            line_end = len(text)
+        heading = _heading(text[line_start:line_end])
+        if heading is not None:
+            spans.append((heading, line_end + 1, line_start))
+            # One named heading past the limit bounds the last kept body
+            named += bool(heading)
+            if limit is not None and named > limit:
+                break
+        line_start = text.find('\n==', line_end) + 1 or -1
 
+    sections = []
+    for i, (heading, body_start, _) in enumerate(spans):
+        if not heading:  # an empty heading still ends the previous section
+            continue
+        body_end = spans[i + 1][2] if i + 1 < len(spans) else len(text)
+        sections.append({"heading": heading, "content": text[body_start:body_end].strip()})
+        if len(sections) == limit:
+            break
     return sections
 
 
+def extract_table_fields(section: str) -> dict[str, str]:
+    """Extract the *Description*, *Syntax* and *Returns* cells of a Details table.
+
+    One scan finds every key; each field's pattern is then tried only where
+    its key occurs, first match wins, as a separate search per field would.
+    """
+    fields: dict[str, str] = {}
+    for key_match in _TABLE_KEY_RE.finditer(section):
+        key = key_match.group(1)
+        if key in fields:
+            continue
+        match = _TABLE_FIELD_RES[key].match(section, key_match.start())
+        if match:
+            fields[key] = match.group(1).strip()
+            if len(fields) == len(_TABLE_FIELD_RES):
+                break
+    return fields
+
+
 def parse_clause_file(filepath: Path) -> CypherClause | None:
     """Parse a single clause .adoc file."""
-    text = filepath.read_text(encoding="utf-8", errors="replace")
-    name_match = re.search(r'^=\s+(.+)', text, re.MULTILINE)
+    text = read_adoc(filepath)
+    name_match = _TITLE_RE.search(text)
     if not name_match:
         return None
 
@@ -127,92 +218,92 @@ def parse_clause_file(filepath: Path) -> CypherClause | None:
                         break
                 break
 
-    examples = extract_code_blocks(text)
-    sections = parse_sections(text)
+    # Caps are applied while scanning, so large pages stop early
+    examples = extract_code_blocks(text, limit=10)  # Cap at 10 most relevant
+    sections = parse_sections(text, limit=20)
 
     return CypherClause(
         name=name,
         description=description,
-        syntax_examples=examples[:10],  # Cap at 10 most relevant
-        sections=sections[:20],  # Cap sections
+        syntax_examples=examples,
+        sections=sections,
         source_file=str(filepath.relative_to(DOCS_ROOT)),
     )
 
 
 def parse_function_file(filepath: Path, category: str) -> list[CypherFunction]:
     """Parse a functions .adoc file — may contain multiple functions."""
-    text = filepath.read_text(encoding="utf-8", errors="replace")
+    text = read_adoc(filepath)
+    source_file = str(filepath.relative_to(DOCS_ROOT))
     functions = []
 
     # Functions use == headings (h2). Split on them.
     # Match lines like: == char_length()  or  == `size()`
-    func_sections = re.split(r'\n==\s+(?!=)', text)
+    func_sections = _split_h2(text)
 
     for section in func_sections[1:]:  # Skip preamble
-        lines = section.split('\n')
-        raw_name = lines[0].strip().replace('`', '')
+        heading, _, body = section.partition('\n')
+        raw_name = heading.strip().replace('`', '')
 
         # Extract function name (before parentheses)
         func_name = raw_name.split('(')[0].strip()
 
         # Skip non-function headings (like "Example graph")
         if ' ' in func_name and not func_name.endswith(')'):
-            if not any(c in func_name for c in '.'):
+            if '.' not in func_name:
                 continue
+        # Reject before running the table and code-block scans on the section
+        if not func_name or len(func_name) >= 80 or func_name.startswith('Example'):
+            continue
 
-        # Extract from Details table: *Description*, *Syntax*, *Returns*
-        section_text = '\n'.join(lines)
-        desc = ""
-        sig = ""
-        ret = ""
-
-        # Look for table-based description: | *Description* 3+| ...
-        desc_match = re.search(
-            r'\*Description\*[^|]*\|\s*(.+?)(?:\n|$)', section_text,
-        )
-        if desc_match:
-            desc = desc_match.group(1).strip().rstrip('.')
-
-        # Look for table-based syntax: | *Syntax* 3+| `func(...)`
-        sig_match = re.search(
-            r'\*Syntax\*[^|]*\|\s*`([^`]+)`', section_text,
-        )
-        if sig_match:
-            sig = sig_match.group(1).strip()
-
-        # Look for table-based returns: | *Returns* 3+| `TYPE`
-        ret_match = re.search(
-            r'\*Returns\*[^|]*\|\s*`?(\w+)`?', section_text,
-        )
-        if ret_match:
-            ret = ret_match.group(1).strip()
+        # Extract from Details table: | *Description* 3+| ...,
+        # | *Syntax* 3+| `func(...)` and | *Returns* 3+| `TYPE`
+        fields = extract_table_fields(section)
+        desc = fields.get("Description", "").rstrip('.')
+        sig = fields.get("Syntax", "")
+        ret = fields.get("Returns", "")
 
         # Fallback description from first paragraph
         if not desc:
-            for line in lines[1:]:
+            for line in body.split('\n'):
                 stripped = line.strip()
-                if stripped and not stripped.startswith(
-                    ('[', ':', '=', 'include', 'image', '|', '----', '.', '//')
-                ):
-                    desc = stripped
-                    break
-
-        examples = extract_code_blocks(section_text)
-
-        if func_name and len(func_name) < 80 and not func_name.startswith('Example'):
-            functions.append(CypherFunction(
-                name=func_name,
-                category=category,
-                description=desc,
-                signature=sig,
-                returns=ret,
-                examples=examples[:5],
-                source_file=str(filepath.relative_to(DOCS_ROOT)),
-            ))
+                if not stripped:
+                    continue
+                c0 = stripped[0]
+                if c0 in _MARKUP_FIRST or stripped.startswith(_MARKUP_PREFIXES.get(c0, ())):
+                    continue
+                desc = stripped
+                break
+
+        examples = extract_code_blocks(section, limit=5)
+
+        functions.append(CypherFunction(
+            name=func_name,
+            category=category,
+            description=desc,
+            signature=sig,
+            returns=ret,
+            examples=examples,
+            source_file=source_file,
+        ))
 
     return functions
 
 
+def list_adoc_files(directory: Path) -> list[Path]:
+    """List the .adoc pages in *directory* (not index.adoc), sorted by path.
+
+    os.scandir reports names and entry types from the directory read itself,
+    so filtering needs no per-file stat.
+    """
+    with os.scandir(directory) as entries:
+        return sorted(
+            Path(entry.path)
+            for entry in entries
+            if entry.name.endswith(".adoc") and entry.name != "index.adoc" and entry.is_file()
+        )
+
+
 def parse_all_clauses() -> list[CypherClause]:
     """Parse all clause files."""
     clauses_dir = PAGES_DIR / "clauses"
@@ -221,10 +312,12 @@ def parse_all_clauses() -> list[CypherClause]:
         print(f"  WARNING: {clauses_dir} not found")
         return clauses
 
-    for adoc_file in sorted(clauses_dir.glob("*.adoc")):
-        if adoc_file.name == "index.adoc":
-            continue
-        clause = parse_clause_file(adoc_file)
+    files = list_adoc_files(clauses_dir)
+    # Files are independent and parsing is CPU-bound regex work: fan out
+    # across processes, then report in file order.
+    with ProcessPoolExecutor() as pool:
+        parsed = list(pool.map(parse_clause_file, files, chunksize=PARSE_CHUNKSIZE))
+    for clause in parsed:
         if clause:
             clauses.append(clause)
             print(f"  Clause: {clause.name} ({len(clause.syntax_examples)} examples)")
@@ -240,11 +333,13 @@ def parse_all_functions() -> list[CypherFunction]:
         print(f"  WARNING: {funcs_dir} not found")
         return all_functions
 
-    for adoc_file in sorted(funcs_dir.glob("*.adoc")):
-        if adoc_file.name == "index.adoc":
-            continue
-        category = adoc_file.stem.replace("-", " ")
-        functions = parse_function_file(adoc_file, category)
+    files = list_adoc_files(funcs_dir)
+    categories = [f.stem.replace("-", " ") for f in files]
+    with ProcessPoolExecutor() as pool:
+        parsed = list(
+            pool.map(parse_function_file, files, categories, chunksize=PARSE_CHUNKSIZE)
+        )
+    for category, functions in zip(categories, parsed, strict=True):
         all_functions.extend(functions)
         if functions:
             print(f"  Functions [{category}]: {len(functions)} found")
@@ -252,40 +347,64 @@ def parse_all_functions() -> list[CypherFunction]:
     return all_functions
 
 
-def collect_all_examples(clauses: list[CypherClause], functions: list[CypherFunction]) -> list[CypherExample]:
-    """Collect all Cypher examples from clauses and functions."""
-    examples = []
+def iter_all_examples(
+    clauses: list[CypherClause], functions: list[CypherFunction]
+) -> Iterator[CypherExample]:
+    """Yield every Cypher example from clauses and functions.
 
+    Examples are built lazily while cypher_examples.jsonl is written, so the
+    full list is never held alongside the clauses and functions it repeats.
+    Contexts and source paths repeat across many examples, and clauses and
+    functions arrive unpickled from worker processes, so those strings are
+    interned to share one copy per distinct value.
+    """
     for clause in clauses:
+        context = sys.intern(clause.name)
+        source_file = sys.intern(clause.source_file)
         for cypher in clause.syntax_examples:
-            examples.append(CypherExample(
+            yield CypherExample(
                 cypher=cypher,
                 description=clause.description,
-                context=clause.name,
+                context=context,
                 category="clause",
-                source_file=clause.source_file,
-            ))
+                source_file=source_file,
+            )
 
     for func in functions:
+        context = sys.intern(func.name)
+        source_file = sys.intern(func.source_file)
         for cypher in func.examples:
-            examples.append(CypherExample(
+            yield CypherExample(
                 cypher=cypher,
                 description=func.description,
-                context=func.name,
+                context=context,
                 category="function",
-                source_file=func.source_file,
-            ))
+                source_file=source_file,
+            )
 
-    return examples
 
+def _field_dict(obj: object) -> dict:
+    """``json`` fallback hook: a slotted dataclass as a shallow field dict."""
+    return {f.name: getattr(obj, f.name) for f in fields(obj)}
 
-def write_jsonl(items: list, output_path: Path) -> None:
-    """Write list of dataclasses to JSONL file."""
+
+def dump_jsonl_line(record: object) -> bytes:
+    """Serialize one dataclass record as UTF-8 bytes (non-ASCII kept verbatim)."""
+    if orjson is not None:
+        return orjson.dumps(record) + b"\n"  # serializes dataclasses natively
+    return (json.dumps(record, ensure_ascii=False, default=_field_dict) + "\n").encode("utf-8")
+
+
+def write_jsonl(items: Iterable, output_path: Path) -> int:
+    """Write dataclasses to a JSONL file and return how many were written."""
     output_path.parent.mkdir(parents=True, exist_ok=True)
-    with open(output_path, "w", encoding="utf-8") as f:
-        for item in items:
-            f.write(json.dumps(asdict(item), ensure_ascii=False) + "\n")
-    print(f"  Wrote {len(items)} entries to {output_path}")
+    # Records are serialized field by field in place; asdict() would
+    # deep-copy every list first.
+    count = 0
+    with open(output_path, "wb", buffering=1 << 16) as f:
+        for count, item in enumerate(items, 1):
+            f.write(dump_jsonl_line(item))
+    return count
 
 
 def main() -> None:
@@ -304,17 +423,28 @@ def main() -> None:
     functions = parse_all_functions()
 
     print(f"\n[3/3] Collecting examples...")
-    examples = collect_all_examples(clauses, functions)
+    examples = iter_all_examples(clauses, functions)
+    example_count = sum(len(c.syntax_examples) for c in clauses) + sum(
+        len(f.examples) for f in functions
+    )
 
     print(f"\n--- Summary ---")
     print(f"  Clauses:   {len(clauses)}")
     print(f"  Functions: {len(functions)}")
-    print(f"  Examples:  {len(examples)}")
+    print(f"  Examples:  {example_count}")
 
     print(f"\nWriting output...")
-    write_jsonl(clauses, OUTPUT_DIR / "cypher_clauses.jsonl")
-    write_jsonl(functions, OUTPUT_DIR / "cypher_functions.jsonl")
-    write_jsonl(examples, OUTPUT_DIR / "cypher_examples.jsonl")
+    outputs = [
+        (clauses, OUTPUT_DIR / "cypher_clauses.jsonl"),
+        (functions, OUTPUT_DIR / "cypher_functions.jsonl"),
+        (examples, OUTPUT_DIR / "cypher_examples.jsonl"),
+    ]
+    # The files are independent: overlap one file's serialization with the
+    # others' write syscalls, then report in a fixed order.
+    with ThreadPoolExecutor(max_workers=len(outputs)) as pool:
+        futures = [pool.submit(write_jsonl, items, path) for items, path in outputs]
+        for (_, path), future in zip(outputs, futures, strict=True):
+            print(f"  Wrote {future.result()} entries to {path}")
 
     print("\nDone!")
 
@@ -13,16 +13,60 @@ Output: data/processed/modeling_patterns.jsonl
 from __future__ import annotations
 
 import json
+import os
 import re
-from dataclasses import asdict, dataclass, field
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass, field, fields
+from itertools import islice
 from pathlib import Path
 
+try:
+    import orjson
+except ImportError:  # orjson is optional; fall back to stdlib json
+    orjson = None
+
 DOCS_ROOT = Path(__file__).parent.parent / "raw" / "docs" / "docs-getting-started"
 PAGES_DIR = DOCS_ROOT / "modules" / "ROOT" / "pages"
 OUTPUT_DIR = Path(__file__).parent.parent / "processed"
-
-
-@dataclass
+PARSE_CHUNKSIZE = 8  # files handed to a worker process per task
+_SKIP_FILES = frozenset({"nav.adoc", "index.adoc"})
+
+# Path keywords that classify a modeling page
+_PATTERN_KWS = ("modeling-designs", "refactor", "relational-to-graph", "versioning")
+_PRACTICE_KWS = ("tips", "concepts", "naming")
+
+# Compiled once at import; the per-file loops below reuse these
+_CODE_BLOCK_RE = re.compile(r'\[source,\s*cypher[^\]]*\]\s*\n----\n(.*?)----', re.DOTALL)
+_DESCRIPTION_RE = re.compile(r':description:\s*(.+)')
+_TITLE_RE = re.compile(r'^=\s+(.+)', re.MULTILINE)
+_H3_SPLIT_RE = re.compile(r'\n===\s+')
+# One pass finds :Label and [:REL_TYPE] alike. The names sit in lookaheads
+# so a relationship type is also seen as a label, as two scans would.
+_LABEL_OR_REL_RE = re.compile(
+    r'(\[)?:(?=[A-Z_])(?:(?=([A-Z][a-zA-Z]+)))?(?:(?=([A-Z_]+)))?'
+)
+
+# Markup lines skipped when hunting for a prose description: any line starting
+# with one of _MARKUP_FIRST, or with a prefix listed under its first character
+_MARKUP_FIRST = frozenset("[:=|")
+_MARKUP_PREFIXES = {"i": ("include", "image"), "-": ("----",), "/": ("//",)}
+# KB articles also carry conditional-include directives
+_KB_MARKUP_PREFIXES = {**_MARKUP_PREFIXES, "i": ("include", "image", "ifdef"), "e": ("endif",)}
+
+# KB article categories in priority order, each with its substring keywords
+_KB_CATEGORIES = (
+    ("cypher", ("cypher", "query", "match", "return")),
+    ("modeling", ("model", "schema", "label", "relationship")),
+    ("performance", ("performance", "memory", "index", "cache")),
+    ("security", ("security", "auth", "ssl", "encrypt")),
+    ("data-import", ("import", "load", "csv", "export")),
+)
+_KB_KEYWORD_RANK = {kw: rank for rank, (_, kws) in enumerate(_KB_CATEGORIES) for kw in kws}
+# Zero-width, so keywords overlapping in the text are all reported
+_KB_KEYWORD_RE = re.compile(f"(?=({'|'.join(_KB_KEYWORD_RANK)}))")
+
+
+@dataclass(slots=True)
 class ModelingPattern:
     name: str
     description: str
@@ -35,7 +79,7 @@ class ModelingPattern:
     authority_level: int = 1
 
 
-@dataclass
+@dataclass(slots=True)
 class BestPractice:
     title: str
     description: str
@@ -45,18 +89,44 @@ class BestPractice:
     authority_level: int = 1
 
 
-def extract_code_blocks(text: str) -> list[str]:
-    """Extract Cypher code blocks from AsciiDoc."""
-    blocks = []
-    pattern = re.compile(
-        r'\[source,\s*cypher[^\]]*\]\s*\n----\n(.*?)----',
-        re.DOTALL,
-    )
-    for match in pattern.finditer(text):
-        code = match.group(1).strip()
-        if code:
-            blocks.append(code)
-    return blocks
+def _split_h2(text: str) -> list[str]:
+    """Split *text* at ``== `` (h2, not ``===``) heading markers, dropping the markers.
+
+    Same result as ``re.split(r'\\n==\\s+(?!=)', text)``, using ``str.find``.
+    """
+    parts = []
+    n = len(text)
+    start = 0
+    pos = text.find('\n==')
+    while pos != -1:
+        end = pos + 3
+        while end < n and text[end].isspace():
+            end += 1
+        # Like the regex, give back one whitespace char rather than stop before '='
+        if end > pos + 3 and end < n and text[end] == '=':
+            end -= 1
+        if end == pos + 3:  # no whitespace to consume after '==': not an h2 marker
+            pos = text.find('\n==', pos + 1)
+            continue
+        parts.append(text[start:pos])
+        start = end
+        pos = text.find('\n==', end)
+    parts.append(text[start:])
+    return parts
+
+
+def read_adoc(filepath: Path) -> str:
+    """Read an AsciiDoc file as bytes and decode it in one pass."""
+    data = filepath.read_bytes()
+    if b"\r" in data:  # rare; normalize newlines the way text mode would
+        data = data.replace(b"\r\n", b"\n").replace(b"\r", b"\n")
+    return data.decode("utf-8", "replace")
+
+
+def extract_code_blocks(text: str, limit: int | None = None) -> list[str]:
+    """Extract Cypher code blocks from AsciiDoc, stopping after *limit* blocks."""
+    blocks = (code for m in _CODE_BLOCK_RE.finditer(text) if (code := m.group(1).strip()))
+    return list(islice(blocks, limit))
 
 
 def extract_labels_and_rels(text: str) -> tuple[list[str], list[str]]:
@@ -64,17 +134,163 @@ def extract_labels_and_rels(text: str) -> tuple[list[str], list[str]]:
     labels: set[str] = set()
     rels: set[str] = set()
 
-    # Find :Label patterns in Cypher
-    for match in re.finditer(r':([A-Z][a-zA-Z]+)', text):
-        labels.add(match.group(1))
-
-    # Find [:REL_TYPE] patterns
-    for match in re.finditer(r'\[:([A-Z_]+)', text):
-        rels.add(match.group(1))
+    for match in _LABEL_OR_REL_RE.finditer(text):
+        bracket, label, rel = match.groups()
+        if label:
+            labels.add(label)
+        if bracket and rel:
+            rels.add(rel)
 
     return sorted(labels), sorted(rels)
 
 
+def classify_kb_article(lower: str) -> str:
+    """Return the highest-priority category with a keyword in *lower*.
+
+    One regex walk replaces a substring search per keyword.
+    """
+    best = len(_KB_CATEGORIES)
+    for match in _KB_KEYWORD_RE.finditer(lower):
+        best = min(best, _KB_KEYWORD_RANK[match.group(1)])
+        if best == 0:
+            break
+    return _KB_CATEGORIES[best][0] if best < len(_KB_CATEGORIES) else "general"
+
+
+def parse_modeling_file(
+    adoc_file: Path,
+) -> tuple[list[ModelingPattern], list[BestPractice], list[str]]:
+    """Parse one modeling page into patterns, practices and progress lines.
+
+    Runs in a worker process, so progress is returned rather than printed.
+    """
+    patterns: list[ModelingPattern] = []
+    practices: list[BestPractice] = []
+    log: list[str] = []
+    text = read_adoc(adoc_file)
+    rel_path = str(adoc_file.relative_to(DOCS_ROOT))
+
+    # Extract title
+    title_match = _TITLE_RE.search(text)
+    if not title_match:
+        return patterns, practices, log
+    title = title_match.group(1).strip()
+
+    # Extract description
+    desc_match = _DESCRIPTION_RE.search(text)
+    description = desc_match.group(1).strip() if desc_match else ""
+
+    examples = extract_code_blocks(text)
+    labels, rels = extract_labels_and_rels(text)
+
+    # Classify as pattern or best practice
+    rel_lower = rel_path.lower()
+    is_pattern = any(kw in rel_lower for kw in _PATTERN_KWS)
+    is_practice = any(kw in rel_lower for kw in _PRACTICE_KWS)
+
+    if is_pattern or (labels and rels):
+        # Parse sections for when_to_use / anti_pattern. The last matching
+        # section wins, so scan backwards and stop once both are found.
+        when_to_use: str | None = None
+        anti_pattern: str | None = None
+        for section in reversed(_split_h2(text)):
+            lower = section.lower()
+            if when_to_use is None and ("when" in lower or "use case" in lower):
+                when_to_use = section[:500].strip()
+            if anti_pattern is None and ("anti" in lower or "avoid" in lower or "don't" in lower):
+                anti_pattern = section[:500].strip()
+            if when_to_use is not None and anti_pattern is not None:
+                break
+
+        patterns.append(ModelingPattern(
+            name=title,
+            description=description or title,
+            when_to_use=when_to_use or "",
+            anti_pattern=anti_pattern or "",
+            cypher_examples=examples[:10],
+            node_labels=labels,
+            relationship_types=rels,
+            source_file=rel_path,
+        ))
+        log.append(f"  Pattern: {title} ({len(examples)} examples, {len(labels)} labels)")
+
+    if is_practice:  # "tips" is one of the practice keywords
+        # Extract individual tips as separate practices
+        # Slice each tip straight from the text; the preamble before the
+        # first h3 is never needed, so it is never copied
+        tip_marks = list(_H3_SPLIT_RE.finditer(text))
+        for i, mark in enumerate(tip_marks):
+            tip_end = tip_marks[i + 1].start() if i + 1 < len(tip_marks) else len(text)
+            tip = text[mark.end():tip_end]
+            tip_lines = tip.split('\n')
+            tip_title = tip_lines[0].strip()
+            tip_desc = ""
+            for line in tip_lines[1:]:
+                stripped = line.strip()
+                if not stripped:
+                    continue
+                c0 = stripped[0]
+                if c0 in _MARKUP_FIRST or stripped.startswith(_MARKUP_PREFIXES.get(c0, ())):
+                    continue
+                tip_desc = stripped
+                break
+
+            if tip_title and tip_desc:
+                tip_examples = extract_code_blocks(tip, limit=5)
+                category = "modeling"
+                tip_lower = tip_title.lower()
+                if "name" in tip_lower or "naming" in rel_lower:
+                    category = "naming"
+                elif "performance" in tip_lower:
+                    category = "performance"
+
+                practices.append(BestPractice(
+                    title=tip_title,
+                    description=tip_desc,
+                    category=category,
+                    cypher_examples=tip_examples,
+                    source_file=rel_path,
+                ))
+
+    # Also treat the whole page as a practice if it's a tips file
+    if is_practice and description:
+        practices.append(BestPractice(
+            title=title,
+            description=description,
+            category="modeling",
+            cypher_examples=examples[:5],
+            source_file=rel_path,
+        ))
+        log.append(f"  Practice: {title}")
+
+    return patterns, practices, log
+
+
+def list_adoc_files(
+    directory: Path, recursive: bool = False, skip: frozenset[str] = frozenset()
+) -> list[Path]:
+    """List the .adoc pages under *directory*, sorted by path.
+
+    Names come straight from os.scandir / os.walk directory reads, so
+    filtering needs no per-file stat. Files named in *skip* are left out.
+    """
+    if recursive:
+        found = [
+            Path(root, name)
+            for root, _, names in os.walk(directory)
+            for name in names
+            if name.endswith(".adoc") and name not in skip
+        ]
+    else:
+        with os.scandir(directory) as entries:
+            found = [
+                Path(entry.path)
+                for entry in entries
+                if entry.name.endswith(".adoc") and entry.name not in skip and entry.is_file()
+            ]
+    return sorted(found)
+
+
 def parse_modeling_pages() -> tuple[list[ModelingPattern], list[BestPractice]]:
     """Parse data modeling documentation."""
     patterns: list[ModelingPattern] = []
@@ -85,106 +301,24 @@ def parse_modeling_pages() -> tuple[list[ModelingPattern], list[BestPractice]]:
         PAGES_DIR / "data-modeling",
         PAGES_DIR,
     ]
+    files = [
+        adoc_file
+        for mdir in modeling_dirs
+        if mdir.exists()
+        # Skip navigation/index files
+        for adoc_file in list_adoc_files(mdir, recursive=True, skip=_SKIP_FILES)
+    ]
 
-    for mdir in modeling_dirs:
-        if not mdir.exists():
-            continue
-
-        for adoc_file in sorted(mdir.rglob("*.adoc")):
-            text = adoc_file.read_text(encoding="utf-8", errors="replace")
-            rel_path = str(adoc_file.relative_to(DOCS_ROOT))
-
-            # Skip navigation/index files
-            if adoc_file.name in ("nav.adoc", "index.adoc"):
-                continue
-
-            # Extract title
-            title_match = re.search(r'^=\s+(.+)', text, re.MULTILINE)
-            if not title_match:
-                continue
-            title = title_match.group(1).strip()
-
-            # Extract description
-            desc_match = re.search(r':description:\s*(.+)', text)
-            description = desc_match.group(1).strip() if desc_match else ""
-
-            examples = extract_code_blocks(text)
-            labels, rels = extract_labels_and_rels(text)
-
-            # Classify as pattern or best practice
-            is_pattern = any(kw in rel_path.lower() for kw in [
-                "modeling-designs", "refactor", "relational-to-graph",
-                "versioning",
-            ])
-            is_practice = any(kw in rel_path.lower() for kw in [
-                "tips", "concepts", "naming",
-            ])
-
-            if is_pattern or (labels and rels):
-                # Parse sections for when_to_use / anti_pattern
-                when_to_use = ""
-                anti_pattern = ""
-                sections = re.split(r'\n==\s+(?!=)', text)
-                for section in sections:
-                    lower = section.lower()
-                    if "when" in lower or "use case" in lower:
-                        when_to_use = section[:500].strip()
-                    if "anti" in lower or "avoid" in lower or "don't" in lower:
-                        anti_pattern = section[:500].strip()
-
-                patterns.append(ModelingPattern(
-                    name=title,
-                    description=description or title,
-                    when_to_use=when_to_use,
-                    anti_pattern=anti_pattern,
-                    cypher_examples=examples[:10],
-                    node_labels=labels,
-                    relationship_types=rels,
-                    source_file=rel_path,
-                ))
-                print(f"  Pattern: {title} ({len(examples)} examples, {len(labels)} labels)")
-
-            if is_practice or "tips" in rel_path.lower():
-                # Extract individual tips as separate practices
-                tip_sections = re.split(r'\n===\s+', text)
-                for tip in tip_sections[1:]:
-                    tip_lines = tip.split('\n')
-                    tip_title = tip_lines[0].strip()
-                    tip_desc = ""
-                    for line in tip_lines[1:]:
-                        stripped = line.strip()
-                        if stripped and not stripped.startswith(
-                            ('[', ':', '=', 'include', 'image', '|', '----', '//')
-                        ):
-                            tip_desc = stripped
-                            break
-
-                    if tip_title and tip_desc:
-                        tip_examples = extract_code_blocks('\n'.join(tip_lines))
-                        category = "modeling"
-                        if "name" in tip_title.lower() or "naming" in rel_path.lower():
-                            category = "naming"
-                        elif "performance" in tip_title.lower():
-                            category = "performance"
-
-                        practices.append(BestPractice(
-                            title=tip_title,
-                            description=tip_desc,
-                            category=category,
-                            cypher_examples=tip_examples[:5],
-                            source_file=rel_path,
-                        ))
-
-            # Also treat the whole page as a practice if it's a tips file
-            if is_practice and description:
-                practices.append(BestPractice(
-                    title=title,
-                    description=description,
-                    category="modeling",
-                    cypher_examples=examples[:5],
-                    source_file=rel_path,
-                ))
-                print(f"  Practice: {title}")
+    # Pages are independent and parsing is CPU-bound: fan out across
+    # processes, then merge and report in file order.
+    with ProcessPoolExecutor() as pool:
+        for file_patterns, file_practices, log in pool.map(
+            parse_modeling_file, files, chunksize=PARSE_CHUNKSIZE
+        ):
+            patterns.extend(file_patterns)
+            practices.extend(file_practices)
+            for line in log:
+                print(line)
 
     return patterns, practices
 
@@ -200,10 +334,10 @@ def parse_kb_articles() -> list[BestPractice]:
         return practices
 
     count = 0
-    for adoc_file in sorted(articles_dir.glob("*.adoc")):
-        text = adoc_file.read_text(encoding="utf-8", errors="replace")
+    for adoc_file in list_adoc_files(articles_dir):
+        text = read_adoc(adoc_file)
 
-        title_match = re.search(r'^=\s+(.+)', text, re.MULTILINE)
+        title_match = _TITLE_RE.search(text)
         if not title_match:
             continue
         title = title_match.group(1).strip()
@@ -217,36 +351,26 @@ def parse_kb_articles() -> list[BestPractice]:
                 continue
             if in_content:
                 stripped = line.strip()
-                if stripped and not stripped.startswith(
-                    ('[', ':', '=', 'include', 'image', '|', '----', '//', 'ifdef', 'endif')
-                ):
-                    description = stripped
-                    break
+                if not stripped:
+                    continue
+                c0 = stripped[0]
+                if c0 in _MARKUP_FIRST or stripped.startswith(_KB_MARKUP_PREFIXES.get(c0, ())):
+                    continue
+                description = stripped
+                break
 
         if not description:
             continue
 
-        examples = extract_code_blocks(text)
-
-        # Categorize
-        category = "general"
-        lower = (title + text[:500]).lower()
-        if any(kw in lower for kw in ["cypher", "query", "match", "return"]):
-            category = "cypher"
-        elif any(kw in lower for kw in ["model", "schema", "label", "relationship"]):
-            category = "modeling"
-        elif any(kw in lower for kw in ["performance", "memory", "index", "cache"]):
-            category = "performance"
-        elif any(kw in lower for kw in ["security", "auth", "ssl", "encrypt"]):
-            category = "security"
-        elif any(kw in lower for kw in ["import", "load", "csv", "export"]):
-            category = "data-import"
+        examples = extract_code_blocks(text, limit=3)
+
+        category = classify_kb_article((title + text[:500]).lower())
 
         practices.append(BestPractice(
             title=title,
             description=description[:500],
             category=category,
-            cypher_examples=examples[:3],
+            cypher_examples=examples,
             source_file=str(adoc_file.relative_to(kb_root)),
             authority_level=1,  # Official KB
         ))
@@ -256,11 +380,25 @@ def parse_kb_articles() -> list[BestPractice]:
     return practices
 
 
+def _field_dict(obj: object) -> dict:
+    """``json`` fallback hook: a slotted dataclass as a shallow field dict."""
+    return {f.name: getattr(obj, f.name) for f in fields(obj)}
+
+
+def dump_jsonl_line(record: object) -> bytes:
+    """Serialize one dataclass record as UTF-8 bytes (non-ASCII kept verbatim)."""
+    if orjson is not None:
+        return orjson.dumps(record) + b"\n"  # serializes dataclasses natively
+    return (json.dumps(record, ensure_ascii=False, default=_field_dict) + "\n").encode("utf-8")
+
+
 def write_jsonl(items: list, output_path: Path) -> None:
     output_path.parent.mkdir(parents=True, exist_ok=True)
-    with open(output_path, "w", encoding="utf-8") as f:
+    # Records are serialized field by field in place; asdict() would
+    # deep-copy every list first.
+    with open(output_path, "wb", buffering=1 << 16) as f:
         for item in items:
-            f.write(json.dumps(asdict(item), ensure_ascii=False) + "\n")
+            f.write(dump_jsonl_line(item))
     print(f"  Wrote {len(items)} entries to {output_path}")
 
 
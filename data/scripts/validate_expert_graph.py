@@ -12,227 +12,334 @@ Usage:
 from __future__ import annotations
 
 import argparse
+import asyncio
+import atexit
 import sys
+from collections.abc import Callable, Mapping
+from dataclasses import dataclass
+from functools import cache
+from typing import Any
+
+from neo4j import AsyncDriver, AsyncGraphDatabase, Driver, GraphDatabase, Record
+
+
+# Every count, null, orphan and distribution figure in one statement: each
+# CALL subquery aggregates to exactly one row, so the statement returns one
+# record and the whole report costs a single Bolt round trip. Totals, null
+# and orphan counts for a label share one scan via conditional count().
+QUALITY_QUERY = """
+CALL {
+    MATCH (c:CypherClause)
+    RETURN count(c) AS clause_count,
+           count(CASE WHEN c.description IS NULL OR c.description = '' THEN 1 END)
+               AS clause_nulls,
+           count(CASE WHEN NOT (c)-[:SOURCED_FROM]->() THEN 1 END) AS clause_orphans
+}
+CALL {
+    MATCH (f:CypherFunction)
+    RETURN count(f) AS function_count,
+           count(CASE WHEN f.signature IS NULL OR f.signature = '' THEN 1 END)
+               AS function_nulls
+}
+CALL {
+    MATCH (ex:CypherExample)
+    RETURN count(ex) AS example_count,
+           count(CASE WHEN ex.cypher IS NULL OR ex.cypher = '' THEN 1 END) AS example_nulls,
+           count(CASE WHEN NOT (ex)-[:DEMONSTRATES]->() THEN 1 END) AS example_orphans
+}
+CALL {
+    MATCH (bp:BestPractice)
+    RETURN count(bp) AS practice_count,
+           count(CASE WHEN bp.title IS NULL OR bp.title = '' THEN 1 END) AS practice_nulls,
+           count(CASE WHEN NOT (bp)-[:SOURCED_FROM]->() THEN 1 END) AS practice_orphans
+}
+CALL { MATCH (mp:ModelingPattern) RETURN count(mp) AS pattern_count }
+CALL {
+    MATCH (ex:CypherExample)-[:DEMONSTRATES]->(target)
+    WITH count(ex) AS linked, labels(target)[0] AS target_type
+    ORDER BY linked DESC LIMIT 5
+    RETURN collect({linked: linked, target_type: target_type}) AS demonstrates
+}
+CALL { MATCH ()-[r:SOURCED_FROM]->() RETURN count(r) AS sourced_from }
+CALL {
+    MATCH (bp:BestPractice)-[:BELONGS_TO]->(cat:PracticeCategory)
+    WITH cat.name AS category, count(bp) AS cnt
+    ORDER BY cnt DESC
+    RETURN collect([category, cnt]) AS categories
+}
+RETURN *
+"""
+
+
+Evaluator = Callable[[Mapping[str, Any]], tuple[Any, bool, str]]
+
+
+@dataclass(slots=True, frozen=True)
+class CheckSpec:
+    """One report line: its name, the expected value shown, and how to judge it."""
+
+    name: str
+    expected: str
+    evaluate: Evaluator
+
+
+NODE_COUNT_QUERY = "MATCH (n) RETURN count(n) AS total"
+
+INDEX_COUNT_QUERY = "SHOW INDEXES YIELD name RETURN count(name) AS cnt"
+CONSTRAINT_COUNT_QUERY = "SHOW CONSTRAINTS YIELD name RETURN count(name) AS cnt"
+
 
-from neo4j import GraphDatabase
+def _read_single(tx, query: str) -> Record:
+    return tx.run(query).single(strict=True)
+
+
+async def _aread_single(tx, query: str) -> Record:
+    result = await tx.run(query)
+    return await result.single(strict=True)
 
 
 def check_data_quality(session: object) -> dict[str, dict]:
     """Run data quality checks against the expert graph.
 
     Returns a dict of {check_name: {expected, actual, passed, detail}}.
+    Graph checks come from QUALITY_QUERY; SHOW INDEXES / SHOW CONSTRAINTS
+    cannot be composed with MATCH subqueries, so they run on their own.
+    Every statement runs as a managed read transaction, so the driver
+    retries transient failures and routes to a reader in a cluster.
     """
-    checks = {}
+    q = session.execute_read(_read_single, QUALITY_QUERY)
+    idx_count = session.execute_read(_read_single, INDEX_COUNT_QUERY)["cnt"]
+    constraint_count = session.execute_read(_read_single, CONSTRAINT_COUNT_QUERY)["cnt"]
+    return evaluate_checks(q, idx_count, constraint_count)
 
-    # --- Coverage: do we have enough data? ---
 
-    result = session.run("MATCH (c:CypherClause) RETURN count(c) AS total")
-    total = result.single()["total"]
-    checks["clause_count"] = {
-        "expected": ">=30",
-        "actual": total,
-        "passed": total >= 30,
-        "detail": "Missing common clauses" if total < 30 else "",
-    }
-
-    result = session.run("MATCH (f:CypherFunction) RETURN count(f) AS total")
-    total = result.single()["total"]
-    checks["function_count"] = {
-        "expected": ">=100",
-        "actual": total,
-        "passed": total >= 100,
-        "detail": "",
-    }
-
-    result = session.run("MATCH (ex:CypherExample) RETURN count(ex) AS total")
-    total = result.single()["total"]
-    checks["example_count"] = {
-        "expected": ">=200",
-        "actual": total,
-        "passed": total >= 200,
-        "detail": "",
-    }
-
-    result = session.run("MATCH (bp:BestPractice) RETURN count(bp) AS total")
-    total = result.single()["total"]
-    checks["best_practice_count"] = {
-        "expected": ">=100",
-        "actual": total,
-        "passed": total >= 100,
-        "detail": "",
-    }
-
-    result = session.run("MATCH (mp:ModelingPattern) RETURN count(mp) AS total")
-    total = result.single()["total"]
-    checks["modeling_pattern_count"] = {
-        "expected": ">=10",
-        "actual": total,
-        "passed": total >= 10,
-        "detail": "",
-    }
+# Drivers handed out by _get_driver, closed once at interpreter exit.
+_open_drivers: list[Driver] = []
 
-    # --- Null/empty required fields ---
 
-    result = session.run(
-        "MATCH (c:CypherClause) WHERE c.description IS NULL OR c.description = '' "
-        "RETURN count(c) AS nulls"
-    )
-    nulls = result.single()["nulls"]
-    checks["clauses_with_description"] = {
-        "expected": "0 nulls",
-        "actual": nulls,
-        "passed": nulls == 0,
-        "detail": f"{nulls} clauses missing description" if nulls > 0 else "",
-    }
-
-    result = session.run(
-        "MATCH (f:CypherFunction) WHERE f.signature IS NULL OR f.signature = '' "
-        "RETURN count(f) AS nulls"
-    )
-    nulls = result.single()["nulls"]
-    checks["functions_with_signature"] = {
-        "expected": "0 nulls",
-        "actual": nulls,
-        "passed": nulls == 0,
-        "detail": f"{nulls} functions missing signature" if nulls > 0 else "",
-    }
-
-    result = session.run(
-        "MATCH (ex:CypherExample) WHERE ex.cypher IS NULL OR ex.cypher = '' "
-        "RETURN count(ex) AS nulls"
-    )
-    nulls = result.single()["nulls"]
-    checks["examples_with_cypher"] = {
-        "expected": "0 nulls",
-        "actual": nulls,
-        "passed": nulls == 0,
-        "detail": f"{nulls} examples missing cypher" if nulls > 0 else "",
-    }
-
-    result = session.run(
-        "MATCH (bp:BestPractice) WHERE bp.title IS NULL OR bp.title = '' "
-        "RETURN count(bp) AS nulls"
-    )
-    nulls = result.single()["nulls"]
-    checks["practices_with_title"] = {
-        "expected": "0 nulls",
-        "actual": nulls,
-        "passed": nulls == 0,
-        "detail": f"{nulls} best practices missing title" if nulls > 0 else "",
-    }
+@cache
+def _get_driver(uri: str, username: str, password: str) -> Driver:
+    auth = (username, password) if password else None
+    driver = GraphDatabase.driver(uri, auth=auth)
+    _open_drivers.append(driver)
+    return driver
 
-    # --- Orphan nodes (no relationships at all) ---
 
-    result = session.run(
-        "MATCH (ex:CypherExample) WHERE NOT (ex)-[:DEMONSTRATES]->() "
-        "RETURN count(ex) AS orphans"
-    )
-    orphans = result.single()["orphans"]
-    result2 = session.run("MATCH (ex:CypherExample) RETURN count(ex) AS total")
-    total = result2.single()["total"]
-    checks["orphan_examples"] = {
-        "expected": "<50% orphans",
-        "actual": f"{orphans}/{total}",
-        "passed": total == 0 or (orphans / total) < 0.5,
-        "detail": f"{orphans} examples not linked via DEMONSTRATES" if orphans > 0 else "",
-    }
-
-    result = session.run(
-        "MATCH (c:CypherClause) WHERE NOT (c)-[:SOURCED_FROM]->() "
-        "RETURN count(c) AS orphans"
-    )
-    orphans = result.single()["orphans"]
-    result2 = session.run("MATCH (c:CypherClause) RETURN count(c) AS total")
-    total = result2.single()["total"]
-    checks["clauses_with_source"] = {
-        "expected": "0 orphans",
-        "actual": f"{orphans}/{total}",
-        "passed": orphans == 0,
-        "detail": f"{orphans} clauses not linked to a Source node" if orphans > 0 else "",
-    }
-
-    result = session.run(
-        "MATCH (bp:BestPractice) WHERE NOT (bp)-[:SOURCED_FROM]->() "
-        "RETURN count(bp) AS orphans"
+@atexit.register
+def _close_drivers() -> None:
+    for driver in _open_drivers:
+        driver.close()
+    _open_drivers.clear()
+    _get_driver.cache_clear()
+
+
+def validate_graph(
+    uri: str = "bolt://localhost:7687",
+    username: str = "neo4j",
+    password: str = "",
+    database: str = "neo4j",
+) -> dict[str, dict]:
+    """Run check_data_quality from library code, e.g. after ingestion in tests or CI.
+
+    The driver for each (uri, username, password) is created once and reused
+    by later calls in the same process, so repeated validations skip the
+    connection handshake.
+    """
+    with _get_driver(uri, username, password).session(database=database) as session:
+        return check_data_quality(session)
+
+
+async def check_data_quality_async(driver: AsyncDriver, database: str) -> dict[str, dict]:
+    """Like check_data_quality, but with the three statements in flight at once.
+
+    Each statement runs in its own session; a single session cannot carry
+    concurrent queries.
+    """
+
+    async def fetch(query: str) -> Record:
+        async with driver.session(database=database) as session:
+            return await session.execute_read(_aread_single, query)
+
+    q, idx, constraints = await asyncio.gather(
+        fetch(QUALITY_QUERY), fetch(INDEX_COUNT_QUERY), fetch(CONSTRAINT_COUNT_QUERY)
     )
-    orphans = result.single()["orphans"]
-    result2 = session.run("MATCH (bp:BestPractice) RETURN count(bp) AS total")
-    total = result2.single()["total"]
-    checks["practices_with_source"] = {
-        "expected": "0 orphans",
-        "actual": f"{orphans}/{total}",
-        "passed": orphans == 0,
-        "detail": f"{orphans} best practices not linked to a Source node" if orphans > 0 else "",
-    }
+    return evaluate_checks(q, idx["cnt"], constraints["cnt"])
+
+
+def _at_least(key: str, minimum: int, shortfall: str = "") -> Evaluator:
+    def evaluate(row: Mapping[str, Any]) -> tuple[Any, bool, str]:
+        total = row[key]
+        return total, total >= minimum, shortfall if total < minimum else ""
+
+    return evaluate
 
-    # --- Relationship integrity ---
 
-    result = session.run(
-        "MATCH (ex:CypherExample)-[:DEMONSTRATES]->(target) "
-        "RETURN count(ex) AS linked, labels(target)[0] AS target_type "
-        "ORDER BY linked DESC LIMIT 5"
+def _no_nulls(key: str, what: str) -> Evaluator:
+    def evaluate(row: Mapping[str, Any]) -> tuple[Any, bool, str]:
+        nulls = row[key]
+        return nulls, nulls == 0, f"{nulls} {what}" if nulls > 0 else ""
+
+    return evaluate
+
+
+def _no_orphans(key: str, total_key: str, what: str) -> Evaluator:
+    def evaluate(row: Mapping[str, Any]) -> tuple[Any, bool, str]:
+        orphans = row[key]
+        return (
+            f"{orphans}/{row[total_key]}",
+            orphans == 0,
+            f"{orphans} {what}" if orphans > 0 else "",
+        )
+
+    return evaluate
+
+
+def _orphan_examples(row: Mapping[str, Any]) -> tuple[Any, bool, str]:
+    orphans = row["example_orphans"]
+    total = row["example_count"]
+    return (
+        f"{orphans}/{total}",
+        total == 0 or (orphans / total) < 0.5,
+        f"{orphans} examples not linked via DEMONSTRATES" if orphans > 0 else "",
     )
-    demonstrates_rows = list(result)
+
+
+def _demonstrates(row: Mapping[str, Any]) -> tuple[Any, bool, str]:
+    demonstrates_rows = row["demonstrates"]
     total_demonstrates = sum(r["linked"] for r in demonstrates_rows)
-    checks["demonstrates_relationships"] = {
-        "expected": ">0",
-        "actual": total_demonstrates,
-        "passed": total_demonstrates > 0,
-        "detail": ", ".join(f"{r['target_type']}={r['linked']}" for r in demonstrates_rows),
-    }
-
-    result = session.run(
-        "MATCH ()-[r:SOURCED_FROM]->() RETURN count(r) AS total"
+    return (
+        total_demonstrates,
+        total_demonstrates > 0,
+        ", ".join(f"{r['target_type']}={r['linked']}" for r in demonstrates_rows),
     )
-    sourced = result.single()["total"]
-    checks["sourced_from_relationships"] = {
-        "expected": ">0",
-        "actual": sourced,
-        "passed": sourced > 0,
-        "detail": "",
-    }
 
-    # --- Distribution: category spread ---
 
-    result = session.run(
-        "MATCH (bp:BestPractice)-[:BELONGS_TO]->(cat:PracticeCategory) "
-        "RETURN cat.name AS category, count(bp) AS cnt ORDER BY cnt DESC"
-    )
-    categories = {r["category"]: r["cnt"] for r in result}
+def _practice_categorization(row: Mapping[str, Any]) -> tuple[Any, bool, str]:
+    categories = dict(row["categories"])
     total_categorized = sum(categories.values())
-    result2 = session.run("MATCH (bp:BestPractice) RETURN count(bp) AS total")
-    total_bp = result2.single()["total"]
+    total_bp = row["practice_count"]
     uncategorized = total_bp - total_categorized
-    checks["practice_categorization"] = {
-        "expected": "100% categorized",
-        "actual": f"{total_categorized}/{total_bp} categorized",
-        "passed": uncategorized == 0,
-        "detail": f"Categories: {categories}" if categories else "No categories found",
-    }
+    return (
+        f"{total_categorized}/{total_bp} categorized",
+        uncategorized == 0,
+        f"Categories: {categories}" if categories else "No categories found",
+    )
+
 
+# The report, in print order. Each evaluator reads the merged QUALITY_QUERY
+# row (plus index_count / constraint_count) and returns (actual, passed, detail).
+CHECKS: tuple[CheckSpec, ...] = (
+    # --- Coverage: do we have enough data? ---
+    CheckSpec("clause_count", ">=30", _at_least("clause_count", 30, "Missing common clauses")),
+    CheckSpec("function_count", ">=100", _at_least("function_count", 100)),
+    CheckSpec("example_count", ">=200", _at_least("example_count", 200)),
+    CheckSpec("best_practice_count", ">=100", _at_least("practice_count", 100)),
+    CheckSpec("modeling_pattern_count", ">=10", _at_least("pattern_count", 10)),
+    # --- Null/empty required fields ---
+    CheckSpec(
+        "clauses_with_description",
+        "0 nulls",
+        _no_nulls("clause_nulls", "clauses missing description"),
+    ),
+    CheckSpec(
+        "functions_with_signature",
+        "0 nulls",
+        _no_nulls("function_nulls", "functions missing signature"),
+    ),
+    CheckSpec(
+        "examples_with_cypher",
+        "0 nulls",
+        _no_nulls("example_nulls", "examples missing cypher"),
+    ),
+    CheckSpec(
+        "practices_with_title",
+        "0 nulls",
+        _no_nulls("practice_nulls", "best practices missing title"),
+    ),
+    # --- Orphan nodes (no relationships at all) ---
+    CheckSpec("orphan_examples", "<50% orphans", _orphan_examples),
+    CheckSpec(
+        "clauses_with_source",
+        "0 orphans",
+        _no_orphans("clause_orphans", "clause_count", "clauses not linked to a Source node"),
+    ),
+    CheckSpec(
+        "practices_with_source",
+        "0 orphans",
+        _no_orphans(
+            "practice_orphans", "practice_count", "best practices not linked to a Source node"
+        ),
+    ),
+    # --- Relationship integrity ---
+    CheckSpec("demonstrates_relationships", ">0", _demonstrates),
+    CheckSpec(
+        "sourced_from_relationships",
+        ">0",
+        lambda row: (row["sourced_from"], row["sourced_from"] > 0, ""),
+    ),
+    # --- Distribution: category spread ---
+    CheckSpec("practice_categorization", "100% categorized", _practice_categorization),
     # --- Index and constraint existence ---
+    CheckSpec("indexes_exist", ">=3", _at_least("index_count", 3)),
+    CheckSpec("constraints_exist", ">=5", _at_least("constraint_count", 5)),
+)
+
 
-    result = session.run("SHOW INDEXES YIELD name RETURN count(name) AS cnt")
-    idx_count = result.single()["cnt"]
-    checks["indexes_exist"] = {
-        "expected": ">=3",
-        "actual": idx_count,
-        "passed": idx_count >= 3,
-        "detail": "",
-    }
-
-    result = session.run("SHOW CONSTRAINTS YIELD name RETURN count(name) AS cnt")
-    constraint_count = result.single()["cnt"]
-    checks["constraints_exist"] = {
-        "expected": ">=5",
-        "actual": constraint_count,
-        "passed": constraint_count >= 5,
-        "detail": "",
-    }
+def _check(expected: str, actual: Any, passed: bool, detail: str = "") -> dict[str, Any]:
+    return {"expected": expected, "actual": actual, "passed": passed, "detail": detail}
 
+
+def evaluate_checks(q: Record, idx_count: int, constraint_count: int) -> dict[str, dict]:
+    """Turn the QUALITY_QUERY record and index/constraint counts into checks."""
+    row = {**dict(q), "index_count": idx_count, "constraint_count": constraint_count}
+    checks = {}
+    for spec in CHECKS:
+        actual, passed, detail = spec.evaluate(row)
+        checks[spec.name] = _check(spec.expected, actual, passed, detail)
     return checks
 
 
+async def run(args: argparse.Namespace) -> int:
+    """Connect, run every check concurrently and print the report; return the exit code."""
+    auth = (args.username, args.password) if args.password else None
+    async with AsyncGraphDatabase.driver(args.uri, auth=auth) as driver:
+        async with driver.session(database=args.database) as session:
+            # Quick connectivity check
+            result = await session.run(NODE_COUNT_QUERY)
+            total = (await result.single(strict=True))["total"]
+        print(f"\nConnected: {total} nodes in database")
+
+        if total == 0:
+            print("\nERROR: No nodes found. Load the expert graph first.")
+            print("  python data/scripts/load_expert_graph.py --password <pw>")
+            return 1
+
+        checks = await check_data_quality_async(driver, args.database)
+
+    # Tally and format in one pass, then print the report with a single write
+    passed = 0
+    lines: list[str] = []
+    for name, check in checks.items():
+        if check["passed"]:
+            passed += 1
+        status = "PASS" if check["passed"] else "FAIL"
+        lines.append(f"  [{status}] {name}\n")
+        lines.append(f"         expected: {check['expected']}, actual: {check['actual']}\n")
+        if check["detail"]:
+            lines.append(f"         {check['detail']}\n")
+    failed = len(checks) - passed
+
+    lines.insert(0, f"\nResults: {passed}/{len(checks)} checks passed\n\n")
+    lines.append("\n" + "=" * 60 + "\n")
+    if failed == 0:
+        lines.append(f"ALL {len(checks)} CHECKS PASSED\n")
+    else:
+        lines.append(f"{failed} CHECK(S) FAILED — review data quality issues above\n")
+    sys.stdout.write("".join(lines))
+
+    return 0 if failed == 0 else 1
+
+
 def main() -> None:
     parser = argparse.ArgumentParser(
         description="Check expert graph data quality in Neo4j"
@@ -247,46 +354,7 @@ def main() -> None:
     print("Expert Graph — Data Quality Report")
     print("=" * 60)
 
-    auth = (args.username, args.password) if args.password else None
-    driver = GraphDatabase.driver(args.uri, auth=auth)
-
-    try:
-        with driver.session(database=args.database) as session:
-            # Quick connectivity check
-            result = session.run("MATCH (n) RETURN count(n) AS total")
-            total = result.single()["total"]
-            print(f"\nConnected: {total} nodes in database")
-
-            if total == 0:
-                print("\nERROR: No nodes found. Load the expert graph first.")
-                print("  python data/scripts/load_expert_graph.py --password <pw>")
-                sys.exit(1)
-
-            checks = check_data_quality(session)
-
-        # Print results
-        passed = sum(1 for c in checks.values() if c["passed"])
-        failed = len(checks) - passed
-
-        print(f"\nResults: {passed}/{len(checks)} checks passed\n")
-
-        for name, check in checks.items():
-            status = "PASS" if check["passed"] else "FAIL"
-            print(f"  [{status}] {name}")
-            print(f"         expected: {check['expected']}, actual: {check['actual']}")
-            if check["detail"]:
-                print(f"         {check['detail']}")
-
-        print("\n" + "=" * 60)
-        if failed == 0:
-            print(f"ALL {len(checks)} CHECKS PASSED")
-        else:
-            print(f"{failed} CHECK(S) FAILED — review data quality issues above")
-
-        sys.exit(0 if failed == 0 else 1)
-
-    finally:
-        driver.close()
+    sys.exit(asyncio.run(run(args)))
 
 
 if __name__ == "__main__":
@@ -51,9 +51,8 @@ def main() -> None:
 
     # Ask questions (read-only, default)
     g = Graph()
-    for question in QUESTIONS:
+    for question, result in zip(QUESTIONS, g.ask_many(QUESTIONS), strict=True):
         print(f"❓ {question}")
-        result = g.ask(question)
         print(f"   💬 {result}")
         if result.errors:
             print(f"   ⚠️  {result.errors}")
@@ -2,16 +2,59 @@
 
 from __future__ import annotations
 
+import hashlib
+import json
 import os
-from dataclasses import dataclass, field
+from collections import OrderedDict
+from collections.abc import Callable, Iterable
+from dataclasses import dataclass, field, replace
+from functools import cache, lru_cache
+from types import ModuleType
 from typing import TYPE_CHECKING, Any
 
-import structlog
-
 if TYPE_CHECKING:
-    from gibsgraph.agent import GibsGraphAgent
+    from structlog.typing import FilteringBoundLogger
+
+    from gibsgraph.agent import AgentState, GibsGraphAgent
+    from gibsgraph.tools.visualizer import GraphVisualizer
+
+
+@cache
+def _log() -> FilteringBoundLogger:
+    """Module logger, created on first use so ``import gibsgraph`` skips structlog."""
+    import structlog
+
+    logger: FilteringBoundLogger = structlog.get_logger(__name__)
+    return logger
+
+
+@cache
+def _orjson() -> ModuleType | None:
+    """The orjson module if installed, else None (optional speed-up for cache keys)."""
+    try:
+        import orjson
+    except ImportError:
+        return None
+    return orjson
+
+
+def _subgraph_key(subgraph: dict[str, Any]) -> str:
+    """Stable digest of a subgraph, used to key the Mermaid cache."""
+    orjson = _orjson()
+    if orjson is not None:
+        try:
+            data = orjson.dumps(
+                subgraph, option=orjson.OPT_SORT_KEYS | orjson.OPT_NON_STR_KEYS, default=str
+            )
+        except orjson.JSONEncodeError:  # e.g. ints beyond 64 bits
+            data = json.dumps(subgraph, sort_keys=True, default=str).encode()
+    else:
+        data = json.dumps(subgraph, sort_keys=True, default=str).encode()
+    return hashlib.blake2b(data).hexdigest()
+
 
-log = structlog.get_logger(__name__)
+_ASK_CACHE_MAX = 128  # answers kept per read-only Graph
+_MERMAID_CACHE_MAX = 64  # rendered diagrams kept per Graph
 
 
 # ---------------------------------------------------------------------------
@@ -19,7 +62,7 @@ log = structlog.get_logger(__name__)
 # ---------------------------------------------------------------------------
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class Answer:
     """Result from Graph.ask()."""
 
@@ -39,7 +82,7 @@ class Answer:
         return f"Answer(answer={self.answer!r:.60}, confidence={self.confidence:.2f})"
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class IngestResult:
     """Result from Graph.ingest()."""
 
@@ -84,14 +127,9 @@ class SchemaInfo:
 # ---------------------------------------------------------------------------
 
 
-def _resolve_llm(llm: str) -> str:
-    """Detect best available LLM from environment if llm='auto'."""
-    from gibsgraph.config import PROVIDERS
-
-    if llm != "auto":
-        return llm
-
-    # Load .env so API keys are available via os.getenv
+@lru_cache(maxsize=1)
+def _load_dotenv_once() -> None:
+    """Load .env into the environment on first call only."""
     try:
         from dotenv import load_dotenv
 
@@ -99,11 +137,34 @@ def _resolve_llm(llm: str) -> str:
     except ImportError:
         pass
 
-    for provider in PROVIDERS:
-        if os.getenv(provider.env_key):
-            log.debug("graph.llm_auto_resolved", choice=provider.default_model)
+
+@lru_cache(maxsize=8)
+def _auto_llm(keys_set: tuple[bool, ...]) -> str | None:
+    """Default model of the first provider whose API key is set, or None."""
+    from gibsgraph.config import PROVIDERS
+
+    for provider, is_set in zip(PROVIDERS, keys_set, strict=True):
+        if is_set:
             return provider.default_model
+    return None
+
+
+def _resolve_llm(llm: str) -> str:
+    """Detect best available LLM from environment if llm='auto'."""
+    from gibsgraph.config import PROVIDERS
+
+    if llm != "auto":
+        return llm
+
+    # Load .env (once per process) so API keys are available via os.getenv
+    _load_dotenv_once()
+
+    choice = _auto_llm(tuple(bool(os.getenv(p.env_key)) for p in PROVIDERS))
+    if choice is not None:
+        _log().debug("graph.llm_auto_resolved", choice=choice)
+        return choice
 
+    # Raised outside the cache so a later key in the environment is picked up
     env_keys = " or ".join(p.env_key for p in PROVIDERS)
     raise RuntimeError(
         f"No LLM API key found. Set {env_keys}, "
@@ -174,13 +235,20 @@ class Graph:
         )
         self._top_k = top_k
         self._agent: GibsGraphAgent | None = None  # lazy init
-        log.info("graph.ready", uri=resolved_uri, llm=self._settings.llm_model)
+        # LRU of answers by (question, top_k, model); only used when read-only
+        self._ask_cache: OrderedDict[tuple[str, int, str], Answer] = OrderedDict()
+        self._ask_cache_hits = 0
+        self._ask_cache_misses = 0
+        self._visualizer: GraphVisualizer | None = None  # lazy init
+        # Mermaid strings by subgraph content digest, oldest evicted first
+        self._mermaid_cache: OrderedDict[str, str] = OrderedDict()
+        _log().info("graph.ready", uri=resolved_uri, llm=self._settings.llm_model)
 
     # ------------------------------------------------------------------
     # Public API — the only two methods most users need
     # ------------------------------------------------------------------
 
-    def ask(self, question: str) -> Answer:
+    def ask(self, question: str, *, on_token: Callable[[str], None] | None = None) -> Answer:
         """Ask a natural language question about your Neo4j graph.
 
         Args:
@@ -198,11 +266,79 @@ class Graph:
             print(result)                  # prints the answer
             print(result.cypher)           # the Cypher that was run
             print(result.confidence)       # 0.0-1.0
+
+        In read-only mode, answers are cached per Graph: asking the same
+        question again returns a copy of the earlier answer without
+        re-running retrieval or the LLM. See cache_info() / clear_cache().
+
+        Pass ``on_token`` to stream the answer text as it is generated
+        (e.g. ``on_token=lambda t: print(t, end="")``); a cached answer is
+        delivered as a single chunk.
         """
-        log.info("graph.ask", question=question[:100])
-        agent_result = self._agent_instance().ask(question)
+        _log().info("graph.ask", question=question[:100])
+        cached = self._cached_answer(question)
+        if cached is not None:
+            if on_token is not None:
+                on_token(cached.answer)
+            return cached
+        agent_result = self._agent_instance().ask(question, on_token=on_token)
+        return self._build_answer(question, agent_result)
+
+    def ask_many(
+        self, questions: Iterable[str], *, max_concurrency: int | None = None
+    ) -> list[Answer]:
+        """Ask several questions, running the agent for them concurrently.
+
+        Equivalent to ``[g.ask(q) for q in questions]`` — answers come back
+        in input order and go through the same read-only cache — but up to
+        ``max_concurrency`` retrieval + LLM runs (default:
+        ``AGENT_MAX_CONCURRENCY``) are in flight at once, so the total time
+        is close to that of the slowest question rather than the sum of all
+        of them. A question repeated within the batch runs the agent once.
+
+        Example::
 
-        return Answer(
+            for answer in g.ask_many(["Who owns Acme?", "Where is Acme based?"]):
+                print(answer)
+        """
+        questions = list(questions)
+        answers: list[Answer | None] = []
+        pending: dict[str, list[int]] = {}  # uncached question -> its positions
+        for i, question in enumerate(questions):
+            _log().info("graph.ask", question=question[:100])
+            answer = None if question in pending else self._cached_answer(question)
+            answers.append(answer)
+            if answer is None:
+                pending.setdefault(question, []).append(i)
+
+        if pending:
+            # Only the agent's batch runs concurrently; cache and visualizer
+            # bookkeeping stays on the calling thread.
+            results = self._agent_instance().ask_many(
+                list(pending), max_concurrency=max_concurrency
+            )
+            for (question, positions), agent_result in zip(pending.items(), results, strict=True):
+                answer = self._build_answer(question, agent_result)
+                for i in positions:
+                    answers[i] = answer
+        return [answer for answer in answers if answer is not None]
+
+    def _cached_answer(self, question: str) -> Answer | None:
+        """Return a copy of the cached answer in read-only mode, else None."""
+        if not self._settings.neo4j_read_only:
+            return None
+        cache_key = (question, self._top_k, self._settings.llm_model)
+        cached = self._ask_cache.get(cache_key)
+        if cached is None:
+            self._ask_cache_misses += 1
+            return None
+        self._ask_cache.move_to_end(cache_key)
+        self._ask_cache_hits += 1
+        return replace(cached, errors=list(cached.errors))
+
+    def _build_answer(self, question: str, agent_result: AgentState) -> Answer:
+        """Turn an agent run into an Answer and cache it when eligible."""
+        answer = Answer(
             question=question,
             answer=agent_result.explanation or "No answer found.",
             cypher=agent_result.cypher_used,
@@ -210,8 +346,15 @@ class Graph:
             visualization=self._to_mermaid(agent_result.subgraph),
             bloom_url=agent_result.visualization_url,
             nodes_retrieved=len((agent_result.subgraph or {}).get("nodes", [])),
-            errors=agent_result.errors,
+            errors=list(agent_result.errors),
         )
+        # Answers with errors are not cached, so transient failures are retried
+        if self._settings.neo4j_read_only and not answer.errors:
+            cache_key = (question, self._top_k, self._settings.llm_model)
+            self._ask_cache[cache_key] = replace(answer, errors=[])
+            if len(self._ask_cache) > _ASK_CACHE_MAX:
+                self._ask_cache.popitem(last=False)
+        return answer
 
     def ingest(self, text: str, *, source: str = "manual") -> IngestResult:
         """Ingest text into your Neo4j knowledge graph.
@@ -236,7 +379,7 @@ class Graph:
                 "ingest() requires read_only=False.\n"
                 "Use: Graph('bolt://...', password='...', read_only=False)"
             )
-        log.info("graph.ingest", source=source, length=len(text))
+        _log().info("graph.ingest", source=source, length=len(text))
         result = self._agent_instance().kg_builder.ingest(text, source=source)
 
         # Post-ingest validation — lightweight quality checks
@@ -273,6 +416,7 @@ class Graph:
                 self._settings.neo4j_password.get_secret_value(),
             ),
             max_connection_lifetime=self._settings.neo4j_max_connection_lifetime,
+            max_connection_pool_size=self._settings.neo4j_max_connection_pool_size,
         )
         try:
             with driver.session(database=self._settings.neo4j_database) as session:
@@ -328,6 +472,21 @@ class Graph:
         """Ask a question and return only the generated Cypher query."""
         return self.ask(question).cypher
 
+    def cache_info(self) -> dict[str, int]:
+        """Return answer-cache statistics: hits, misses, size and maxsize."""
+        return {
+            "hits": self._ask_cache_hits,
+            "misses": self._ask_cache_misses,
+            "size": len(self._ask_cache),
+            "maxsize": _ASK_CACHE_MAX,
+        }
+
+    def clear_cache(self) -> None:
+        """Drop all cached answers and reset the hit/miss counters."""
+        self._ask_cache.clear()
+        self._ask_cache_hits = 0
+        self._ask_cache_misses = 0
+
     # ------------------------------------------------------------------
     # Private
     # ------------------------------------------------------------------
@@ -340,12 +499,27 @@ class Graph:
             self._agent = GibsGraphAgent(settings=self._settings)
         return self._agent
 
+    def _visualizer_instance(self) -> GraphVisualizer:
+        """Lazy-init the visualizer on first use."""
+        if self._visualizer is None:
+            from gibsgraph.tools.visualizer import GraphVisualizer
+
+            self._visualizer = GraphVisualizer(settings=self._settings)
+        return self._visualizer
+
     def _to_mermaid(self, subgraph: dict[str, Any] | None) -> str:
         if not subgraph:
             return ""
-        from gibsgraph.tools.visualizer import GraphVisualizer
-
-        return GraphVisualizer(settings=self._settings).to_mermaid(subgraph)
+        key = _subgraph_key(subgraph)
+        mermaid = self._mermaid_cache.get(key)
+        if mermaid is not None:
+            self._mermaid_cache.move_to_end(key)
+            return mermaid
+        mermaid = self._visualizer_instance().to_mermaid(subgraph)
+        self._mermaid_cache[key] = mermaid
+        if len(self._mermaid_cache) > _MERMAID_CACHE_MAX:
+            self._mermaid_cache.popitem(last=False)
+        return mermaid
 
     def _validate_ingest(self, nodes_created: int) -> list[str]:
         """Run post-ingest quality checks on the graph.
@@ -378,7 +552,7 @@ class Graph:
         try:
             info = self.schema()
         except Exception as exc:
-            log.warning("validate_ingest.schema_failed", error=str(exc))
+            _log().warning("validate_ingest.schema_failed", error=str(exc))
             return [f"Could not validate: {exc}"]
 
         for label in info.node_labels:
@@ -402,7 +576,7 @@ class Graph:
                 )
 
         if warnings:
-            log.info("validate_ingest.warnings", count=len(warnings))
+            _log().info("validate_ingest.warnings", count=len(warnings))
 
         return warnings
 
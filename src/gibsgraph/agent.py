@@ -2,15 +2,23 @@
 
 from __future__ import annotations
 
-from typing import Any
+import asyncio
+import logging
+import operator
+import os
+from collections.abc import Callable, Coroutine, Sequence
+from functools import cache, lru_cache
+from typing import Annotated, Any
 
 import structlog
 from langchain_core.language_models.chat_models import BaseChatModel
+from langchain_core.messages import BaseMessage
+from langchain_core.runnables import Runnable, RunnableConfig, RunnableLambda
 from langgraph.graph import END, START, StateGraph
 from langgraph.graph.state import CompiledStateGraph
 from pydantic import BaseModel, Field
 
-from gibsgraph.config import Settings, get_settings
+from gibsgraph.config import Settings, get_settings, provider_for_model
 from gibsgraph.kg_builder.builder import KGBuilder
 from gibsgraph.retrieval.retriever import GraphRetriever
 from gibsgraph.tools.cypher_validator import CypherValidator
@@ -26,12 +34,23 @@ def _make_llm(settings: Settings) -> BaseChatModel:
     class to instantiate.  Providers with a ``base_url`` (e.g. xAI/Grok)
     are OpenAI-compatible and reuse ``ChatOpenAI``.  Falls back to OpenAI
     for unknown model names.
+
+    Clients are cached per (model, temperature, retries, API key), so every
+    node and every query reuses the same client and its HTTP connection pool.
+    The provider's current key is part of the cache key, so a rotated key
+    gets a fresh client.
     """
-    import os
+    provider = provider_for_model(settings.llm_model)
+    api_key = os.getenv(provider.env_key if provider else "OPENAI_API_KEY")
+    return _make_llm_cached(
+        settings.llm_model, settings.llm_temperature, settings.llm_max_retries, api_key
+    )
 
-    from gibsgraph.config import provider_for_model
 
-    model = settings.llm_model
+@lru_cache(maxsize=8)
+def _make_llm_cached(
+    model: str, temperature: float, max_retries: int, api_key: str | None
+) -> BaseChatModel:
     provider = provider_for_model(model)
 
     if provider and provider.name == "anthropic":
@@ -39,16 +58,16 @@ def _make_llm(settings: Settings) -> BaseChatModel:
 
         return ChatAnthropic(
             model=model,  # type: ignore[call-arg]
-            temperature=settings.llm_temperature,
-            max_retries=settings.llm_max_retries,
+            temperature=temperature,
+            max_retries=max_retries,
         )
     if provider and provider.name == "mistral":
         from langchain_mistralai import ChatMistralAI  # type: ignore[import-not-found]
 
         return ChatMistralAI(  # type: ignore[no-any-return]
             model=model,
-            temperature=settings.llm_temperature,
-            max_retries=settings.llm_max_retries,
+            temperature=temperature,
+            max_retries=max_retries,
         )
     # OpenAI-compatible providers (xAI/Grok, etc.) — same class, custom base_url
     from langchain_openai import ChatOpenAI
@@ -56,19 +75,82 @@ def _make_llm(settings: Settings) -> BaseChatModel:
     if provider and provider.base_url:
         return ChatOpenAI(
             model=model,
-            temperature=settings.llm_temperature,
-            max_retries=settings.llm_max_retries,
+            temperature=temperature,
+            max_retries=max_retries,
             base_url=provider.base_url,
-            api_key=os.getenv(provider.env_key) or "",  # type: ignore[arg-type]
+            api_key=api_key or "",  # type: ignore[arg-type]
         )
     # Default: native OpenAI (also handles unknown model names)
     return ChatOpenAI(
         model=model,
-        temperature=settings.llm_temperature,
-        max_retries=settings.llm_max_retries,
+        temperature=temperature,
+        max_retries=max_retries,
+    )
+
+
+# The LLM cache gibsgraph installed last, so LLM_CACHE=none can remove it again.
+_installed_llm_cache: Any = None
+
+
+@lru_cache(maxsize=1)
+def _install_llm_cache(backend: str, path: str) -> None:
+    """Install LangChain's process-wide LLM response cache, once per config.
+
+    With a cache installed, a prompt identical to an earlier one (same
+    model and parameters) is answered from the cache without an API call.
+    Switching to ``none`` clears a cache gibsgraph installed earlier, but
+    leaves one set up by the host application alone.
+    """
+    global _installed_llm_cache
+    from langchain_core.globals import get_llm_cache, set_llm_cache
+
+    if backend == "none":
+        if _installed_llm_cache is not None and get_llm_cache() is _installed_llm_cache:
+            set_llm_cache(None)
+        _installed_llm_cache = None
+        return
+    if backend == "memory":
+        from langchain_core.caches import InMemoryCache
+
+        _installed_llm_cache = InMemoryCache()
+    elif backend == "sqlite":
+        from langchain_community.cache import SQLiteCache  # type: ignore[import-not-found]
+
+        _installed_llm_cache = SQLiteCache(database_path=path)
+    set_llm_cache(_installed_llm_cache)
+
+
+@lru_cache(maxsize=1)
+def _configure_log_level(level: str) -> None:
+    """Filter the agent's logger below ``level``, making dropped calls no-ops.
+
+    Filtering bound loggers skip event formatting entirely, unlike a
+    handler-level filter that drops the record after it is built. Only this
+    module's logger is rewrapped; the application's structlog configuration
+    (processors, logger factory) is left as it is.
+    """
+    global log
+    log = structlog.wrap_logger(
+        None,
+        wrapper_class=structlog.make_filtering_bound_logger(logging.getLevelName(level)),
+        logger_factory_args=(__name__,),
     )
 
 
+def run_async[T](main: Coroutine[Any, Any, T]) -> T:
+    """Run *main* to completion on uvloop when installed, else with ``asyncio.run``.
+
+    An opt-in entry point for scripts driving ``ask_async`` / ``ask_many_async``:
+    uvloop comes from the ``gibsgraph[uvloop]`` extra, and nothing process-wide
+    (such as the event loop policy) is changed.
+    """
+    try:
+        import uvloop  # type: ignore[import-not-found]
+    except ImportError:
+        return asyncio.run(main)
+    return uvloop.run(main)  # type: ignore[no-any-return]
+
+
 # ---------------------------------------------------------------------------
 # State
 # ---------------------------------------------------------------------------
@@ -120,7 +202,14 @@ class IntentClassification(BaseModel):
 
 
 class AgentState(BaseModel):
-    """Immutable-style state passed between agent nodes."""
+    """Immutable-style state passed between agent nodes.
+
+    ``errors`` and ``steps`` carry LangGraph reducers: nodes return only
+    their delta (``{"steps": 1}``, ``{"errors": (msg,)}``) and the graph
+    accumulates them, so no node copies the running totals. ``errors`` is
+    a tuple, so error-free states share the empty ``()`` instead of each
+    allocating a list.
+    """
 
     query: str
     usecase: str = ""
@@ -131,8 +220,8 @@ class AgentState(BaseModel):
     explanation: str = ""
     cypher_used: str = ""
     visualization_url: str = ""
-    errors: list[str] = Field(default_factory=list)
-    steps: int = 0
+    errors: Annotated[tuple[str, ...], operator.add] = ()
+    steps: Annotated[int, operator.add] = 0
     requires_human_review: bool = False
 
 
@@ -161,6 +250,17 @@ _CLASSIFY_PROMPT = (
 )
 
 
+_EXPLAIN_PROMPT = (
+    "You are a knowledge graph analyst. Answer ONLY from the graph data "
+    "below, citing the exact nodes, articles or relationships. If the "
+    "data is insufficient, say so.\n\n"
+    "{intent_context}"
+    "Question: {query}\n\n"
+    "Graph data:\n{context}\n\n"
+    "Cypher used: {cypher}"
+)
+
+
 def classify_intent(state: AgentState, *, settings: Settings) -> dict[str, Any]:
     """Extract structured intent from the user's free-form input.
 
@@ -174,26 +274,45 @@ def classify_intent(state: AgentState, *, settings: Settings) -> dict[str, Any]:
     try:
         structured_llm = llm.with_structured_output(IntentClassification)
         result = structured_llm.invoke(_CLASSIFY_PROMPT.format(query=state.query))
+        return _intent_update(result)
+    except Exception as exc:
+        log.warning("classify_intent.failed", error=str(exc))
+        return {"steps": 1}
 
-        if not isinstance(result, IntentClassification):
-            log.warning("classify_intent.unexpected_type", type=type(result).__name__)
-            return {"steps": state.steps + 1}
 
-        log.info(
-            "classify_intent.done",
-            action=result.action,
-            industry=result.industry,
-            region=result.region,
-            regulations=result.regulations,
-        )
-        return {
-            "intent": result,
-            "usecase": f"{result.industry}/{result.goal}" if result.industry else "",
-            "steps": state.steps + 1,
-        }
+async def classify_intent_async(state: AgentState, *, settings: Settings) -> dict[str, Any]:
+    """Async version of classify_intent(); awaits the LLM instead of blocking."""
+    log.info("classify_intent", query=state.query[:100])
+
+    llm = _make_llm(settings)
+
+    try:
+        structured_llm = llm.with_structured_output(IntentClassification)
+        result = await structured_llm.ainvoke(_CLASSIFY_PROMPT.format(query=state.query))
+        return _intent_update(result)
     except Exception as exc:
         log.warning("classify_intent.failed", error=str(exc))
-        return {"steps": state.steps + 1}
+        return {"steps": 1}
+
+
+def _intent_update(result: object) -> dict[str, Any]:
+    """State update for a classifier result (ignored unless it is well-typed)."""
+    if not isinstance(result, IntentClassification):
+        log.warning("classify_intent.unexpected_type", type=type(result).__name__)
+        return {"steps": 1}
+
+    log.info(
+        "classify_intent.done",
+        action=result.action,
+        industry=result.industry,
+        region=result.region,
+        regulations=result.regulations,
+    )
+    return {
+        "intent": result,
+        "usecase": f"{result.industry}/{result.goal}" if result.industry else "",
+        "steps": 1,
+    }
 
 
 def retrieve_subgraph(
@@ -209,55 +328,122 @@ def retrieve_subgraph(
             "subgraph": result.subgraph,
             "retrieved_context": result.context,
             "cypher_used": result.cypher,
-            "steps": state.steps + 1,
+            "steps": 1,
         }
     except Exception as exc:
         log.error("retrieve_subgraph_failed", error=str(exc))
-        return {"errors": [*state.errors, str(exc)], "steps": state.steps + 1}
+        return {"errors": (str(exc),), "steps": 1}
 
 
 def generate_explanation(state: AgentState, *, settings: Settings) -> dict[str, Any]:
     """Generate a natural language explanation from the retrieved context."""
     log.info("generate_explanation")
 
-    if not state.retrieved_context or state.retrieved_context == "No results found.":
+    prompt = _explanation_prompt(state, max_context_chars=settings.llm_context_max_chars)
+    if prompt is None:
         return {
             "explanation": "No relevant information found in the knowledge graph.",
-            "steps": state.steps + 1,
+            "steps": 1,
         }
 
-    llm = _make_llm(settings)
+    response = _make_llm(settings).invoke(prompt)
+    return _explanation_update(response)
+
+
+async def generate_explanation_async(state: AgentState, *, settings: Settings) -> dict[str, Any]:
+    """Async version of generate_explanation(); awaits the LLM instead of blocking."""
+    log.info("generate_explanation")
+
+    prompt = _explanation_prompt(state, max_context_chars=settings.llm_context_max_chars)
+    if prompt is None:
+        return {
+            "explanation": "No relevant information found in the knowledge graph.",
+            "steps": 1,
+        }
 
-    # Build context-aware prompt using classified intent
-    intent_context = ""
-    if state.intent.industry:
-        intent_context += f"Industry: {state.intent.industry}\n"
-    if state.intent.region:
-        intent_context += f"Region: {state.intent.region}\n"
-    if state.intent.regulations:
-        intent_context += f"Regulations: {', '.join(state.intent.regulations)}\n"
-    if state.intent.goal:
-        intent_context += f"User goal: {state.intent.goal}\n"
-
-    prompt = (
-        "You are a knowledge graph analyst. Answer the user's question based "
-        "ONLY on the graph data provided below. Be specific and cite the "
-        "exact nodes, articles, or relationships from the data.\n\n"
-        "If the data doesn't contain enough information, say so clearly.\n\n"
+    response = await _make_llm(settings).ainvoke(prompt)
+    return _explanation_update(response)
+
+
+def _explanation_prompt(state: AgentState, *, max_context_chars: int) -> str | None:
+    """Build the explanation prompt, or None when there is nothing to explain."""
+    if not state.retrieved_context or state.retrieved_context == "No results found.":
+        return None
+
+    # Context-aware prompt using classified intent
+    intent = state.intent
+    intent_lines = [
+        f"{label}: {value}\n"
+        for label, value in (
+            ("Industry", intent.industry),
+            ("Region", intent.region),
+            ("Regulations", ", ".join(intent.regulations)),
+            ("User goal", intent.goal),
+        )
+        if value
+    ]
+    return _EXPLAIN_PROMPT.format(
+        intent_context=f"Context:\n{''.join(intent_lines)}\n" if intent_lines else "",
+        query=state.query,
+        context=_compress_context(state.retrieved_context, max_context_chars),
+        cypher=state.cypher_used,
     )
-    if intent_context:
-        prompt += f"Context:\n{intent_context}\n"
-    prompt += (
-        f"Question: {state.query}\n\n"
-        f"Graph data:\n{state.retrieved_context}\n\n"
-        f"Cypher used: {state.cypher_used}"
+
+
+def _compress_context(context: str, max_chars: int) -> str:
+    """Drop repeated lines and cut at a line boundary once ``max_chars`` is reached.
+
+    Retrieval returns the most relevant rows first, so the tail is what goes.
+    Blank lines are kept as section separators.
+    """
+    kept: list[str] = []
+    seen: set[str] = set()
+    size = 0
+    for line in context.splitlines():
+        if line.strip():
+            if line in seen:
+                continue
+            seen.add(line)
+        size += len(line) + 1
+        if size > max_chars:
+            if not kept:
+                kept.append(line[:max_chars])
+            break
+        kept.append(line)
+    return "\n".join(kept)
+
+
+def _message_text(content: str | list[Any]) -> str:
+    """Text of a message chunk's content, which is a string or a list of blocks.
+
+    Anthropic streams content blocks such as ``{"type": "text", "text": ...}``;
+    non-text blocks (tool calls, partial JSON) contribute nothing.
+    """
+    if isinstance(content, str):
+        return content
+    return "".join(
+        block if isinstance(block, str) else block.get("text", "")
+        for block in content
+        if isinstance(block, str) or block.get("type") == "text"
     )
 
-    response = llm.invoke(prompt)
 
+def _explanation_update(response: BaseMessage) -> dict[str, Any]:
     explanation = str(response.content).strip()
     log.info("generate_explanation.done", length=len(explanation))
-    return {"explanation": explanation, "steps": state.steps + 1}
+    return {"explanation": explanation, "steps": 1}
+
+
+def skip_explanation(state: AgentState) -> dict[str, Any]:
+    """Use the retrieved graph data as the answer, without an LLM call.
+
+    For schema inspection the retrieved structure already is the answer.
+    """
+    log.info("skip_explanation")
+    explanation = state.retrieved_context
+    if not explanation or explanation == "No results found.":
+        explanation = "No relevant information found in the knowledge graph."
+    return {"explanation": explanation, "steps": 1}
 
 
 def validate_output(state: AgentState) -> dict[str, Any]:
@@ -265,16 +451,16 @@ def validate_output(state: AgentState) -> dict[str, Any]:
     validator = CypherValidator()
     is_valid = validator.validate(state.cypher_used) if state.cypher_used else True
     requires_review = not is_valid or bool(state.errors)
-    return {"requires_human_review": requires_review, "steps": state.steps + 1}
+    return {"requires_human_review": requires_review, "steps": 1}
 
 
 def visualize(state: AgentState, *, settings: Settings) -> dict[str, Any]:
     """Generate Mermaid / Neo4j Bloom visualization URL."""
     if not state.subgraph:
-        return {"steps": state.steps + 1}
+        return {"steps": 1}
     viz = GraphVisualizer(settings=settings)
     url = viz.bloom_url(state.subgraph)
-    return {"visualization_url": url, "steps": state.steps + 1}
+    return {"visualization_url": url, "steps": 1}
 
 
 # ---------------------------------------------------------------------------
@@ -282,6 +468,13 @@ def visualize(state: AgentState, *, settings: Settings) -> dict[str, Any]:
 # ---------------------------------------------------------------------------
 
 
+def route_explanation(state: AgentState) -> str:
+    """Route: schema questions skip the explanation LLM call."""
+    if state.intent.action == "schema" and not state.errors:
+        return "skip_explain"
+    return "explain"
+
+
 def should_continue(state: AgentState, max_steps: int = 10) -> str:
     """Route: stop on error/max_steps, human-review, or continue."""
     if state.steps >= max_steps or len(state.errors) >= 3:
@@ -298,34 +491,71 @@ def should_continue(state: AgentState, max_steps: int = 10) -> str:
 
 def build_graph(
     settings: Settings | None = None, *, retriever: GraphRetriever | None = None
-) -> CompiledStateGraph:  # type: ignore[type-arg]
-    """Compile and return the LangGraph agent."""
+) -> Runnable[Any, Any]:
+    """Return the LangGraph agent bound to ``settings`` and ``retriever``.
+
+    The graph itself is compiled once per process (see _compiled_graph);
+    settings and retriever travel in the run config, so creating more
+    agents does not recompile it.
+    """
     settings = settings or get_settings()
+    _install_llm_cache(settings.llm_cache, settings.llm_cache_path)
     _retriever = retriever or GraphRetriever(settings=settings)
+    return _compiled_graph().with_config(
+        configurable={"settings": settings, "retriever": _retriever}
+    )
+
+
+@cache
+def _compiled_graph() -> CompiledStateGraph:  # type: ignore[type-arg]
+    """Compile the agent graph; nodes read their dependencies from the run config."""
 
-    def _classify(state: AgentState) -> dict[str, Any]:
-        return classify_intent(state, settings=settings)
+    def _settings(config: RunnableConfig) -> Settings:
+        settings: Settings = config["configurable"]["settings"]
+        return settings
 
-    def _retrieve(state: AgentState) -> dict[str, Any]:
-        return retrieve_subgraph(state, settings=settings, retriever=_retriever)
+    # Retrieval needs the classifier's enriched query, so the chain stays
+    # sequential. The LLM and Neo4j nodes get async variants so ainvoke()
+    # (ask_async) never blocks the event loop.
+    def _classify(state: AgentState, config: RunnableConfig) -> dict[str, Any]:
+        return classify_intent(state, settings=_settings(config))
 
-    def _explain(state: AgentState) -> dict[str, Any]:
-        return generate_explanation(state, settings=settings)
+    async def _aclassify(state: AgentState, config: RunnableConfig) -> dict[str, Any]:
+        return await classify_intent_async(state, settings=_settings(config))
 
-    def _visualize(state: AgentState) -> dict[str, Any]:
-        return visualize(state, settings=settings)
+    def _retrieve(state: AgentState, config: RunnableConfig) -> dict[str, Any]:
+        retriever: GraphRetriever = config["configurable"]["retriever"]
+        return retrieve_subgraph(state, settings=_settings(config), retriever=retriever)
+
+    async def _aretrieve(state: AgentState, config: RunnableConfig) -> dict[str, Any]:
+        return await asyncio.to_thread(_retrieve, state, config)
+
+    def _explain(state: AgentState, config: RunnableConfig) -> dict[str, Any]:
+        return generate_explanation(state, settings=_settings(config))
+
+    async def _aexplain(state: AgentState, config: RunnableConfig) -> dict[str, Any]:
+        return await generate_explanation_async(state, settings=_settings(config))
+
+    def _visualize(state: AgentState, config: RunnableConfig) -> dict[str, Any]:
+        return visualize(state, settings=_settings(config))
 
     graph = StateGraph(AgentState)
-    graph.add_node("classify", _classify)
-    graph.add_node("retrieve", _retrieve)
-    graph.add_node("explain", _explain)
+    graph.add_node("classify", RunnableLambda(_classify, afunc=_aclassify))
+    graph.add_node("retrieve", RunnableLambda(_retrieve, afunc=_aretrieve))
+    graph.add_node("explain", RunnableLambda(_explain, afunc=_aexplain))
+    graph.add_node("skip_explain", skip_explanation)
     graph.add_node("validate", validate_output)
     graph.add_node("visualize", _visualize)
 
     graph.add_edge(START, "classify")
     graph.add_edge("classify", "retrieve")
-    graph.add_edge("retrieve", "explain")
+    graph.add_conditional_edges(
+        "retrieve",
+        route_explanation,
+        {"explain": "explain", "skip_explain": "skip_explain"},
+    )
     graph.add_edge("explain", "validate")
+    graph.add_edge("skip_explain", "validate")
     graph.add_conditional_edges(
         "validate",
         should_continue,
@@ -346,6 +576,8 @@ class GibsGraphAgent:
 
     def __init__(self, settings: Settings | None = None) -> None:
         self.settings = settings or get_settings()
+        if self.settings.log_level:
+            _configure_log_level(self.settings.log_level)
         self._retriever = GraphRetriever(settings=self.settings)
         self._graph = build_graph(self.settings, retriever=self._retriever)
         self.kg_builder = KGBuilder(settings=self.settings)
@@ -355,18 +587,69 @@ class GibsGraphAgent:
         """Create agent from environment variables / .env file."""
         return cls(settings=get_settings())
 
-    def ask(self, query: str) -> AgentState:
-        """Run the full agent pipeline for a natural language query."""
+    def ask(self, query: str, *, on_token: Callable[[str], None] | None = None) -> AgentState:
+        """Run the full agent pipeline for a natural language query.
+
+        If ``on_token`` is given, the explanation is streamed: it is called
+        with each text chunk as the LLM produces it, before ask() returns.
+        """
         log.info("agent.ask", query=query[:120])
         initial = AgentState(query=query)
-        result = self._graph.invoke(initial)
-        return AgentState(**result)
+        if on_token is None:
+            result = self._graph.invoke(initial)
+        else:
+            result = self._stream(initial, on_token)
+        return AgentState.model_construct(**result)
+
+    def _stream(self, initial: AgentState, on_token: Callable[[str], None]) -> dict[str, Any]:
+        """Run the graph, forwarding explain-node tokens; return the final state."""
+        result: dict[str, Any] = {}
+        for mode, chunk in self._graph.stream(initial, stream_mode=["messages", "values"]):
+            if mode == "values":
+                result = chunk
+                continue
+            message, metadata = chunk
+            if metadata.get("langgraph_node") != "explain":
+                continue
+            text = _message_text(message.content)
+            if text:
+                on_token(text)
+        return result
 
     async def ask_async(self, query: str) -> AgentState:
         """Async version of ask()."""
         initial = AgentState(query=query)
         result = await self._graph.ainvoke(initial)
-        return AgentState(**result)
+        return AgentState.model_construct(**result)
+
+    def ask_many(
+        self, queries: Sequence[str], *, max_concurrency: int | None = None
+    ) -> list[AgentState]:
+        """Run the pipeline for several queries at once; results keep input order.
+
+        Up to ``max_concurrency`` runs (default: settings.agent_max_concurrency)
+        are in flight together, so I/O-bound LLM and Neo4j calls overlap.
+        """
+        log.info("agent.ask_many", count=len(queries))
+        results = self._graph.batch(
+            [AgentState(query=q) for q in queries], config=self._batch_config(max_concurrency)
+        )
+        return [AgentState.model_construct(**r) for r in results]
+
+    async def ask_many_async(
+        self, queries: Sequence[str], *, max_concurrency: int | None = None
+    ) -> list[AgentState]:
+        """Async version of ask_many()."""
+        results = await self._graph.abatch(
+            [AgentState(query=q) for q in queries], config=self._batch_config(max_concurrency)
+        )
+        return [AgentState.model_construct(**r) for r in results]
+
+    def _batch_config(self, max_concurrency: int | None) -> RunnableConfig:
+        """Batch config capping in-flight runs, defaulting to the configured limit."""
+        if max_concurrency is None:
+            max_concurrency = self.settings.agent_max_concurrency
+        return {"max_concurrency": max_concurrency}
 
     def close(self) -> None:
         """Close Neo4j connections."""
@@ -2,68 +2,126 @@
 
 from __future__ import annotations
 
+import argparse
+import json
 import sys
+from functools import cache
 from pathlib import Path
+from typing import TYPE_CHECKING, Any
 
-import structlog
-from rich.console import Console
-from rich.panel import Panel
-from rich.text import Text
+if TYPE_CHECKING:
+    from rich.console import Console
+    from structlog.typing import FilteringBoundLogger
 
-log = structlog.get_logger(__name__)
-console = Console()
+    from gibsgraph import Answer
 
 _VERSION = "0.4.1"
 
 
+@cache
+def _log() -> FilteringBoundLogger:
+    """Module logger, created on first use so --help/--version skip structlog."""
+    import structlog
+
+    logger: FilteringBoundLogger = structlog.get_logger(__name__)
+    return logger
+
+
+@cache
+def _console() -> Console:
+    """Rich console, created on first use so --help/--version skip importing rich."""
+    from rich.console import Console
+
+    return Console()
+
+
+def _build_parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(
+        prog="gibsgraph",
+        description="GibsGraph — natural language queries for Neo4j",
+        epilog="Set NEO4J_PASSWORD and OPENAI_API_KEY (or ANTHROPIC_API_KEY) first.",
+    )
+    parser.add_argument("--version", action="version", version=f"gibsgraph {_VERSION}")
+    sub = parser.add_subparsers(dest="command", required=True, metavar="<command>")
+
+    ask = sub.add_parser("ask", help="Ask a question about your graph")
+    ask.add_argument("question", nargs="*", help="the question (quotes optional)")
+    ask.add_argument(
+        "--batch", metavar="FILE", help="ask each non-blank line of FILE, concurrently"
+    )
+    ask.add_argument(
+        "--max-concurrency",
+        type=int,
+        metavar="N",
+        help="with --batch, run at most N questions at once (default: AGENT_MAX_CONCURRENCY)",
+    )
+    ask.add_argument("--format", choices=("text", "json"), default="text")
+
+    ingest = sub.add_parser("ingest", help="Ingest a text file into the graph")
+    ingest.add_argument("path", help="UTF-8 text file to ingest")
+    return parser
+
+
 def main() -> None:
     """CLI entrypoint."""
-    if len(sys.argv) < 2 or sys.argv[1] in ("--help", "-h"):
-        console.print("[bold]GibsGraph[/] — natural language queries for Neo4j\n")
-        console.print("[bold]Usage:[/]")
-        console.print("  gibsgraph ask <question>    Ask a question about your graph")
-        console.print("  gibsgraph ingest <file>     Ingest a text file into the graph")
-        console.print("  gibsgraph --version         Show version")
-        console.print("  gibsgraph --help            Show this help\n")
-        console.print("[dim]Set NEO4J_PASSWORD and OPENAI_API_KEY (or ANTHROPIC_API_KEY) first.[/]")
-        sys.exit(0)
-
-    command = sys.argv[1]
-
-    if command == "--version":
-        console.print(f"gibsgraph {_VERSION}")
-        sys.exit(0)
-
-    if command == "ask":
-        if len(sys.argv) < 3:
-            console.print("[bold red]Error:[/] Please provide a question.")
-            sys.exit(1)
-        question = " ".join(sys.argv[2:])
-        _cmd_ask(question)
-
-    elif command == "ingest":
-        if len(sys.argv) < 3:
-            console.print("[bold red]Error:[/] Please provide a file path.")
-            sys.exit(1)
-        path = sys.argv[2]
-        _cmd_ingest(path)
-
+    parser = _build_parser()
+    args = parser.parse_args()
+
+    if args.command == "ask":
+        if args.batch:
+            _cmd_ask_batch(
+                args.batch, output_format=args.format, max_concurrency=args.max_concurrency
+            )
+        elif args.question:
+            _cmd_ask(" ".join(args.question), output_format=args.format)
+        else:
+            parser.error("ask: provide a question or --batch FILE")
     else:
-        console.print(f"[bold red]Unknown command:[/] {command}")
-        console.print("Run [bold]gibsgraph --help[/] for usage.")
-        sys.exit(1)
+        _cmd_ingest(args.path)
+
+
+def _answer_dict(answer: Answer) -> dict[str, Any]:
+    from dataclasses import asdict
+
+    return asdict(answer)
+
+
+def _print_json(payload: object) -> None:
+    sys.stdout.write(json.dumps(payload, indent=2) + "\n")
+
 
+def _cmd_ask(question: str, *, output_format: str = "text") -> None:
+    from rich.panel import Panel
+    from rich.text import Text
 
-def _cmd_ask(question: str) -> None:
     from gibsgraph import Graph
 
-    console.print(f"\n[bold cyan]GibsGraph[/] — asking: [italic]{question}[/]\n")
+    console = _console()
+    as_json = output_format == "json"
+    if not as_json:
+        console.print(f"\n[bold cyan]GibsGraph[/] — asking: [italic]{question}[/]\n")
+
+    streamed = False
+
+    def _print_token(text: str) -> None:
+        nonlocal streamed
+        if not streamed:
+            console.print("[bold green]Answer:[/]")
+            streamed = True
+        console.print(Text(text), end="")
 
     try:
         with Graph() as g:
-            result = g.ask(question)
+            result = g.ask(question, on_token=None if as_json else _print_token)
+
+        if as_json:
+            _print_json(_answer_dict(result))
+            return
 
-        console.print(Panel(Text(result.answer), title="Answer", border_style="green"))
+        if streamed:
+            console.print()
+        else:
+            console.print(Panel(Text(result.answer), title="Answer", border_style="green"))
 
         if result.cypher:
             console.print(f"\n[dim]Cypher used:[/]\n{result.cypher}")
@@ -76,13 +134,48 @@ def _cmd_ask(question: str) -> None:
 
     except Exception as exc:
         console.print(f"[bold red]Error:[/] {exc}")
-        log.exception("cli.ask_failed")
+        _log().exception("cli.ask_failed")
+        sys.exit(1)
+
+
+def _cmd_ask_batch(
+    path: str, *, output_format: str = "text", max_concurrency: int | None = None
+) -> None:
+    from rich.panel import Panel
+    from rich.text import Text
+
+    from gibsgraph import Graph
+
+    console = _console()
+    as_json = output_format == "json"
+    if not as_json:
+        console.print(f"\n[bold cyan]GibsGraph[/] — asking questions from: [italic]{path}[/]\n")
+
+    try:
+        lines = Path(path).read_text(encoding="utf-8").splitlines()
+        questions = [line.strip() for line in lines if line.strip()]
+        with Graph() as g:
+            answers = g.ask_many(questions, max_concurrency=max_concurrency)
+
+        if as_json:
+            _print_json([_answer_dict(a) for a in answers])
+            return
+
+        for question, result in zip(questions, answers, strict=True):
+            console.print(Panel(Text(result.answer), title=question, border_style="green"))
+            if result.errors:
+                console.print(f"[yellow]Warnings:[/] {result.errors}\n")
+
+    except Exception as exc:
+        console.print(f"[bold red]Error:[/] {exc}")
+        _log().exception("cli.ask_batch_failed")
         sys.exit(1)
 
 
 def _cmd_ingest(path: str) -> None:
     from gibsgraph import Graph
 
+    console = _console()
     console.print(f"\n[bold cyan]GibsGraph[/] — ingesting: [italic]{path}[/]\n")
 
     try:
@@ -92,7 +185,7 @@ def _cmd_ingest(path: str) -> None:
         console.print(f"[green]{result}[/]")
     except Exception as exc:
         console.print(f"[bold red]Error:[/] {exc}")
-        log.exception("cli.ingest_failed")
+        _log().exception("cli.ingest_failed")
         sys.exit(1)
 
 
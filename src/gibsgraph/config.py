@@ -2,6 +2,8 @@
 
 from __future__ import annotations
 
+import logging
+import warnings
 from dataclasses import dataclass
 from functools import lru_cache
 
@@ -61,8 +63,12 @@ DEFAULT_EMBEDDING_MODEL = "text-embedding-3-small"
 DEFAULT_EMBEDDING_DIMENSIONS = 1536
 
 
+@lru_cache(maxsize=64)
 def provider_for_model(model: str) -> LLMProvider | None:
-    """Return the provider that owns a given model name, or None."""
+    """Return the provider that owns a given model name, or None.
+
+    Cached: ``PROVIDERS`` is immutable, so the answer for a model never changes.
+    """
     for p in PROVIDERS:
         if any(model.startswith(prefix) for prefix in p.model_prefixes):
             return p
@@ -86,6 +92,7 @@ class Settings(BaseSettings):
     neo4j_database: str = Field(default="neo4j", alias="NEO4J_DATABASE")
     neo4j_read_only: bool = Field(default=True, alias="NEO4J_READ_ONLY")
     neo4j_max_connection_lifetime: int = Field(default=3600, alias="NEO4J_MAX_CONNECTION_LIFETIME")
+    neo4j_max_connection_pool_size: int = Field(default=100, alias="NEO4J_MAX_CONNECTION_POOL_SIZE")
 
     # LLM
     openai_api_key: SecretStr | None = Field(default=None, alias="OPENAI_API_KEY")
@@ -95,6 +102,12 @@ class Settings(BaseSettings):
     llm_model: str = Field(default=PROVIDERS[0].default_model, alias="LLM_MODEL")
     llm_temperature: float = Field(default=0.0, alias="LLM_TEMPERATURE")
     llm_max_retries: int = Field(default=3, alias="LLM_MAX_RETRIES")
+    # Response cache for identical prompts: "none", "memory" or "sqlite"
+    # ("sqlite" requires langchain-community). Only deterministic at temperature 0.
+    llm_cache: str = Field(default="none", alias="LLM_CACHE")
+    llm_cache_path: str = Field(default=".gibsgraph_llm_cache.db", alias="LLM_CACHE_PATH")
+    # Upper bound on retrieved graph context sent to the explanation prompt
+    llm_context_max_chars: int = Field(default=12000, alias="LLM_CONTEXT_MAX_CHARS")
 
     # Embeddings
     embedding_model: str = Field(default=DEFAULT_EMBEDDING_MODEL, alias="EMBEDDING_MODEL")
@@ -104,6 +117,7 @@ class Settings(BaseSettings):
 
     # Agent
     agent_max_steps: int = Field(default=10, alias="AGENT_MAX_STEPS")
+    agent_max_concurrency: int = Field(default=8, alias="AGENT_MAX_CONCURRENCY")
     agent_checkpoint_db: str = Field(
         default="sqlite:///checkpoints.db", alias="AGENT_CHECKPOINT_DB"
     )
@@ -113,6 +127,11 @@ class Settings(BaseSettings):
     langsmith_project: str = Field(default="gibsgraph", alias="LANGSMITH_PROJECT")
     langsmith_tracing: bool = Field(default=False, alias="LANGSMITH_TRACING")
 
+    # Logging: when set (DEBUG/INFO/WARNING/ERROR/CRITICAL), the agent's logger drops
+    # lower levels before formatting. Global structlog configuration is never touched.
+    # Scoped name so a host-wide LOG_LEVEL meant for other tools is not picked up.
+    log_level: str | None = Field(default=None, alias="GIBSGRAPH_LOG_LEVEL")
+
     # Security
     rate_limit_per_minute: int = Field(default=60, alias="RATE_LIMIT_PER_MINUTE")
 
@@ -131,6 +150,37 @@ class Settings(BaseSettings):
             raise ValueError(msg)
         return v
 
+    @field_validator("llm_cache")
+    @classmethod
+    def validate_llm_cache(cls, v: str) -> str:
+        """Ensure the LLM cache backend is one we know how to install."""
+        allowed = ("none", "memory", "sqlite")
+        if v not in allowed:
+            msg = f"LLM_CACHE must be one of {allowed}"
+            raise ValueError(msg)
+        return v
+
+    @field_validator("log_level")
+    @classmethod
+    def validate_log_level(cls, v: str | None) -> str | None:
+        """Normalise GIBSGRAPH_LOG_LEVEL to a standard level name.
+
+        Aliases known to :mod:`logging` (``WARN``, ``FATAL``) map to their
+        canonical names; unknown values are ignored with a warning instead of
+        failing settings construction.
+        """
+        if v is None:
+            return v
+        level = logging.getLevelNamesMapping().get(v.strip().upper())
+        if not level:
+            warnings.warn(
+                f"Ignoring unknown GIBSGRAPH_LOG_LEVEL {v!r}; "
+                "expected DEBUG, INFO, WARNING, ERROR or CRITICAL",
+                stacklevel=2,
+            )
+            return None
+        return logging.getLevelName(level)
+
 
 @lru_cache(maxsize=1)
 def get_settings() -> Settings:
@@ -122,6 +122,7 @@ class KGBuilder:
             settings.neo4j_uri,
             auth=(settings.neo4j_username, settings.neo4j_password.get_secret_value()),
             max_connection_lifetime=settings.neo4j_max_connection_lifetime,
+            max_connection_pool_size=settings.neo4j_max_connection_pool_size,
         )
 
     # ------------------------------------------------------------------
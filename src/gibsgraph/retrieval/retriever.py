@@ -93,6 +93,7 @@ class GraphRetriever:
             settings.neo4j_uri,
             auth=(settings.neo4j_username, settings.neo4j_password.get_secret_value()),
             max_connection_lifetime=settings.neo4j_max_connection_lifetime,
+            max_connection_pool_size=settings.neo4j_max_connection_pool_size,
         )
         self._schema: GraphSchema | None = None
         self._expert = ExpertStore(self._driver, database=settings.neo4j_database)
@@ -7,11 +7,17 @@ import pytest
 from gibsgraph.agent import (
     AgentState,
     GibsGraphAgent,
+    _configure_log_level,
+    _install_llm_cache,
     _make_llm,
+    _make_llm_cached,
     build_graph,
     generate_explanation,
     retrieve_subgraph,
+    route_explanation,
+    run_async,
     should_continue,
+    skip_explanation,
     validate_output,
     visualize,
 )
@@ -29,6 +35,13 @@ def settings() -> Settings:
 # --- _make_llm ---
 
 
+@pytest.fixture(autouse=True)
+def _fresh_llm_cache():
+    _make_llm_cached.cache_clear()
+    yield
+    _make_llm_cached.cache_clear()
+
+
 @patch("langchain_openai.ChatOpenAI")
 def test_make_llm_openai(mock_openai, settings):
     settings_oa = Settings(
@@ -81,6 +94,79 @@ def test_make_llm_xai_grok(mock_openai):
     assert call_kwargs["model"] == "grok-3"
 
 
+@patch("langchain_openai.ChatOpenAI")
+def test_make_llm_reuses_client(mock_openai, settings):
+    assert _make_llm(settings) is _make_llm(settings)
+    mock_openai.assert_called_once()
+
+    hotter = settings.model_copy(update={"llm_temperature": 0.7})
+    _make_llm(hotter)
+    assert mock_openai.call_count == 2
+
+
+@patch("langchain_openai.ChatOpenAI")
+def test_make_llm_rotated_key_gets_new_client(mock_openai, settings):
+    with patch.dict("os.environ", {"OPENAI_API_KEY": "sk-old"}):
+        _make_llm(settings)
+    with patch.dict("os.environ", {"OPENAI_API_KEY": "sk-new"}):
+        _make_llm(settings)
+    assert mock_openai.call_count == 2
+
+
+def test_install_llm_cache_once():
+    _install_llm_cache.cache_clear()
+    try:
+        with patch("langchain_core.globals.set_llm_cache") as mock_set:
+            _install_llm_cache("none", "")
+            mock_set.assert_not_called()
+            _install_llm_cache("memory", "")
+            _install_llm_cache("memory", "")
+            mock_set.assert_called_once()
+    finally:
+        _install_llm_cache.cache_clear()
+
+
+def test_install_llm_cache_none_clears_previous_cache():
+    _install_llm_cache.cache_clear()
+    try:
+        with patch("langchain_core.globals.set_llm_cache") as mock_set:
+            _install_llm_cache("memory", "")
+            installed = mock_set.call_args[0][0]
+            with patch("langchain_core.globals.get_llm_cache", return_value=installed):
+                _install_llm_cache("none", "")
+            mock_set.assert_called_with(None)
+    finally:
+        _install_llm_cache("none", "")
+        _install_llm_cache.cache_clear()
+
+
+def test_configure_log_level_leaves_global_structlog_alone():
+    import gibsgraph.agent as agent_mod
+
+    original = agent_mod.log
+    _configure_log_level.cache_clear()
+    try:
+        with patch("structlog.configure") as mock_configure:
+            _configure_log_level("WARNING")
+        mock_configure.assert_not_called()
+        assert agent_mod.log is not original
+    finally:
+        agent_mod.log = original
+        _configure_log_level.cache_clear()
+
+
+def test_run_async_without_uvloop_uses_asyncio():
+    async def answer() -> int:
+        return 42
+
+    with (
+        patch.dict("sys.modules", {"uvloop": None}),
+        patch("asyncio.set_event_loop_policy") as mock_set,
+    ):
+        assert run_async(answer()) == 42
+    mock_set.assert_not_called()
+
+
 # --- should_continue ---
 
 
@@ -108,6 +194,26 @@ def test_should_continue_human_review():
     assert should_continue(state) == "human_review"
 
 
+# --- route_explanation / skip_explanation ---
+
+
+def test_route_explanation_skips_llm_for_schema():
+    from gibsgraph.agent import IntentClassification
+
+    schema = AgentState(query="test", intent=IntentClassification(action="schema"))
+    assert route_explanation(schema) == "skip_explain"
+    assert route_explanation(AgentState(query="test")) == "explain"
+    failed = schema.model_copy(update={"errors": ["boom"]})
+    assert route_explanation(failed) == "explain"
+
+
+def test_skip_explanation_uses_retrieved_context():
+    state = AgentState(query="test", retrieved_context="Labels: Person, Company")
+    assert skip_explanation(state) == {"explanation": "Labels: Person, Company", "steps": 1}
+    empty = skip_explanation(AgentState(query="test", retrieved_context="No results found."))
+    assert "No relevant information" in empty["explanation"]
+
+
 # --- validate_output ---
 
 
@@ -216,6 +322,32 @@ def test_build_graph_compiles(mock_retriever_cls, settings):
     assert graph is not None
 
 
+def test_build_graph_compiles_once(settings):
+    from gibsgraph.agent import _compiled_graph
+
+    _compiled_graph.cache_clear()
+    first = build_graph(settings, retriever=MagicMock())
+    build_graph(settings, retriever=MagicMock())
+    assert _compiled_graph.cache_info().misses == 1
+    assert first.config["configurable"]["settings"] is settings
+
+
+@patch("gibsgraph.agent._make_llm")
+@patch("gibsgraph.agent.GraphRetriever")
+def test_build_graph_accumulates_steps_and_errors(mock_retriever_cls, mock_make_llm, settings):
+    from gibsgraph.agent import IntentClassification
+
+    mock_make_llm.return_value.with_structured_output.return_value.invoke.return_value = (
+        IntentClassification()
+    )
+    mock_retriever_cls.return_value.retrieve.side_effect = RuntimeError("boom")
+
+    result = build_graph(settings).invoke(AgentState(query="q"))
+    # classify, retrieve, explain, validate each add one step; review stops the run
+    assert result["steps"] == 4
+    assert result["errors"] == ("boom",)
+
+
 # --- GibsGraphAgent ---
 
 
@@ -227,3 +359,45 @@ def test_agent_init(mock_kb, mock_ret, settings):
     agent.close()
     mock_ret.return_value.close.assert_called_once()
     mock_kb.return_value.close.assert_called_once()
+
+
+@patch("gibsgraph.agent.GraphRetriever")
+@patch("gibsgraph.agent.KGBuilder")
+def test_agent_ask_streams_explain_tokens(mock_kb, mock_ret, settings):
+    agent = GibsGraphAgent(settings=settings)
+    agent._graph = MagicMock()
+    agent._graph.stream.return_value = iter(
+        [
+            ("messages", (MagicMock(content="{intent}"), {"langgraph_node": "classify"})),
+            ("messages", (MagicMock(content="The answer "), {"langgraph_node": "explain"})),
+            (
+                "messages",
+                (
+                    MagicMock(content=[{"type": "text", "text": "is 42.", "index": 0}]),
+                    {"langgraph_node": "explain"},
+                ),
+            ),
+            ("messages", (MagicMock(content=[]), {"langgraph_node": "explain"})),
+            ("values", {"query": "q", "explanation": "The answer is 42.", "steps": 5}),
+        ]
+    )
+
+    tokens: list[str] = []
+    state = agent.ask("q", on_token=tokens.append)
+    assert tokens == ["The answer ", "is 42."]
+    assert state.explanation == "The answer is 42."
+    agent._graph.invoke.assert_not_called()
+
+
+@patch("gibsgraph.agent.GraphRetriever")
+@patch("gibsgraph.agent.KGBuilder")
+def test_agent_ask_many_batches(mock_kb, mock_ret, settings):
+    agent = GibsGraphAgent(settings=settings)
+    agent._graph = MagicMock()
+    agent._graph.batch.return_value = [{"query": "a", "steps": 5}, {"query": "b", "steps": 5}]
+
+    states = agent.ask_many(["a", "b"])
+    assert [s.query for s in states] == ["a", "b"]
+    inputs = agent._graph.batch.call_args[0][0]
+    assert [s.query for s in inputs] == ["a", "b"]
+    assert agent._graph.batch.call_args[1]["config"] == {"max_concurrency": 8}
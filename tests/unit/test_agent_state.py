@@ -1,10 +1,18 @@
 """Unit tests for AgentState and agent node functions."""
 
-from unittest.mock import MagicMock, patch
+from unittest.mock import AsyncMock, MagicMock, patch
 
 import pytest
 
-from gibsgraph.agent import AgentState, IntentClassification, classify_intent, generate_explanation
+from gibsgraph.agent import (
+    AgentState,
+    IntentClassification,
+    _compress_context,
+    classify_intent,
+    classify_intent_async,
+    generate_explanation,
+    generate_explanation_async,
+)
 from gibsgraph.config import Settings
 
 
@@ -20,7 +28,7 @@ def test_agent_state_defaults():
     state = AgentState(query="test question")
     assert state.query == "test question"
     assert state.steps == 0
-    assert state.errors == []
+    assert state.errors == ()
     assert state.subgraph is None
     assert state.requires_human_review is False
 
@@ -45,6 +53,18 @@ def test_generate_explanation_with_context(mock_make_llm, settings):
     assert result["steps"] == 1
 
 
+@patch("gibsgraph.agent._make_llm")
+async def test_generate_explanation_async_awaits_llm(mock_make_llm, settings):
+    mock_llm = MagicMock()
+    mock_llm.ainvoke = AsyncMock(return_value=MagicMock(content=" Beats, 2014. "))
+    mock_make_llm.return_value = mock_llm
+
+    state = AgentState(query="test", retrieved_context="Apple acquired Beats for $3B")
+    result = await generate_explanation_async(state, settings=settings)
+    assert result == {"explanation": "Beats, 2014.", "steps": 1}
+    mock_llm.invoke.assert_not_called()
+
+
 def test_agent_state_error_accumulation():
     state = AgentState(query="test", errors=["error1"])
     new_errors = [*state.errors, "error2"]
@@ -137,6 +157,20 @@ def test_classify_intent_success(mock_make_llm, settings):
     assert result["steps"] == 1
 
 
+@patch("gibsgraph.agent._make_llm")
+async def test_classify_intent_async_success(mock_make_llm, settings):
+    mock_structured = MagicMock()
+    mock_structured.ainvoke = AsyncMock(
+        return_value=IntentClassification(industry="fintech", goal="detect fraud")
+    )
+    mock_make_llm.return_value.with_structured_output.return_value = mock_structured
+
+    result = await classify_intent_async(AgentState(query="fraud in fintech"), settings=settings)
+    assert result["intent"].industry == "fintech"
+    assert result["usecase"] == "fintech/detect fraud"
+    assert result["steps"] == 1
+
+
 @patch("gibsgraph.agent._make_llm")
 def test_classify_intent_fallback_on_error(mock_make_llm, settings):
     """classify_intent gracefully handles LLM failures."""
@@ -217,3 +251,10 @@ def test_generate_explanation_uses_intent_context(mock_make_llm, settings):
     assert "GDPR" in call_args
     assert "customer psychology" in call_args
     assert result["explanation"] == "Answer with context."
+
+
+def test_compress_context_dedupes_and_trims():
+    context = "Apple -> Beats\n\nApple -> Beats\nApple -> Shazam\n\nApple -> NeXT"
+    assert _compress_context(context, 1000) == "Apple -> Beats\n\nApple -> Shazam\n\nApple -> NeXT"
+    assert _compress_context(context, 32) == "Apple -> Beats\n\nApple -> Shazam"
+    assert _compress_context("x" * 50, 10) == "x" * 10
@@ -0,0 +1,47 @@
+"""Unit tests for the gibsgraph CLI."""
+
+import subprocess
+import sys
+
+import pytest
+
+
+def test_cli_import_skips_heavy_modules():
+    """--help / --version must not pay for LangChain, LangGraph, Pydantic, structlog or rich."""
+    code = (
+        "import sys, gibsgraph.cli\n"
+        "heavy = ('langchain_core', 'langgraph', 'pydantic', 'structlog', 'neo4j', 'rich')\n"
+        "print(','.join(m for m in heavy if m in sys.modules))"
+    )
+    out = subprocess.run(
+        [sys.executable, "-c", code], capture_output=True, text=True, check=True
+    ).stdout.strip()
+    assert out == ""
+
+
+def test_parser_ask_joins_question_words():
+    from gibsgraph.cli import _build_parser
+
+    args = _build_parser().parse_args(["ask", "who", "owns", "Acme?", "--format", "json"])
+    assert args.command == "ask"
+    assert " ".join(args.question) == "who owns Acme?"
+    assert args.format == "json"
+    assert args.batch is None
+    assert args.max_concurrency is None
+
+
+def test_parser_ask_batch_max_concurrency():
+    from gibsgraph.cli import _build_parser
+
+    args = _build_parser().parse_args(["ask", "--batch", "q.txt", "--max-concurrency", "4"])
+    assert args.batch == "q.txt"
+    assert args.max_concurrency == 4
+
+
+def test_parser_version_exits_cleanly(capsys):
+    from gibsgraph.cli import _VERSION, _build_parser
+
+    with pytest.raises(SystemExit) as exc:
+        _build_parser().parse_args(["--version"])
+    assert exc.value.code == 0
+    assert _VERSION in capsys.readouterr().out
@@ -11,6 +11,7 @@ def test_settings_defaults():
     assert s.neo4j_username == "neo4j"
     assert s.neo4j_database == "neo4j"
     assert s.neo4j_read_only is True
+    assert s.neo4j_max_connection_pool_size == 100
     assert s.llm_model == "gpt-4o-mini"
     assert s.llm_temperature == 0.0
 
@@ -84,6 +85,12 @@ def test_provider_for_model_unknown():
     assert p is None
 
 
+def test_provider_for_model_is_cached():
+    provider_for_model.cache_clear()
+    assert provider_for_model("grok-3") is provider_for_model("grok-3")
+    assert provider_for_model.cache_info().hits == 1
+
+
 def test_providers_order():
     assert PROVIDERS[0].name == "openai"
     assert PROVIDERS[1].name == "anthropic"
@@ -116,3 +123,36 @@ def test_pcst_custom_values():
     assert s.pcst_enabled is True
     assert s.pcst_max_nodes == 50
     assert s.pcst_edge_cost == 0.25
+
+
+# --- LLM cache settings ---
+
+
+def test_llm_cache_defaults_off():
+    s = Settings(NEO4J_PASSWORD="test")
+    assert s.llm_cache == "none"
+
+
+def test_llm_cache_rejects_unknown_backend():
+    with pytest.raises(ValueError, match="LLM_CACHE"):
+        Settings(NEO4J_PASSWORD="test", LLM_CACHE="redis")
+
+
+# --- Logging ---
+
+
+def test_log_level_normalised():
+    assert Settings(NEO4J_PASSWORD="test").log_level is None
+    assert Settings(NEO4J_PASSWORD="test", GIBSGRAPH_LOG_LEVEL="warning").log_level == "WARNING"
+    assert Settings(NEO4J_PASSWORD="test", GIBSGRAPH_LOG_LEVEL="WARN").log_level == "WARNING"
+
+
+def test_log_level_ignores_unknown():
+    with pytest.warns(UserWarning, match="GIBSGRAPH_LOG_LEVEL"):
+        settings = Settings(NEO4J_PASSWORD="test", GIBSGRAPH_LOG_LEVEL="trace")
+    assert settings.log_level is None
+
+
+def test_log_level_ignores_unscoped_env(monkeypatch):
+    monkeypatch.setenv("LOG_LEVEL", "verbose")
+    assert Settings(NEO4J_PASSWORD="test").log_level is None
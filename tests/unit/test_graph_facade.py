@@ -32,6 +32,13 @@ def test_answer_defaults():
     assert a.errors == []
 
 
+def test_answer_is_frozen():
+    a = Answer(question="q", answer="a")
+    with pytest.raises(AttributeError):
+        a.answer = "b"  # type: ignore[misc]
+    assert not hasattr(a, "__dict__")
+
+
 # --- IngestResult dataclass ---
 
 
@@ -110,6 +117,20 @@ def test_resolve_llm_auto_no_keys():
                 os.environ.pop(key, None)
 
 
+@patch.dict("os.environ", {"OPENAI_API_KEY": "sk-test"}, clear=False)
+def test_resolve_llm_loads_dotenv_once():
+    from gibsgraph._graph import _load_dotenv_once
+
+    _load_dotenv_once.cache_clear()
+    try:
+        with patch("dotenv.load_dotenv") as mock_load:
+            _resolve_llm("auto")
+            _resolve_llm("auto")
+        mock_load.assert_called_once()
+    finally:
+        _load_dotenv_once.cache_clear()
+
+
 # --- Graph construction ---
 
 
@@ -181,6 +202,97 @@ def test_graph_ask_with_errors():
         assert result.nodes_retrieved == 0
 
 
+def _answering_agent(errors=None):
+    mock_agent = MagicMock()
+    mock_agent.ask.return_value = MagicMock(
+        explanation="An answer.",
+        cypher_used="MATCH (n) RETURN n",
+        errors=errors or [],
+        visualization_url="",
+        subgraph=None,
+    )
+    return mock_agent
+
+
+def test_graph_ask_caches_in_read_only_mode():
+    mock_agent = _answering_agent()
+
+    with patch.dict("os.environ", {"OPENAI_API_KEY": "sk-test"}, clear=False):
+        g = Graph("bolt://localhost:7687", password="testpw")
+        g._agent = mock_agent
+
+        first = g.ask("same question")
+        second = g.ask("same question")
+        assert mock_agent.ask.call_count == 1
+        assert second == first
+        assert second is not first
+        assert g.cache_info() == {"hits": 1, "misses": 1, "size": 1, "maxsize": 128}
+
+        g.clear_cache()
+        g.ask("same question")
+        assert mock_agent.ask.call_count == 2
+        assert g.cache_info()["hits"] == 0
+
+
+def test_graph_ask_many_keeps_order_and_uses_cache():
+    def _state(q):
+        return MagicMock(
+            explanation=f"answer to {q}",
+            cypher_used="",
+            errors=[],
+            visualization_url="",
+            subgraph=None,
+        )
+
+    mock_agent = MagicMock()
+    mock_agent.ask.side_effect = lambda q, **kw: _state(q)
+    mock_agent.ask_many.side_effect = lambda qs, **kw: [_state(q) for q in qs]
+
+    with patch.dict("os.environ", {"OPENAI_API_KEY": "sk-test"}, clear=False):
+        g = Graph("bolt://localhost:7687", password="testpw")
+        g._agent = mock_agent
+
+        g.ask("b")
+        answers = g.ask_many(["a", "b", "c", "a"])
+        assert [a.answer for a in answers] == [
+            "answer to a",
+            "answer to b",
+            "answer to c",
+            "answer to a",
+        ]
+        mock_agent.ask_many.assert_called_once_with(["a", "c"], max_concurrency=None)
+        assert g.cache_info()["hits"] == 1
+        assert g.ask_many([]) == []
+
+
+def test_graph_ask_does_not_cache_errors_or_writes():
+    with patch.dict("os.environ", {"OPENAI_API_KEY": "sk-test"}, clear=False):
+        g = Graph("bolt://localhost:7687", password="testpw")
+        g._agent = _answering_agent(errors=["timeout"])
+        g.ask("q")
+        g.ask("q")
+        assert g._agent.ask.call_count == 2
+
+        g = Graph("bolt://localhost:7687", password="testpw", read_only=False)
+        g._agent = _answering_agent()
+        g.ask("q")
+        g.ask("q")
+        assert g._agent.ask.call_count == 2
+        assert g.cache_info()["size"] == 0
+
+
+def test_to_mermaid_reuses_rendered_diagram():
+    subgraph = {"nodes": [{"id": "1", "name": "A"}], "edges": []}
+
+    with patch.dict("os.environ", {"OPENAI_API_KEY": "sk-test"}, clear=False):
+        g = Graph("bolt://localhost:7687", password="testpw")
+        first = g._to_mermaid(subgraph)
+        with patch.object(g._visualizer, "to_mermaid") as mock_render:
+            assert g._to_mermaid({"edges": [], "nodes": [{"name": "A", "id": "1"}]}) == first
+        mock_render.assert_not_called()
+        assert g._to_mermaid(None) == ""
+
+
 # --- Graph.visualize() and Graph.cypher() ---
 
 